@@ -0,0 +1,84 @@
+"""
+Audit log benchmark
+
+Appends signed tool-call records with one fsync per record (writing
+each record as it is signed) and with group commit, then compares an
+indexed query for one agent and tool against a full scan.
+
+Usage:
+    python benchmarks/bench_audit.py [--records 200000] [--threads 8]
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import threading
+import time
+
+from crewai_amorce.audit import AuditLog
+
+
+def record(i: int):
+    return (
+        "tool_call", f"agent_{i % 1000:04d}",
+        {"tool": f"tool_{i % 20}", "args": [i], "kwargs": {"limit": 5}},
+        {"signature": "s" * 88},
+        f"tool_{i % 20}",
+    )
+
+
+def fsync_each(path: str, n: int) -> float:
+    start = time.perf_counter()
+    with open(path, "ab") as f:
+        for i in range(n):
+            kind, agent_id, payload, proof, tool = record(i)
+            f.write(json.dumps({"kind": kind, "agent_id": agent_id, "payload": payload,
+                                "proof": proof, "tool": tool}).encode() + b"\n")
+            f.flush()
+            os.fsync(f.fileno())
+    return n / (time.perf_counter() - start)
+
+
+def group_commit(log: AuditLog, n: int, threads: int) -> float:
+    def worker(offset: int):
+        for i in range(offset, n, threads):
+            log.append(*record(i))
+
+    start = time.perf_counter()
+    workers = [threading.Thread(target=worker, args=(t,)) for t in range(threads)]
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+    log.commit()
+    return n / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=200_000)
+    parser.add_argument("--threads", type=int, default=8)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        sample = min(args.records, 2000)
+        print(f"fsync per record      {fsync_each(os.path.join(tmp, 'naive.log'), sample):12,.0f} records/s")
+
+        log = AuditLog(os.path.join(tmp, "audit"), segment_bytes=16 * 1024 * 1024)
+        print(f"group commit          {group_commit(log, args.records, args.threads):12,.0f} records/s")
+        stats = log.stats()
+        print(f"  {stats['commits']} fsyncs, {stats['mean_group']:.0f} records each, {stats['segments']} segments")
+
+        for label, kwargs in [
+            ("indexed agent+tool", {"agent_id": "agent_0042", "tool": "tool_2"}),
+            ("full scan (kind)", {"kind": "tool_call", "limit": None}),
+        ]:
+            start = time.perf_counter()
+            found = sum(1 for _ in log.query(**kwargs))
+            print(f"{label:<21} {(time.perf_counter() - start) * 1e3:10.1f} ms  ({found} records)")
+        log.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Canonical serialization benchmark
+
+Compares the previous signing serialization
+(`json.dumps(..., sort_keys=True)`) with `canonical_dumps` and the
+streaming `canonical_digest`, on a typical tool call and on one with
+large kwargs. Reports the median time per call and peak memory.
+
+Usage:
+    python benchmarks/bench_canonical.py [--runs 200]
+"""
+
+import argparse
+import hashlib
+import json
+import statistics
+import time
+import tracemalloc
+
+from crewai_amorce.canonical import canonical_digest, canonical_dumps
+
+
+PAYLOADS = {
+    "small call": {
+        "tool": "search_agents",
+        "args": ["travel booking"],
+        "kwargs": {"limit": 5},
+        "agent_id": "a" * 64,
+    },
+    "float kwargs": {
+        "tool": "quote",
+        "args": [],
+        "kwargs": {"prices": [i * 0.25 for i in range(500)], "margin": 0.3},
+        "agent_id": "a" * 64,
+    },
+    "large kwargs": {
+        "tool": "summarize",
+        "args": [],
+        "kwargs": {"document": "lorem ipsum " * 400_000, "rows": [{"id": i} for i in range(20_000)]},
+        "agent_id": "a" * 64,
+    },
+}
+
+CASES = {
+    "json.dumps sort_keys": lambda p: hashlib.sha256(json.dumps(p, sort_keys=True).encode()).digest(),
+    "canonical_dumps": lambda p: hashlib.sha256(canonical_dumps(p).encode()).digest(),
+    "canonical_digest": lambda p: canonical_digest(p),
+}
+
+
+def measure(fn, payload, runs: int):
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn(payload)
+        times.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    fn(payload)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return statistics.median(times), peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=200)
+    args = parser.parse_args()
+
+    for payload_name, payload in PAYLOADS.items():
+        runs = args.runs if payload_name != "large kwargs" else max(args.runs // 20, 3)
+        print(payload_name)
+        for name, fn in CASES.items():
+            median, peak = measure(fn, payload, runs)
+            print(f"  {name:<22} {median * 1e6:10.1f} us   peak {peak / 1024:10.1f} KiB")
+
+
+if __name__ == "__main__":
+    main()
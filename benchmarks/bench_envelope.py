@@ -0,0 +1,120 @@
+"""
+A2A envelope memory and throughput benchmark
+
+Compares the previous dataclass envelope (eager `from_dict`) with the
+slotted, lazily decoded `A2AEnvelope`: memory held by many decoded
+envelopes, decode throughput, and forwarding (decode then re-encode
+unchanged).
+
+Usage:
+    python benchmarks/bench_envelope.py [--count 100000]
+"""
+
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import Any
+
+from crewai_amorce.a2a import A2AEnvelope
+from crewai_amorce.keystore import LazyIdentity
+
+
+@dataclass
+class DataclassEnvelope:
+    """The envelope as it was before: a plain dataclass."""
+
+    sender_id: str
+    message: Any
+    signature: str
+    protocol_version: str = "a2a/1.0"
+    security_layer: str = "amorce/3.0"
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'DataclassEnvelope':
+        parsed = json.loads(data)
+        return cls(
+            sender_id=parsed['security']['sender_id'],
+            message=parsed['payload']['message'],
+            signature=parsed['security']['signature'],
+            protocol_version=parsed.get('protocol', 'a2a/1.0'),
+            security_layer=parsed['security'].get('layer', 'amorce/3.0'),
+        )
+
+    def to_bytes(self) -> bytes:
+        return json.dumps({
+            "protocol": self.protocol_version,
+            "security": {
+                "layer": self.security_layer,
+                "sender_id": self.sender_id,
+                "signature": self.signature,
+                "algorithm": "ed25519",
+            },
+            "payload": {"message": self.message},
+            "metadata": {"version": "1.0"},
+        }).encode('utf-8')
+
+
+def make_envelope() -> A2AEnvelope:
+    identity = LazyIdentity.from_seed(b"\x05" * 32)
+    return A2AEnvelope.create(identity, {
+        "offer_id": "off_123",
+        "price": 480.5,
+        "currency": "USD",
+        "items": [{"sku": "macbook-air-13", "qty": 1}],
+        "terms": "Net 30, delivery within 5 business days",
+    })
+
+
+def held_memory(decode, data: bytes, count: int) -> float:
+    """Bytes per envelope kept alive after decoding `count` copies."""
+    # Each envelope gets its own buffer, as if read from the network
+    buffers = [bytes(bytearray(data)) for _ in range(count)]
+    gc.collect()
+    tracemalloc.start()
+    envelopes = [decode(buf) for buf in buffers]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del envelopes
+    return current / count
+
+
+def throughput(fn, data: bytes, count: int) -> float:
+    start = time.perf_counter()
+    for _ in range(count):
+        fn(data)
+    return count / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=100_000)
+    args = parser.parse_args()
+
+    envelope = make_envelope()
+    json_data = envelope.to_bytes(format="json")
+    cases = {
+        "dataclass (json)": (DataclassEnvelope.from_bytes, json_data, "to_bytes"),
+        "slotted (json)": (A2AEnvelope.from_bytes, json_data, "json"),
+    }
+    try:
+        cases["slotted (msgpack)"] = (A2AEnvelope.from_bytes, envelope.to_bytes(), "msgpack")
+    except ImportError:
+        print("msgpack not installed; skipping the binary format")
+
+    print(f"{'case':<20} {'bytes/env':>10} {'decode/s':>12} {'forward/s':>12}")
+    for name, (decode, data, fmt) in cases.items():
+        if fmt == "to_bytes":
+            forward = lambda d: decode(d).to_bytes()
+        else:
+            forward = lambda d, fmt=fmt: decode(d).to_bytes(format=fmt)
+        per_envelope = held_memory(decode, data, args.count)
+        decodes = throughput(decode, data, args.count)
+        forwards = throughput(forward, data, args.count)
+        print(f"{name:<20} {per_envelope:10.0f} {decodes:12,.0f} {forwards:12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Import-time benchmark for crewai_amorce
+
+Runs each import in a fresh interpreter and reports the median wall
+time and which heavy dependencies were pulled in.
+
+Usage:
+    python benchmarks/bench_import.py [--runs 10]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+
+HEAVY = ("crewai", "amorce", "requests", "httpx", "cryptography")
+
+CASES = {
+    "import crewai_amorce": "import crewai_amorce",
+    "transport": "import crewai_amorce.transport",
+    "cache": "import crewai_amorce.cache",
+}
+
+SCRIPT = """
+import sys, time
+start = time.perf_counter()
+{stmt}
+elapsed = time.perf_counter() - start
+heavy = [m for m in {heavy!r} if m in sys.modules]
+print(elapsed, ",".join(heavy))
+"""
+
+
+def measure(stmt: str, runs: int):
+    times = []
+    heavy = ""
+    for _ in range(runs):
+        out = subprocess.run(
+            [sys.executable, "-c", SCRIPT.format(stmt=stmt, heavy=HEAVY)],
+            capture_output=True, text=True, check=True
+        ).stdout.split()
+        times.append(float(out[0]))
+        heavy = out[1] if len(out) > 1 else ""
+    return statistics.median(times), heavy
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    for name, stmt in CASES.items():
+        median, heavy = measure(stmt, args.runs)
+        print(f"{name:<24} {median * 1000:8.2f} ms   loads: {heavy or '-'}")
+
+
+if __name__ == "__main__":
+    main()
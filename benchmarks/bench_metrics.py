@@ -0,0 +1,49 @@
+"""
+Metrics overhead benchmark
+
+Times wrapped tool calls with metrics disabled (the default no-op
+sink) and enabled (in-process histograms), then prints the per-stage
+latencies collected.
+
+Usage:
+    python benchmarks/bench_metrics.py [--calls 20000]
+"""
+
+import argparse
+import time
+
+from crewai_amorce.keystore import LazyIdentity
+from crewai_amorce.metrics import TOOL_STAGE_SECONDS, Metrics, NullMetrics
+from crewai_amorce.tools import AmorceToolWrapper
+
+
+class EchoTool:
+    name = "echo"
+
+    def run(self, text):
+        return text
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=20000)
+    args = parser.parse_args()
+
+    identity = LazyIdentity.from_seed(b"\x0c" * 32)
+    metrics = Metrics()
+    for name, sink in (("disabled", NullMetrics()), ("enabled", metrics)):
+        wrapper = AmorceToolWrapper(tool=EchoTool(), identity=identity, client=None, metrics=sink)
+        wrapper.run("warmup")
+        start = time.perf_counter()
+        for i in range(args.calls):
+            wrapper.run("hello")
+        elapsed = time.perf_counter() - start
+        print(f"{name:<10} {elapsed / args.calls * 1e6:8.1f} µs/call")
+
+    print()
+    for series in metrics.snapshot()[TOOL_STAGE_SECONDS]:
+        print(f"{series['labels']['stage']:<10} mean {series['mean'] * 1e6:8.1f} µs  p99 <= {series['p99'] * 1e6:8.1f} µs")
+
+
+if __name__ == "__main__":
+    main()
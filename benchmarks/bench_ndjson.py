@@ -0,0 +1,79 @@
+"""
+NDJSON log throughput benchmark
+
+Writes tool-call records one `json.dumps` + `write` at a time (the
+previous way to export traffic) and with `NDJSONWriter`, then reads
+them back sequentially and with `map_chunks` across processes.
+
+Usage:
+    python benchmarks/bench_ndjson.py [--records 500000] [--workers 4]
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+
+from crewai_amorce.ndjson import NDJSONWriter, map_chunks, read_records
+
+
+def record(i: int) -> dict:
+    return {
+        "tool": "search_agents",
+        "args": ["travel booking"],
+        "kwargs": {"limit": 5, "page": i % 10},
+        "agent_id": "a" * 64,
+        "signature": "s" * 88,
+        "i": i,
+    }
+
+
+def count(chunk) -> int:
+    return sum(1 for _ in chunk)
+
+
+def timed(label: str, records: int, fn):
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<28} {records / elapsed:12,.0f} records/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=500_000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    args = parser.parse_args()
+    n = args.records
+
+    with tempfile.TemporaryDirectory() as tmp:
+        plain = os.path.join(tmp, "calls.ndjson")
+        gz = os.path.join(tmp, "calls.ndjson.gz")
+
+        def one_at_a_time():
+            with open(os.path.join(tmp, "naive.ndjson"), "w", buffering=1) as f:
+                for i in range(n):
+                    f.write(json.dumps(record(i)) + "\n")
+
+        def write(path, **kwargs):
+            with NDJSONWriter(path, **kwargs) as writer:
+                writer.write_many(record(i) for i in range(n))
+
+        print("write")
+        timed("line-buffered json.dumps", n, one_at_a_time)
+        timed("NDJSONWriter", n, lambda: write(plain))
+        timed("NDJSONWriter gzip level 1", n, lambda: write(gz, level=1))
+        print(f"  size {os.path.getsize(plain) / 1e6:.1f} MB plain, {os.path.getsize(gz) / 1e6:.1f} MB gzip")
+
+        print("read")
+        timed("read_records", n, lambda: sum(1 for _ in read_records(plain)))
+        timed("read_records gzip", n, lambda: sum(1 for _ in read_records(gz)))
+        timed(
+            f"map_chunks x{args.workers}", n,
+            lambda: sum(map_chunks(plain, count, workers=args.workers, chunk_size=8 * 1024 * 1024))
+        )
+
+
+if __name__ == "__main__":
+    main()
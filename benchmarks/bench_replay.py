@@ -0,0 +1,58 @@
+"""
+Replay guard microbenchmark
+
+Measures checks per second for fresh and replayed message IDs, and
+compares the guard's memory with an unbounded set of seen signatures.
+
+Usage:
+    python benchmarks/bench_replay.py [--messages 200000]
+"""
+
+import argparse
+import base64
+import os
+import sys
+import time
+
+from crewai_amorce.replay import ReplayGuard
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=200_000)
+    parser.add_argument("--max-bytes", type=int, default=1024 * 1024)
+    args = parser.parse_args()
+
+    # Realistic IDs: agent ID + Base64 Ed25519 signature
+    ids = [
+        "a" * 64 + ":" + base64.b64encode(os.urandom(64)).decode("ascii")
+        for _ in range(args.messages)
+    ]
+    guard = ReplayGuard(max_bytes=args.max_bytes)
+    now = time.time()
+
+    start = time.perf_counter()
+    for message_id in ids:
+        guard.accept(message_id, now)
+    fresh = time.perf_counter() - start
+
+    replayed = ids[-10_000:]
+    start = time.perf_counter()
+    for message_id in replayed:
+        guard.accept(message_id, now)
+    replay = time.perf_counter() - start
+
+    seen = set(ids)
+    naive_bytes = sys.getsizeof(seen) + sum(sys.getsizeof(i) for i in seen)
+
+    stats = guard.stats()
+    print(f"fresh checks      {len(ids) / fresh:12.0f} /s")
+    print(f"replayed checks   {len(replayed) / replay:12.0f} /s")
+    print(f"bloom memory      {stats['bloom_bytes'] / 1024:12.1f} KiB (capacity {stats['capacity']}/generation)")
+    print(f"unbounded set     {naive_bytes / 1024:12.1f} KiB")
+    print(f"est. FP rate      {stats['false_positive_rate']:12.2e}")
+    print(f"early rotations   {stats['early_rotations']:12d}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Tool fan-out benchmark
+
+Runs N calls of a tool with simulated I/O latency one after another
+(`run` in a loop) and with `run_many` / `arun_many`.
+
+Usage:
+    python benchmarks/bench_run_many.py [--calls 32] [--latency 0.1]
+"""
+
+import argparse
+import asyncio
+import time
+
+from crewai_amorce.keystore import LazyIdentity
+from crewai_amorce.tools import AmorceToolWrapper
+
+
+class LatencyTool:
+    name = "web_search"
+
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    def run(self, query):
+        time.sleep(self.latency)
+        return f"results for {query}"
+
+    async def arun(self, query):
+        await asyncio.sleep(self.latency)
+        return f"results for {query}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=32)
+    parser.add_argument("--latency", type=float, default=0.1)
+    parser.add_argument("--max-concurrency", type=int, default=16)
+    args = parser.parse_args()
+
+    identity = LazyIdentity.from_seed(b"\x0a" * 32)
+    wrapper = AmorceToolWrapper(
+        tool=LatencyTool(args.latency), identity=identity, client=None,
+        max_concurrency=args.max_concurrency
+    )
+    queries = [f"query {i}" for i in range(args.calls)]
+
+    cases = {
+        "sequential run": lambda: [wrapper.run(q) for q in queries],
+        "run_many": lambda: wrapper.run_many(queries),
+        "arun_many": lambda: asyncio.run(wrapper.arun_many(queries)),
+    }
+    for name, fn in cases.items():
+        start = time.perf_counter()
+        fn()
+        print(f"{name:<16} {time.perf_counter() - start:8.2f} s")
+
+
+if __name__ == "__main__":
+    main()
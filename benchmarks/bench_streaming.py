@@ -0,0 +1,76 @@
+"""
+Streaming tool result benchmark
+
+A tool produces a large document in 64 KiB pieces. `run` receives the
+whole document before returning; `stream` passes the pieces through
+and signs a trailer at the end. Reports time to first chunk, total
+time and peak memory.
+
+Usage:
+    python benchmarks/bench_streaming.py [--mib 64]
+"""
+
+import argparse
+import time
+import tracemalloc
+
+from crewai_amorce.keystore import LazyIdentity
+from crewai_amorce.tools import AmorceToolWrapper
+
+
+PIECE = "x" * (64 * 1024 - 1) + "\n"
+
+
+class DocumentTool:
+    name = "export_document"
+
+    def __init__(self, pieces: int):
+        self.pieces = pieces
+
+    def stream(self):
+        for _ in range(self.pieces):
+            yield PIECE
+
+    def run(self):
+        return "".join(self.stream())
+
+
+def measure(fn):
+    tracemalloc.start()
+    start = time.perf_counter()
+    first = fn()
+    total = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return first - start, total, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--mib", type=int, default=64)
+    args = parser.parse_args()
+
+    identity = LazyIdentity.from_seed(b"\x0c" * 32)
+    identity.sign("warm up")
+    wrapper = AmorceToolWrapper(tool=DocumentTool(args.mib * 16), identity=identity, client=None)
+
+    def buffered():
+        output = wrapper.run()
+        first = time.perf_counter()
+        len(output["result"])
+        return first
+
+    def streamed():
+        first = None
+        for _ in wrapper.stream():
+            if first is None:
+                first = time.perf_counter()
+        return first
+
+    for name, fn in [("run (buffered)", buffered), ("stream", streamed)]:
+        ttfc, total, peak = measure(fn)
+        print(f"{name:<16} first chunk {ttfc * 1e3:9.2f} ms   total {total * 1e3:9.1f} ms   peak {peak / 2**20:8.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,15 +3,23 @@ CrewAI-Amorce Integration
 
 Secure CrewAI crews with Ed25519 signatures and HITL approvals.
 Now with agent discovery via Amorce ANS!
+
+Submodules are imported on first attribute access, so
+`import crewai_amorce` stays cheap for processes that never touch
+`crewai` or the network stack.
 """
 
-from crewai_amorce.decorators import secure_crew
-from crewai_amorce.agent import SecureAgent
-from crewai_amorce.discovery import (
-    SearchAgentsTool,
-    GetAgentTool,
-    get_discovery_tools,
-)
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from crewai_amorce.decorators import secure_crew
+    from crewai_amorce.agent import SecureAgent
+    from crewai_amorce.discovery import (
+        SearchAgentsTool,
+        GetAgentTool,
+        get_discovery_tools,
+    )
 
 __version__ = "0.2.0"
 __all__ = [
@@ -21,3 +29,27 @@ __all__ = [
     "GetAgentTool",
     "get_discovery_tools",
 ]
+
+# Public name -> defining submodule
+_LAZY_ATTRS = {
+    "secure_crew": "crewai_amorce.decorators",
+    "SecureAgent": "crewai_amorce.agent",
+    "SearchAgentsTool": "crewai_amorce.discovery",
+    "GetAgentTool": "crewai_amorce.discovery",
+    "get_discovery_tools": "crewai_amorce.discovery",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module), name)
+    # Cache so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,46 +1,312 @@
 """
 A2A Protocol compatibility layer for CrewAI
+
+Envelopes travel as A2A JSON, as compact JSON, or in a versioned
+binary framing with a MessagePack body:
+
+    magic "A2AB" | version u8 | body codec u8
+    sender_id    u16 length + UTF-8
+    signature    u8 length + raw Ed25519 bytes (not Base64)
+    timestamp    u8 length + ASCII (0 = none)
+    protocol     u8 length + ASCII
+    layer        u8 length + ASCII
+    body         rest of the buffer, the encoded message
 """
 
+import base64
 import json
-from dataclasses import dataclass
-from typing import Dict, Any
+import struct
+from typing import Dict, Any, Optional, Union
 from datetime import datetime
 
 
-@dataclass
+WIRE_MAGIC = b"A2AB"
+WIRE_VERSION = 1
+
+# Body codecs of the binary framing
+CODEC_MSGPACK = 1
+
+_HEADER = struct.Struct("<4sBB")
+_U8 = struct.Struct("<B")
+_U16 = struct.Struct("<H")
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+
+def _msgpack():
+    try:
+        import msgpack
+    except ImportError:
+        raise ImportError(
+            "msgpack is required for binary A2A envelopes. "
+            "Install with: pip install msgpack"
+        )
+    return msgpack
+
+
+def _read_field(view: memoryview, offset: int, prefix: struct.Struct):
+    (length,) = prefix.unpack_from(view, offset)
+    start = offset + prefix.size
+    end = start + length
+    if end > len(view):
+        raise ValueError("Truncated A2A envelope")
+    return view[start:end], end
+
+
+# Message not decoded yet
+_PENDING = object()
+
+
 class A2AEnvelope:
-    """A2A-compatible message envelope with Amorce signatures."""
+    """
+    A2A-compatible message envelope with Amorce signatures.
+    
+    Slotted to keep per-envelope overhead low. Envelopes decoded with
+    `from_bytes` keep a view of the original buffer: the message is
+    only decoded when `.message` is first read, and re-encoding an
+    unchanged envelope in its original format returns the original
+    bytes. Assigning any field drops the cached encoding (changes made
+    inside a decoded message in place are not tracked).
+    """
+    
+    __slots__ = (
+        'sender_id', 'signature', 'protocol_version', 'security_layer',
+        'timestamp', '_message', '_body', '_encoded', '_stamp'
+    )
+    
+    def __init__(
+        self,
+        sender_id: str,
+        message: Any,
+        signature: str,
+        protocol_version: str = "a2a/1.0",
+        security_layer: str = "amorce/3.0",
+        timestamp: Optional[str] = None
+    ):
+        init = object.__setattr__
+        init(self, 'sender_id', sender_id)
+        init(self, 'signature', signature)
+        init(self, 'protocol_version', protocol_version)
+        init(self, 'security_layer', security_layer)
+        init(self, 'timestamp', timestamp)
+        init(self, '_message', message)
+        init(self, '_body', None)
+        init(self, '_encoded', None)
+        init(self, '_stamp', None)
+    
+    def __setattr__(self, name: str, value: Any):
+        object.__setattr__(self, name, value)
+        if name[0] != '_':
+            # Field changed: cached wire bytes are stale
+            object.__setattr__(self, '_encoded', None)
+    
+    @property
+    def message(self) -> Any:
+        """The message, decoded from the wire buffer on first access."""
+        if self._message is _PENDING:
+            object.__setattr__(self, '_message', _msgpack().unpackb(self._body, raw=False))
+            object.__setattr__(self, '_body', None)
+        return self._message
     
-    sender_id: str
-    message: Any
-    signature: str
-    protocol_version: str = "a2a/1.0"
-    security_layer: str = "amorce/3.0"
+    @message.setter
+    def message(self, value: Any):
+        object.__setattr__(self, '_message', value)
+        object.__setattr__(self, '_body', None)
+        object.__setattr__(self, '_encoded', None)
+    
+    def _fields(self):
+        return (
+            self.sender_id, self.message, self.signature,
+            self.protocol_version, self.security_layer, self.timestamp
+        )
+    
+    def __eq__(self, other: Any) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._fields() == other._fields()
+    
+    __hash__ = None
+    
+    def __repr__(self) -> str:
+        message = '<not decoded>' if self._message is _PENDING else repr(self._message)
+        return (
+            f"A2AEnvelope(sender_id={self.sender_id!r}, message={message}, "
+            f"signature={self.signature!r}, timestamp={self.timestamp!r})"
+        )
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to A2A message format."""
+        security = {
+            "layer": self.security_layer,
+            "sender_id": self.sender_id,
+            "signature": self.signature,
+            "algorithm": "ed25519"
+        }
+        if self.timestamp is not None:
+            # Signed timestamp (metadata.timestamp is informational)
+            security["timestamp"] = self.timestamp
+        
         return {
             "protocol": self.protocol_version,
-            "security": {
-                "layer": self.security_layer,
-                "sender_id": self.sender_id,
-                "signature": self.signature,
-                "algorithm": "ed25519"
-            },
+            "security": security,
             "payload": {
                 "message": self.message
             },
             "metadata": {
-                "timestamp": datetime.utcnow().isoformat() + "Z",
+                "timestamp": self.timestamp or self._stamped_at(),
                 "version": "1.0"
             }
         }
     
-   def to_json(self) -> str:
-        """Convert to JSON string."""
+    def _stamped_at(self) -> str:
+        """Informational send time, formatted once per envelope."""
+        if self._stamp is None:
+            object.__setattr__(self, '_stamp', datetime.utcnow().isoformat() + "Z")
+        return self._stamp
+    
+    def to_json(self, compact: bool = False) -> str:
+        """
+        Convert to JSON string.
+        
+        Args:
+            compact: No indentation or spaces (for the wire)
+        """
+        if compact:
+            return json.dumps(self.to_dict(), separators=(',', ':'), ensure_ascii=False)
         return json.dumps(self.to_dict(), indent=2)
     
+    def to_bytes(self, format: str = "msgpack") -> bytes:
+        """
+        Encode for the wire.
+        
+        Args:
+            format: "msgpack" (binary framing, raw signature bytes) or
+                "json" (single-line UTF-8 JSON; compact unless
+                forwarding single-line bytes from `from_bytes` as-is)
+        
+        Returns:
+            Encoded envelope, readable by `from_bytes`
+        """
+        encoded = self._encoded
+        if encoded is not None and encoded[0] == format:
+            if not isinstance(encoded[1], bytes):
+                # Decoded from a borrowed buffer: copy once, on first forward
+                encoded = (format, bytes(encoded[1]))
+                object.__setattr__(self, '_encoded', encoded)
+            return encoded[1]
+        
+        if format == "json":
+            data = self.to_json(compact=True).encode('utf-8')
+        elif format == "msgpack":
+            data = self._pack()
+        else:
+            raise ValueError(f"Unknown A2A wire format: {format!r}")
+        
+        object.__setattr__(self, '_encoded', (format, data))
+        return data
+    
+    def _pack(self) -> bytes:
+        if self._message is _PENDING:
+            # Unchanged body: reuse the encoded message as is
+            body = self._body
+        else:
+            body = _msgpack().packb(self._message, use_bin_type=True)
+        signature = base64.b64decode(self.signature, validate=True)
+        sender = self.sender_id.encode('utf-8')
+        timestamp = (self.timestamp or '').encode('ascii')
+        protocol = self.protocol_version.encode('ascii')
+        layer = self.security_layer.encode('ascii')
+        
+        return b''.join((
+            _HEADER.pack(WIRE_MAGIC, WIRE_VERSION, CODEC_MSGPACK),
+            _U16.pack(len(sender)), sender,
+            _U8.pack(len(signature)), signature,
+            _U8.pack(len(timestamp)), timestamp,
+            _U8.pack(len(protocol)), protocol,
+            _U8.pack(len(layer)), layer,
+            body,
+        ))
+    
+    @classmethod
+    def from_bytes(cls, data: Buffer) -> 'A2AEnvelope':
+        """
+        Decode an envelope produced by `to_bytes` (either format).
+        
+        Binary envelopes are read in place: the header is unpacked
+        from the buffer and the body stays a memoryview slice of it,
+        decoded by MessagePack only when `.message` is read. The
+        envelope keeps `data` alive until then.
+        
+        Raises:
+            ValueError: Malformed or unsupported envelope
+        """
+        view = memoryview(data)
+        if view[:len(WIRE_MAGIC)] != WIRE_MAGIC:
+            text = str(view, 'utf-8')
+            try:
+                envelope = cls.from_dict(json.loads(text))
+            except (KeyError, TypeError) as e:
+                raise ValueError(f"Malformed A2A envelope: missing or invalid {e}")
+            if '\n' not in text and '\r' not in text:
+                # Single-line input is reused verbatim; pretty-printed JSON is re-encoded
+                object.__setattr__(envelope, '_encoded', ("json", data))
+            return envelope
+        
+        try:
+            _, version, codec = _HEADER.unpack_from(view, 0)
+        except struct.error:
+            raise ValueError("Truncated A2A envelope")
+        if version != WIRE_VERSION:
+            raise ValueError(f"Unsupported A2A wire version: {version}")
+        if codec != CODEC_MSGPACK:
+            raise ValueError(f"Unsupported A2A body codec: {codec}")
+        
+        try:
+            sender, offset = _read_field(view, _HEADER.size, _U16)
+            signature, offset = _read_field(view, offset, _U8)
+            timestamp, offset = _read_field(view, offset, _U8)
+            protocol, offset = _read_field(view, offset, _U8)
+            layer, offset = _read_field(view, offset, _U8)
+        except struct.error:
+            raise ValueError("Truncated A2A envelope")
+        
+        envelope = cls(
+            sender_id=str(sender, 'utf-8'),
+            message=_PENDING,
+            signature=base64.b64encode(signature).decode('ascii'),
+            protocol_version=str(protocol, 'ascii'),
+            security_layer=str(layer, 'ascii'),
+            timestamp=str(timestamp, 'ascii') or None
+        )
+        object.__setattr__(envelope, '_body', view[offset:])
+        object.__setattr__(envelope, '_encoded', ("msgpack", data))
+        return envelope
+    
+    def signed_payload(self) -> str:
+        """
+        Canonical JSON covered by the signature.
+        
+        Timestamped envelopes sign the message together with the
+        timestamp, so replay checks can trust it; untimestamped ones
+        sign the message alone.
+        """
+        from crewai_amorce.canonical import canonical_dumps
+        if self.timestamp is None:
+            return canonical_dumps(self.message)
+        return canonical_dumps({'message': self.message, 'timestamp': self.timestamp})
+    
+    @classmethod
+    def create(cls, identity: Any, message: Any, timestamp: Optional[str] = None) -> 'A2AEnvelope':
+        """Timestamp and sign `message` with an Amorce identity."""
+        envelope = cls(
+            sender_id=identity.agent_id,
+            message=message,
+            signature='',
+            timestamp=timestamp or datetime.utcnow().isoformat() + "Z"
+        )
+        envelope.signature = identity.sign(envelope.signed_payload())
+        return envelope
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'A2AEnvelope':
         """Parse A2A message with Amorce signature."""
@@ -49,5 +315,6 @@ class A2AEnvelope:
             message=data['payload']['message'],
             signature=data['security']['signature'],
             protocol_version=data.get('protocol', 'a2a/1.0'),
-            security_layer=data['security'].get('layer', 'amorce/3.0')
+            security_layer=data['security'].get('layer', 'amorce/3.0'),
+            timestamp=data['security'].get('timestamp')
         )
@@ -41,6 +41,12 @@ class SecureAgent(Agent):
         hitl_required: Optional[List[str]] = None,
         a2a_compatible: bool = True,
         verbose: bool = False,
+        keystore: Optional[Any] = None,
+        batch_signing: bool = False,
+        inbox: Optional[Any] = None,
+        audit_log: Optional[Any] = None,
+        cacheable_tools: Optional[List[str]] = None,
+        metrics: Optional[Any] = None,
         **kwargs
     ):
         """
@@ -55,6 +61,18 @@ class SecureAgent(Agent):
             hitl_required: Tool names requiring human approval
             a2a_compatible: Use A2A message format
             verbose: Show agent reasoning
+            keystore: Keystore to load a stable identity from by role
+                (used when identity is None)
+            batch_signing: Sign tool calls, offers and receipts in
+                Merkle batches (see crewai_amorce.batch_signing)
+            inbox: OfferInbox that `receive_offer` reads from
+            audit_log: AuditLog recording signed tool calls, offers
+                and receipts (see crewai_amorce.audit)
+            cacheable_tools: Names of idempotent tools whose signed
+                results may be memoized (in addition to tools marked
+                `cacheable`)
+            metrics: MetricsSink for per-stage tool call latencies
+                (see crewai_amorce.metrics; the process default if None)
             **kwargs: Additional CrewAI Agent arguments
         """
         # Initialize parent Agent
@@ -68,18 +86,26 @@ class SecureAgent(Agent):
         )
         
         # Amorce integration
-        from amorce import IdentityManager, AmorceClient
+        from amorce import IdentityManager
+        from crewai_amorce.registry import get_client
         
+        if identity is None and keystore is not None:
+            identity = keystore.identity(role)
         self.identity = identity or IdentityManager.generate()
-        self.amorce_client = AmorceClient(
-            self.identity,
-            directory_url='https://directory.amorce.io',
-            orchestrator_url='https://api.amorce.io'
-        )
+        self.amorce_client = get_client(self.identity)
         
         self.hitl_required = hitl_required or []
+        self.cacheable_tools = cacheable_tools or []
         self.a2a_compatible = a2a_compatible
         self.agent_id = self.identity.agent_id
+        self.inbox = inbox
+        self.audit_log = audit_log
+        self.metrics = metrics
+        
+        self.batch_signer = None
+        if batch_signing:
+            from crewai_amorce.batch_signing import BatchSigner
+            self.batch_signer = BatchSigner(self.identity)
         
         # Wrap tools with Amorce security
         self.tools = [self._wrap_tool(tool) for tool in (tools or [])]
@@ -96,9 +122,25 @@ class SecureAgent(Agent):
             tool=tool,
             identity=self.identity,
             client=self.amorce_client,
-            requires_hitl=(tool.name in self.hitl_required)
+            requires_hitl=(tool.name in self.hitl_required),
+            cacheable=(True if tool.name in self.cacheable_tools else None),
+            batch_signer=self.batch_signer,
+            audit_log=self.audit_log,
+            metrics=self.metrics
         )
     
+    def _sign(self, payload: dict, kind: str) -> dict:
+        """Sign (and audit) a payload; returns the signature or batch proof fields."""
+        if self.batch_signer is not None:
+            proof = self.batch_signer.sign(payload)
+        else:
+            from crewai_amorce.canonical import sign_canonical
+            proof = {'signature': sign_canonical(self.identity, payload)}
+        
+        if self.audit_log is not None:
+            self.audit_log.append(kind, self.agent_id, payload, proof=proof)
+        return proof
+    
     def check_buyer_reputation(self, buyer_id: str) -> dict:
         """
         Check buyer's reputation in Trust Directory.
@@ -112,15 +154,36 @@ class SecureAgent(Agent):
         # Query Trust Directory
         return self.amorce_client.get_agent_reputation(buyer_id)
     
-    def receive_offer(self) -> dict:
+    def receive_offer(self, timeout: Optional[float] = None) -> Optional[dict]:
         """
         Receive and verify incoming offer.
         
+        Blocks until the inbox has a verified offer. The inbox is
+        started on a background loop on first use.
+        
+        Args:
+            timeout: Seconds to wait (forever if None)
+        
         Returns:
-            Verified offer with sender information
+            Verified offer with sender information, or None once the
+            inbox is closed and drained
+        
+        Raises:
+            TimeoutError: No offer within `timeout`
         """
-        # Implementation for receiving signed offers
-        pass
+        if self.inbox is None:
+            raise RuntimeError("No offer inbox attached (pass inbox=OfferInbox(...))")
+        if self.inbox.loop is None:
+            self.inbox.run_in_background()
+        return self.inbox.get_sync(timeout)
+    
+    async def areceive_offer(self, timeout: Optional[float] = None) -> Optional[dict]:
+        """Async version of `receive_offer` (starts the inbox on this loop)."""
+        if self.inbox is None:
+            raise RuntimeError("No offer inbox attached (pass inbox=OfferInbox(...))")
+        if self.inbox.loop is None:
+            await self.inbox.start()
+        return await self.inbox.get(timeout)
     
     def counter_offer(self, price: float, reasoning: str = "") -> dict:
         """
@@ -133,20 +196,19 @@ class SecureAgent(Agent):
         Returns:
             Signed counter-offer
         """
-        import json
+        from datetime import datetime
         
         offer_data = {
             'agent_id': self.agent_id,
             'price': price,
             'reasoning': reasoning,
-            'role': self.role
+            'role': self.role,
+            'timestamp': datetime.utcnow().isoformat() + 'Z'
         }
         
-        signature = self.identity.sign(json.dumps(offer_data, sort_keys=True))
-        
         return {
             **offer_data,
-            'signature': signature
+            **self._sign(offer_data, 'counter_offer')
         }
     
     def calculate_margin(self, offer_price: float) -> float:
@@ -156,32 +218,27 @@ class SecureAgent(Agent):
     
     def request_human_approval_for_sale(self):
         """Request human approval for sale."""
-        approval_id = self.amorce_client.request_approval(
+        from crewai_amorce.approvals import get_tracker
+        
+        tracker = get_tracker(self.amorce_client)
+        approval_id = tracker.request(
             summary=f"{self.role}: Approve sale",
             details={'agent_id': self.agent_id, 'role': self.role},
             timeout_seconds=300
         )
         
-        # Poll for approval
-        import time
-        max_wait = 300
-        start_time = time.time()
+        # Wait for approval (shared tracker, pushed decision or backoff polling)
+        try:
+            tracker.wait(approval_id, timeout=300)
+        except PermissionError:
+            raise PermissionError("Sale approval denied")
+        except TimeoutError:
+            raise TimeoutError("Sale approval timeout")
         
-        while time.time() - start_time < max_wait:
-            status = self.amorce_client.check_approval(approval_id)
-            
-            if status['status'] == 'approved':
-                return True
-            elif status['status'] in ['rejected', 'expired']:
-                raise PermissionError("Sale approval denied")
-            
-            time.sleep(1)
-        
-        raise TimeoutError("Sale approval timeout")
+        return True
     
     def generate_signed_receipt(self) -> dict:
         """Generate cryptographically signed receipt."""
-        import json
         from datetime import datetime
         
         receipt = {
@@ -191,9 +248,7 @@ class SecureAgent(Agent):
             'verified_by_amorce': True
         }
         
-        signature = self.identity.sign(json.dumps(receipt, sort_keys=True))
-        
         return {
             **receipt,
-            'signature': signature
+            **self._sign(receipt, 'receipt')
         }
@@ -0,0 +1,483 @@
+"""
+HITL approval waiting
+
+Waits for human approval decisions without 1-second busy polling:
+decisions pushed by a webhook resolve waiters immediately, and
+otherwise one background thread per client polls the orchestrator
+with jittered exponential backoff.
+"""
+
+import asyncio
+import math
+import random
+import threading
+import time
+import weakref
+from collections import OrderedDict, deque
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Optional, Any, Dict, List, Tuple
+
+
+FINAL_STATUSES = ('approved', 'rejected', 'expired')
+
+# Pushed by cancel(); never returned by the orchestrator
+CANCELLED = 'cancelled'
+
+# Set by ApprovalTracker when a tracked approval passes its deadline
+_TIMED_OUT = '_timed_out'
+
+
+def _latency_summary(latencies: List[float]) -> Dict[str, float]:
+    """Mean, p50, p95 and max of a list of durations."""
+    latencies = sorted(latencies)
+    if not latencies:
+        return {'mean': 0.0, 'p50': 0.0, 'p95': 0.0, 'max': 0.0}
+
+    def pct(p):
+        return latencies[min(int(p * len(latencies)), len(latencies) - 1)]
+
+    return {
+        'mean': sum(latencies) / len(latencies),
+        'p50': pct(0.5),
+        'p95': pct(0.95),
+        'max': latencies[-1],
+    }
+
+
+class _Pending:
+    """Bookkeeping for one tracked approval."""
+
+    __slots__ = ('approval_id', 'future', 'tracked_at', 'next_check', 'delay', 'deadline', 'waiters')
+
+    def __init__(self, approval_id: str, delay: float, timeout: Optional[float] = None):
+        self.approval_id = approval_id
+        self.future: Future = Future()
+        self.tracked_at = time.monotonic()
+        self.next_check = self.tracked_at + delay
+        self.delay = delay
+        self.deadline = self.tracked_at + timeout if timeout is not None else math.inf
+        # Blocked wait() / await_decision() calls
+        self.waiters = 0
+
+
+class ApprovalTracker:
+    """
+    One background poller for every pending approval on a client.
+
+    Waiters get a future per approval. A single daemon thread checks due
+    approvals with per-approval exponential backoff, under a fixed budget
+    of `max_checks_per_tick` requests per tick, so the orchestrator load
+    is bounded whether 1 or 500 approvals are pending. If the client
+    offers a batch endpoint (`check_approvals(ids) -> {id: status}`), up
+    to `batch_size` approvals are resolved per request.
+
+    Example:
+        ```python
+        from crewai_amorce.approvals import get_tracker
+
+        tracker = get_tracker(client)
+        approval_id = tracker.request("Approve refund", details)
+        status = tracker.wait(approval_id, timeout=300)
+
+        print(tracker.stats()['pending'])
+        ```
+    """
+
+    WAIT_BUCKETS = (0.5, 1.0, 2.0, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, math.inf)
+
+    # Resolved futures kept so late waiters still see the decision
+    MAX_RESOLVED = 1024
+
+    # Early pushed decisions held for approvals not tracked yet
+    MAX_PUSHED = 1024
+
+    # Recent request-to-decision latencies kept for stats()
+    MAX_LATENCIES = 4096
+
+    def __init__(
+        self,
+        client: Any,
+        tick: float = 0.25,
+        max_checks_per_tick: int = 5,
+        batch_size: int = 100,
+        initial_interval: float = 0.25,
+        max_interval: float = 5.0,
+        multiplier: float = 2.0
+    ):
+        """
+        Initialize tracker (the thread starts on first `track()`).
+
+        Args:
+            client: Amorce client (request_approval / check_approval)
+            tick: Seconds between polling rounds
+            max_checks_per_tick: Status requests allowed per round
+            batch_size: Approvals per request with a batch endpoint
+            initial_interval: First per-approval polling delay
+            max_interval: Per-approval polling delay ceiling
+            multiplier: Per-approval backoff growth factor
+        """
+        self._client = client
+        self._client_ref: Optional["weakref.ref[Any]"] = None
+        self.tick = tick
+        self.max_checks_per_tick = max_checks_per_tick
+        self.batch_size = batch_size
+        self.initial_interval = initial_interval
+        self.max_interval = max_interval
+        self.multiplier = multiplier
+
+        self.checks = 0
+        self.errors = 0
+        self.latencies: deque = deque(maxlen=self.MAX_LATENCIES)
+        self.wait_histogram = [0] * len(self.WAIT_BUCKETS)
+
+        self._cond = threading.Condition()
+        self._pending: Dict[str, _Pending] = {}
+        self._resolved: "OrderedDict[str, Future]" = OrderedDict()
+        self._order: deque = deque()
+        self._pushed: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._requested_at: Dict[str, float] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+    @property
+    def client(self) -> Any:
+        """The Amorce client polled by this tracker."""
+        if self._client_ref is None:
+            return self._client
+        client = self._client_ref()
+        if client is None:
+            raise RuntimeError("Approval client has been garbage collected")
+        return client
+
+    def _hold_weakly(self):
+        """Reference the client weakly (for the shared per-client registry)."""
+        self._client_ref = weakref.ref(self._client)
+        self._client = None
+
+    def request(
+        self,
+        summary: str,
+        details: Any = None,
+        timeout_seconds: int = 300,
+        timeout: Optional[float] = None
+    ) -> str:
+        """
+        Request approval and start tracking it.
+
+        Args:
+            summary: Human-readable summary
+            details: Structured details for the approver
+            timeout_seconds: Orchestrator-side approval expiry
+            timeout: Local deadline for the tracked future (see `track`)
+
+        Returns:
+            approval_id
+        """
+        requested_at = time.monotonic()
+        approval_id = self.client.request_approval(
+            summary=summary,
+            details=details,
+            timeout_seconds=timeout_seconds
+        )
+        with self._cond:
+            self._requested_at[approval_id] = requested_at
+        self.track(approval_id, timeout=timeout)
+        return approval_id
+
+    def track(self, approval_id: str, timeout: Optional[float] = None) -> Future:
+        """
+        Get the future for an approval, tracking it if new.
+
+        The future resolves to the final status dict, or fails with
+        PermissionError (rejected/expired), InterruptedError (cancelled)
+        or, if `timeout` is given, TimeoutError once it elapses. A
+        timeout given for an approval already tracked can only bring
+        its deadline forward.
+        """
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("ApprovalTracker is closed")
+
+            pending = self._pending.get(approval_id)
+            if pending is not None:
+                if timeout is not None:
+                    pending.deadline = min(pending.deadline, time.monotonic() + timeout)
+                return pending.future
+            resolved = self._resolved.get(approval_id)
+            if resolved is not None:
+                return resolved
+
+            pending = self._pending[approval_id] = _Pending(
+                approval_id, self.initial_interval, timeout
+            )
+            self._order.append(approval_id)
+
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="amorce-approval-tracker", daemon=True
+                )
+                self._thread.start()
+
+            pushed = self._pushed.pop(approval_id, None)
+            self._cond.notify_all()
+
+        if pushed is not None:
+            self._resolve(approval_id, pushed)
+        return pending.future
+
+    def notify(self, approval_id: str, status: Dict[str, Any]):
+        """Deliver a pushed decision (e.g. from a webhook handler)."""
+        with self._cond:
+            known = approval_id in self._pending
+            if not known and approval_id not in self._resolved:
+                # Held for a later track(); bounded like the resolved futures
+                self._pushed[approval_id] = status
+                self._pushed.move_to_end(approval_id)
+                if len(self._pushed) > self.MAX_PUSHED:
+                    self._pushed.popitem(last=False)
+        if known:
+            self._resolve(approval_id, status)
+
+    def cancel(self, approval_id: str):
+        """Fail the approval's future with InterruptedError."""
+        self.notify(approval_id, {'status': CANCELLED})
+
+    def wait(self, approval_id: str, timeout: float = 300) -> Dict[str, Any]:
+        """
+        Block until the approval is decided.
+
+        A timeout ends only this wait: other waiters on the same
+        approval keep waiting, and it stays tracked while they do.
+
+        Raises:
+            PermissionError: Approval rejected or expired
+            TimeoutError: No decision within `timeout`
+            InterruptedError: Wait was cancelled
+        """
+        future = self._attach(approval_id)
+        gave_up = False
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            if future.done():
+                # The tracked deadline passed (same class on 3.11+)
+                raise
+            gave_up = True
+            raise TimeoutError(f"HITL approval timeout: {approval_id}")
+        finally:
+            self._detach(approval_id, gave_up)
+
+    async def await_decision(self, approval_id: str, timeout: float = 300) -> Dict[str, Any]:
+        """
+        Async counterpart of `wait`.
+
+        Timing out or cancelling the task abandons only this wait; the
+        shared future is shielded so other waiters still get the decision.
+        """
+        future = self._attach(approval_id)
+        gave_up = False
+        try:
+            return await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(future)), timeout=timeout)
+        except asyncio.TimeoutError:
+            if future.done():
+                raise
+            gave_up = True
+            raise TimeoutError(f"HITL approval timeout: {approval_id}")
+        except asyncio.CancelledError:
+            gave_up = True
+            raise
+        finally:
+            self._detach(approval_id, gave_up)
+
+    def _attach(self, approval_id: str) -> Future:
+        """Track the approval and count a blocked waiter on it."""
+        future = self.track(approval_id)
+        with self._cond:
+            pending = self._pending.get(approval_id)
+            if pending is not None and pending.future is future:
+                pending.waiters += 1
+        return future
+
+    def _detach(self, approval_id: str, gave_up: bool):
+        """
+        Uncount a waiter. The last one to give up stops tracking, unless
+        a `track(timeout=...)` deadline still owns the approval; any other
+        listener on the future then gets TimeoutError rather than hanging.
+        """
+        with self._cond:
+            pending = self._pending.get(approval_id)
+            if pending is None:
+                return
+            pending.waiters -= 1
+            if not gave_up or pending.waiters > 0 or pending.deadline != math.inf:
+                return
+            del self._pending[approval_id]
+            self._requested_at.pop(approval_id, None)
+        if not pending.future.done():
+            pending.future.set_exception(TimeoutError(f"HITL approval timeout: {approval_id}"))
+
+    def _resolve(self, approval_id: str, status: Dict[str, Any]):
+        now = time.monotonic()
+        with self._cond:
+            pending = self._pending.pop(approval_id, None)
+            requested_at = self._requested_at.pop(approval_id, None)
+            if pending is None:
+                return
+
+            self._resolved[approval_id] = pending.future
+            if len(self._resolved) > self.MAX_RESOLVED:
+                self._resolved.popitem(last=False)
+
+            waited = now - pending.tracked_at
+            for i, bound in enumerate(self.WAIT_BUCKETS):
+                if waited <= bound:
+                    self.wait_histogram[i] += 1
+                    break
+            if requested_at is not None:
+                self.latencies.append(now - requested_at)
+
+        if pending.future.done():
+            return
+        if status['status'] == 'approved':
+            pending.future.set_result(status)
+        elif status['status'] == CANCELLED:
+            pending.future.set_exception(
+                InterruptedError(f"HITL approval wait cancelled: {approval_id}")
+            )
+        elif status['status'] == _TIMED_OUT:
+            pending.future.set_exception(
+                TimeoutError(f"HITL approval timeout: {approval_id}")
+            )
+        else:
+            pending.future.set_exception(
+                PermissionError(f"HITL approval {status['status']}: {approval_id}")
+            )
+
+    def _due(self, now: float) -> Tuple[List[str], List[str]]:
+        """Pick due approvals round-robin, within this tick's budget.
+
+        Returns:
+            (ids to check, ids past their deadline)
+        """
+        capacity = self.max_checks_per_tick
+        if hasattr(self.client, 'check_approvals'):
+            capacity *= self.batch_size
+
+        expired = [i for i, p in self._pending.items() if p.deadline <= now]
+
+        due = []
+        for _ in range(len(self._order)):
+            if len(due) >= capacity:
+                break
+            approval_id = self._order.popleft()
+            pending = self._pending.get(approval_id)
+            if pending is None or pending.future.done():
+                # Resolved, timed out or cancelled by the waiter
+                self._pending.pop(approval_id, None)
+                continue
+            self._order.append(approval_id)
+            if pending.next_check <= now:
+                due.append(approval_id)
+                pending.delay = min(pending.delay * self.multiplier, self.max_interval)
+                pending.next_check = now + pending.delay * random.uniform(0.9, 1.1)
+        return due, expired
+
+    def _check_many(self, approval_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        statuses = {}
+        if hasattr(self.client, 'check_approvals'):
+            for i in range(0, len(approval_ids), self.batch_size):
+                chunk = approval_ids[i:i + self.batch_size]
+                self.checks += 1
+                try:
+                    statuses.update(self.client.check_approvals(chunk))
+                except Exception:
+                    self.errors += 1
+            return statuses
+
+        for approval_id in approval_ids:
+            self.checks += 1
+            try:
+                statuses[approval_id] = self.client.check_approval(approval_id)
+            except Exception:
+                # Retried on the next backoff step
+                self.errors += 1
+        return statuses
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if self._closed or (self._client_ref is not None and self._client_ref() is None):
+                    # Closed, or a shared tracker whose client was collected
+                    return
+                due, expired = self._due(time.monotonic())
+
+            for approval_id in expired:
+                self._resolve(approval_id, {'status': _TIMED_OUT})
+
+            for approval_id, status in self._check_many(due).items():
+                if status.get('status') in FINAL_STATUSES:
+                    self._resolve(approval_id, status)
+
+            with self._cond:
+                if not self._closed:
+                    self._cond.wait(timeout=self.tick)
+
+    def close(self):
+        """Stop the tracker thread and cancel every pending wait."""
+        with self._cond:
+            self._closed = True
+            pending_ids = list(self._pending)
+            self._cond.notify_all()
+        for approval_id in pending_ids:
+            self._resolve(approval_id, {'status': CANCELLED})
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Report queue depth, request counts and wait times.
+
+        Returns:
+            Dict with `pending` (queue depth), `checks`, `errors`,
+            `decisions`, request-to-decision latency (`mean`, `p50`,
+            `p95`, `max`) and `wait_histogram`, a map of bucket upper
+            bound in seconds to the number of waits that ended there.
+        """
+        with self._cond:
+            latencies = list(self.latencies)
+            histogram = list(self.wait_histogram)
+            pending = len(self._pending)
+
+        return {
+            'pending': pending,
+            'checks': self.checks,
+            'errors': self.errors,
+            'decisions': sum(histogram),
+            **_latency_summary(latencies),
+            'wait_histogram': {
+                ('+Inf' if math.isinf(bound) else str(bound)): count
+                for bound, count in zip(self.WAIT_BUCKETS, histogram)
+            },
+        }
+
+
+_trackers: "weakref.WeakKeyDictionary[Any, ApprovalTracker]" = weakref.WeakKeyDictionary()
+_trackers_lock = threading.Lock()
+
+
+def get_tracker(client: Any) -> ApprovalTracker:
+    """
+    Get the shared ApprovalTracker for a client, creating it on first use.
+
+    Every tool and agent on the client shares one polling thread, and a
+    single webhook `notify()` reaches all of them. The shared tracker
+    holds the client weakly; once the client is garbage collected the
+    tracker is closed and its thread exits.
+    """
+    with _trackers_lock:
+        tracker = _trackers.get(client)
+        if tracker is None:
+            tracker = _trackers[client] = ApprovalTracker(client)
+            tracker._hold_weakly()
+            weakref.finalize(client, tracker.close)
+        return tracker
@@ -0,0 +1,576 @@
+"""
+Append-only audit log of signed actions
+
+Records every signed tool call, crew kickoff, counter-offer and receipt
+in local NDJSON segment files. Appends are buffered and group-committed
+by a writer thread (one write and one fsync per group). Segments
+rotate by size; a sealed segment gets memory-mapped sorted indexes on
+agent ID, tool name and time, so queries only read matching records.
+
+Layout of the log directory:
+
+    00000001.log         sealed segment, one JSON record per line
+    00000001.agent.idx   (hash of agent_id, offset) sorted
+    00000001.tool.idx    (hash of tool name, offset) sorted
+    00000001.time.idx    (microseconds since epoch, offset) sorted
+    00000002.log         active segment (indexed in memory)
+"""
+
+import bisect
+import hashlib
+import json
+import mmap
+import os
+import struct
+import tempfile
+import threading
+import time
+from concurrent.futures import Future
+from typing import Optional, Any, Dict, Iterator, List, Set, Tuple
+
+
+_IDX_MAGIC = b"AMAI"
+_IDX_VERSION = 1
+
+# magic, version, entry count
+_IDX_HEADER = struct.Struct("<4sHxxQ")
+# key, record offset
+_ENTRY = struct.Struct("<QQ")
+
+INDEXES = ('agent', 'tool', 'time')
+
+_encoder = json.JSONEncoder(separators=(',', ':'), ensure_ascii=False, default=repr)
+
+
+def _key_hash(value: str) -> int:
+    return int.from_bytes(hashlib.blake2b(value.encode('utf-8'), digest_size=8).digest(), 'little')
+
+
+def _time_key(ts: float) -> int:
+    return max(0, int(ts * 1_000_000))
+
+
+def _write_index(path: str, entries: List[Tuple[int, int]]):
+    """Sort entries and write them atomically."""
+    entries.sort()
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    with os.fdopen(fd, "wb") as f:
+        f.write(_IDX_HEADER.pack(_IDX_MAGIC, _IDX_VERSION, len(entries)))
+        f.write(b"".join(_ENTRY.pack(key, offset) for key, offset in entries))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+class _Keys:
+    """Sequence view of an index's keys, for bisect."""
+
+    def __init__(self, index: '_Index'):
+        self._mm = index._mm
+        self._len = index.count
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __getitem__(self, i: int) -> int:
+        return _ENTRY.unpack_from(self._mm, _IDX_HEADER.size + i * _ENTRY.size)[0]
+
+
+class _Index:
+    """Memory-mapped sorted (key, offset) file."""
+
+    def __init__(self, path: str):
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.count = _IDX_HEADER.unpack_from(self._mm, 0)
+        if magic != _IDX_MAGIC or version != _IDX_VERSION:
+            self._mm.close()
+            raise ValueError(f"Not an audit index: {path}")
+        self._keys = _Keys(self)
+
+    def _entry(self, i: int) -> Tuple[int, int]:
+        return _ENTRY.unpack_from(self._mm, _IDX_HEADER.size + i * _ENTRY.size)
+
+    def bounds(self) -> Optional[Tuple[int, int]]:
+        """Smallest and largest key, or None if empty."""
+        if not self.count:
+            return None
+        return self._entry(0)[0], self._entry(self.count - 1)[0]
+
+    def range(self, low: int, high: int) -> List[int]:
+        """Offsets of entries with low <= key <= high."""
+        offsets = []
+        i = bisect.bisect_left(self._keys, low)
+        while i < self.count:
+            key, offset = self._entry(i)
+            if key > high:
+                break
+            offsets.append(offset)
+            i += 1
+        return offsets
+
+    def close(self):
+        self._mm.close()
+
+
+class _Segment:
+    """A sealed, read-only segment and its indexes."""
+
+    def __init__(self, path: str):
+        self.path = path
+        base = path[:-len(".log")]
+        for name in INDEXES:
+            if not os.path.exists(f"{base}.{name}.idx"):
+                # Crashed while sealing: rebuild from the records
+                _seal(path, _scan(path)[0])
+                break
+        self.indexes = {name: _Index(f"{base}.{name}.idx") for name in INDEXES}
+        self.size = os.path.getsize(path)
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if self.size else None
+
+    def read(self, offset: int) -> Dict[str, Any]:
+        end = self._mm.find(b"\n", offset)
+        return json.loads(self._mm[offset:end])
+
+    def last(self) -> Optional[Dict[str, Any]]:
+        """The final record, if any."""
+        if not self.size:
+            return None
+        return self.read(self._mm.rfind(b"\n", 0, self.size - 1) + 1)
+
+    def scan(self) -> Iterator[Dict[str, Any]]:
+        offset = 0
+        while offset < self.size:
+            end = self._mm.find(b"\n", offset)
+            yield json.loads(self._mm[offset:end])
+            offset = end + 1
+
+    def close(self):
+        for index in self.indexes.values():
+            index.close()
+        if self._mm is not None:
+            self._mm.close()
+
+
+def _scan(path: str) -> Tuple[Dict[str, List[Tuple[int, int]]], int, int]:
+    """
+    Index entries, last seq and valid length of a segment file.
+
+    A trailing partial record (torn write) ends the valid length.
+    """
+    entries: Dict[str, List[Tuple[int, int]]] = {name: [] for name in INDEXES}
+    last_seq = 0
+    offset = 0
+    with open(path, "rb") as f:
+        for line in f:
+            if not line.endswith(b"\n"):
+                break
+            try:
+                record = json.loads(line)
+            except ValueError:
+                break
+            _add_entries(entries, record, offset)
+            last_seq = record.get('seq', last_seq)
+            offset += len(line)
+    return entries, last_seq, offset
+
+
+def _add_entries(entries: Dict[str, List[Tuple[int, int]]], record: Dict[str, Any], offset: int):
+    if record.get('agent_id'):
+        entries['agent'].append((_key_hash(record['agent_id']), offset))
+    if record.get('tool'):
+        entries['tool'].append((_key_hash(record['tool']), offset))
+    entries['time'].append((_time_key(record['ts']), offset))
+
+
+def _read_active(path: str, size: int, offsets: Optional[List[int]]) -> Iterator[Dict[str, Any]]:
+    """Committed records of the active segment (all, or at `offsets`)."""
+    with open(path, "rb") as f:
+        if offsets is None:
+            position = 0
+            while position < size:
+                line = f.readline()
+                position += len(line)
+                yield json.loads(line)
+        else:
+            for offset in offsets:
+                f.seek(offset)
+                yield json.loads(f.readline())
+
+
+def _seal(path: str, entries: Dict[str, List[Tuple[int, int]]]):
+    base = path[:-len(".log")]
+    for name in INDEXES:
+        _write_index(f"{base}.{name}.idx", list(entries[name]))
+
+
+class AuditLog:
+    """
+    Local append-only log of signed calls, kickoffs, offers and receipts.
+
+    `append` encodes the record on the calling thread and queues it; a
+    writer thread commits queued records together once `commit_delay`
+    has passed or `max_batch` are waiting, with a single fsync. Pass
+    `durable=True` (or call `commit()`) to wait for the disk.
+
+    Example:
+        ```python
+        from crewai_amorce.audit import AuditLog
+
+        audit = AuditLog("./amorce-audit")
+        agent = SecureAgent(..., audit_log=audit)
+
+        for record in audit.query(agent_id=agent.agent_id, tool="refund",
+                                  start=time.time() - 86400):
+            print(record["seq"], record["payload"], record["proof"]["signature"])
+        ```
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        segment_bytes: int = 64 * 1024 * 1024,
+        commit_delay: float = 0.005,
+        max_batch: int = 1024,
+        fsync: bool = True
+    ):
+        """
+        Open (or create) an audit log.
+
+        Args:
+            directory: Directory holding the segments
+            segment_bytes: Size at which the active segment is sealed
+            commit_delay: Seconds a record may wait for its group commit
+            max_batch: Records per group commit
+            fsync: fsync each group commit (off trades durability for speed)
+        """
+        self.directory = directory
+        self.segment_bytes = segment_bytes
+        self.commit_delay = commit_delay
+        self.max_batch = max_batch
+        self.fsync = fsync
+
+        self.commits = 0
+        self.committed = 0
+        self.errors = 0
+
+        os.makedirs(directory, exist_ok=True)
+        names = sorted(n for n in os.listdir(directory) if n.endswith(".log"))
+
+        # Segment list and the active segment's in-memory index
+        self._lock = threading.Lock()
+        self._sealed = [_Segment(os.path.join(directory, n)) for n in names[:-1]]
+        self._number = int(names[-1][:-len(".log")]) if names else 1
+        self._open_active(recover=bool(names))
+
+        self._cond = threading.Condition()
+        # (seq, record, line, future shared by up to max_batch records)
+        self._batch: List[Tuple[int, Dict[str, Any], bytes, Future]] = []
+        self._committing: Optional[Future] = None
+        self._deadline = 0.0
+        self._urgent = False
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+        self._failed: Optional[BaseException] = None
+
+    def _active_path(self) -> str:
+        return os.path.join(self.directory, f"{self._number:08d}.log")
+
+    def _open_active(self, recover: bool):
+        path = self._active_path()
+        self._entries: Dict[str, List[Tuple[int, int]]] = {name: [] for name in INDEXES}
+        self._seq = 0
+        if recover:
+            self._entries, self._seq, valid = _scan(path)
+            if valid < os.path.getsize(path):
+                # Drop a torn trailing write
+                os.truncate(path, valid)
+        if not self._seq and self._sealed:
+            # Fresh active segment: continue after the last sealed record
+            last = self._sealed[-1].last()
+            self._seq = last['seq'] if last else 0
+        # Unbuffered: a failed commit leaves nothing behind to be flushed later
+        self._file = open(path, "ab", buffering=0)
+        self._size = self._file.tell()
+
+    def append(
+        self,
+        kind: str,
+        agent_id: str,
+        payload: Any,
+        proof: Optional[Dict[str, Any]] = None,
+        tool: Optional[str] = None,
+        durable: bool = False
+    ) -> int:
+        """
+        Record a signed action.
+
+        Args:
+            kind: "tool_call", "kickoff", "counter_offer", "receipt", ...
+            agent_id: Signing agent (or crew) ID
+            payload: The signed payload
+            proof: Signature fields (signature or Merkle batch proof)
+            tool: Tool name, for tool calls
+            durable: Wait until the record is on disk
+
+        Returns:
+            Sequence number of the record
+
+        Raises:
+            RuntimeError: The log is closed, or its writer has failed
+        """
+        ts = time.time()
+        record = {'ts': ts, 'kind': kind, 'agent_id': agent_id, 'payload': payload}
+        if tool is not None:
+            record['tool'] = tool
+        if proof is not None:
+            record['proof'] = proof
+
+        body = _encoder.encode(record)[1:]
+
+        with self._cond:
+            if self._failed is not None:
+                raise RuntimeError(f"AuditLog writer failed: {self._failed!r}") from self._failed
+            if self._closed:
+                raise RuntimeError("AuditLog is closed")
+            self._seq += 1
+            seq = self._seq
+            # Numbered under the lock so file order matches seq order
+            line = f'{{"seq":{seq},{body}\n'.encode('utf-8')
+
+            if not self._batch:
+                self._deadline = time.monotonic() + self.commit_delay
+            if len(self._batch) % self.max_batch == 0:
+                future = Future()
+            else:
+                future = self._batch[-1][3]
+            self._batch.append((seq, record, line, future))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="amorce-audit", daemon=True)
+                self._thread.start()
+            if len(self._batch) == 1 or len(self._batch) >= self.max_batch:
+                # Start the commit timer, or commit a full group now
+                self._cond.notify_all()
+
+        if durable:
+            future.result()
+        return seq
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._batch and not self._closed:
+                    self._cond.wait()
+                if not self._batch or self._failed is not None:
+                    return
+
+                remaining = self._deadline - time.monotonic()
+                if (remaining > 0 and not self._urgent and not self._closed
+                        and len(self._batch) < self.max_batch):
+                    self._cond.wait(timeout=remaining)
+                    continue
+
+                # One group at most; a backlog is committed group by group
+                batch = self._batch[:self.max_batch]
+                del self._batch[:self.max_batch]
+                self._committing = batch[0][3]
+                if not self._batch:
+                    self._urgent = False
+            self._commit(batch)
+
+    def _commit(self, batch: List[Tuple[int, Dict[str, Any], bytes, Future]]):
+        future = batch[0][3]
+        try:
+            data = memoryview(b"".join(line for _, _, line, _ in batch))
+            while data:
+                data = data[self._file.write(data):]
+            if self.fsync:
+                os.fsync(self._file.fileno())
+        except BaseException as e:
+            with self._cond:
+                self.errors += 1
+            try:
+                # Cut the torn group so later records follow the last good one
+                os.ftruncate(self._file.fileno(), self._size)
+            except BaseException as truncate_error:
+                self._fail(truncate_error)
+            future.set_exception(e)
+            return
+
+        with self._lock:
+            offset = self._size
+            for _, record, line, _ in batch:
+                _add_entries(self._entries, record, offset)
+                offset += len(line)
+            self._size = offset
+            self.commits += 1
+            self.committed += len(batch)
+        future.set_result(batch[-1][0])
+
+        if self._size >= self.segment_bytes:
+            try:
+                self._rotate()
+            except BaseException as e:
+                self._fail(e)
+
+    def _fail(self, error: BaseException):
+        """Stop the writer for good: fail queued records and reject new ones."""
+        with self._cond:
+            self._failed = error
+            self.errors += 1
+            pending = {id(item[3]): item[3] for item in self._batch}
+            self._batch.clear()
+            self._cond.notify_all()
+        failure = RuntimeError(f"AuditLog writer failed: {error!r}")
+        failure.__cause__ = error
+        for future in pending.values():
+            future.set_exception(failure)
+
+    def _rotate(self):
+        """Seal the active segment and start the next one."""
+        path = self._active_path()
+        self._file.close()
+        _seal(path, self._entries)
+        segment = _Segment(path)
+        with self._lock:
+            self._sealed.append(segment)
+            self._number += 1
+            self._entries = {name: [] for name in INDEXES}
+            self._file = open(self._active_path(), "ab", buffering=0)
+            self._size = 0
+
+    def commit(self):
+        """Commit queued records now and wait for the disk."""
+        with self._cond:
+            if self._failed is not None:
+                raise RuntimeError(f"AuditLog writer failed: {self._failed!r}") from self._failed
+            if self._batch:
+                future = self._batch[-1][3]
+                self._urgent = True
+                self._cond.notify_all()
+            else:
+                # Nothing queued; wait for a group still being written
+                future = self._committing
+        if future is not None:
+            future.result()
+
+    def query(
+        self,
+        agent_id: Optional[str] = None,
+        tool: Optional[str] = None,
+        kind: Optional[str] = None,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        limit: Optional[int] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Find committed records, oldest first.
+
+        Agent, tool and time filters use the indexes: each segment
+        reads only the records in the intersection of their matches
+        (segments outside the time range are skipped outright). `kind`
+        alone falls back to a scan.
+
+        Args:
+            agent_id: Signing agent or crew ID
+            tool: Tool name
+            kind: Record kind
+            start: Earliest timestamp (epoch seconds, inclusive)
+            end: Latest timestamp (epoch seconds, inclusive)
+            limit: Stop after this many records
+
+        Yields:
+            Record dicts with `seq`, `ts`, `kind`, `agent_id`,
+            `payload` and (when present) `tool` and `proof`
+        """
+        low = _time_key(start) if start is not None else 0
+        high = _time_key(end) if end is not None else 2 ** 64 - 1
+        wanted = [(name, _key_hash(value)) for name, value in (('agent', agent_id), ('tool', tool)) if value]
+        timed = start is not None or end is not None
+
+        def matches(record: Dict[str, Any]) -> bool:
+            return (
+                (agent_id is None or record.get('agent_id') == agent_id)
+                and (tool is None or record.get('tool') == tool)
+                and (kind is None or record.get('kind') == kind)
+                and low <= _time_key(record['ts']) <= high
+            )
+
+        with self._lock:
+            sealed = list(self._sealed)
+            active_path, active_size = self._active_path(), self._size
+            active = self._active_candidates(wanted, low, high, timed)
+
+        def sources() -> Iterator[Iterator[Dict[str, Any]]]:
+            for segment in sealed:
+                bounds = segment.indexes['time'].bounds()
+                if bounds is None or bounds[1] < low or bounds[0] > high:
+                    continue
+                offsets = self._sealed_candidates(segment, wanted, low, high, timed)
+                yield segment.scan() if offsets is None else (segment.read(o) for o in offsets)
+            yield _read_active(active_path, active_size, active)
+
+        count = 0
+        for records in sources():
+            for record in records:
+                if matches(record):
+                    yield record
+                    count += 1
+                    if limit is not None and count >= limit:
+                        return
+
+    @staticmethod
+    def _sealed_candidates(segment: _Segment, wanted, low: int, high: int, timed: bool) -> Optional[List[int]]:
+        """Sorted offsets matching the indexed filters, or None to scan."""
+        candidates: Optional[Set[int]] = None
+        for name, key in wanted:
+            found = set(segment.indexes[name].range(key, key))
+            candidates = found if candidates is None else candidates & found
+            if not candidates:
+                return []
+        if timed:
+            found = set(segment.indexes['time'].range(low, high))
+            candidates = found if candidates is None else candidates & found
+        return None if candidates is None else sorted(candidates)
+
+    def _active_candidates(self, wanted, low: int, high: int, timed: bool) -> Optional[List[int]]:
+        """Like `_sealed_candidates`, from the in-memory entries (lock held)."""
+        candidates: Optional[Set[int]] = None
+        for name, key in wanted:
+            found = {offset for k, offset in self._entries[name] if k == key}
+            candidates = found if candidates is None else candidates & found
+        if timed:
+            found = {offset for k, offset in self._entries['time'] if low <= k <= high}
+            candidates = found if candidates is None else candidates & found
+        return None if candidates is None else sorted(candidates)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Report log counters.
+
+        Returns:
+            Dict with `committed` records, `commits` (fsync groups),
+            `mean_group`, `errors`, `segments` and `active_bytes`
+        """
+        with self._lock:
+            return {
+                'committed': self.committed,
+                'commits': self.commits,
+                'mean_group': self.committed / self.commits if self.commits else 0.0,
+                'errors': self.errors,
+                'segments': len(self._sealed) + 1,
+                'active_bytes': self._size,
+            }
+
+    def close(self):
+        """Commit pending records, stop the writer and release the files."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join()
+        self._file.close()
+        for segment in self._sealed:
+            segment.close()
@@ -0,0 +1,300 @@
+"""
+Merkle-batched signing
+
+Collects message digests for a short window, signs one Merkle root
+per batch with the identity's Ed25519 key and hands every message a
+compact inclusion proof, so thousands of tool calls per minute cost a
+handful of signatures instead of one each.
+"""
+
+import base64
+import hashlib
+import threading
+import time
+from concurrent.futures import Future
+from functools import lru_cache
+from typing import Optional, Any, Dict, List, Tuple, Union
+
+from crewai_amorce.canonical import canonical_digest
+
+
+ALGORITHM = "ed25519-merkle-sha256"
+
+# Domain separation between leaves and inner nodes (as in RFC 6962)
+_LEAF = b"\x00"
+_NODE = b"\x01"
+
+
+def _b64(digest: bytes) -> str:
+    return base64.b64encode(digest).decode("ascii")
+
+
+def _to_bytes(message: Union[str, bytes]) -> bytes:
+    return message.encode("utf-8") if isinstance(message, str) else message
+
+
+def leaf_hash(message: Union[str, bytes, dict, list]) -> bytes:
+    """
+    SHA-256 leaf hash of a message.
+
+    Dicts and lists are hashed as their canonical JSON encoding,
+    streamed straight into the hash.
+    """
+    if isinstance(message, (dict, list)):
+        return canonical_digest(message, prefix=_LEAF)
+    return hashlib.sha256(_LEAF + _to_bytes(message)).digest()
+
+
+def node_hash(left: bytes, right: bytes) -> bytes:
+    """SHA-256 hash of two child nodes."""
+    return hashlib.sha256(_NODE + left + right).digest()
+
+
+def merkle_levels(leaves: List[bytes]) -> List[List[bytes]]:
+    """
+    Build every level of the tree, leaves first.
+
+    An odd node at the end of a level is promoted unchanged.
+    """
+    if not leaves:
+        raise ValueError("Cannot build a Merkle tree without leaves")
+
+    levels = [list(leaves)]
+    while len(levels[-1]) > 1:
+        level = levels[-1]
+        parents = [node_hash(level[i], level[i + 1]) for i in range(0, len(level) - 1, 2)]
+        if len(level) % 2:
+            parents.append(level[-1])
+        levels.append(parents)
+    return levels
+
+
+def inclusion_proof(levels: List[List[bytes]], index: int) -> List[bytes]:
+    """Sibling hashes from leaf `index` up to the root."""
+    proof = []
+    for level in levels[:-1]:
+        sibling = index ^ 1
+        if sibling < len(level):
+            proof.append(level[sibling])
+        index //= 2
+    return proof
+
+
+def root_from_proof(leaf: bytes, index: int, size: int, proof: List[bytes]) -> bytes:
+    """Fold an inclusion proof back into the root it commits to."""
+    if not 0 <= index < size:
+        raise ValueError(f"Leaf index {index} out of range for {size} leaves")
+
+    node = leaf
+    siblings = iter(proof)
+    while size > 1:
+        if index % 2:
+            node = node_hash(next(siblings), node)
+        elif index + 1 < size:
+            node = node_hash(node, next(siblings))
+        # else: promoted without a sibling
+        index //= 2
+        size = (size + 1) // 2
+
+    if next(siblings, None) is not None:
+        raise ValueError("Inclusion proof is longer than the tree")
+    return node
+
+
+@lru_cache(maxsize=1024)
+def _verify_root(root: str, signature: str, public_key_pem: str) -> bool:
+    """Check a root signature once; every proof in the batch reuses it."""
+    from cryptography.exceptions import InvalidSignature
+    from cryptography.hazmat.primitives import serialization
+
+    public_key = serialization.load_pem_public_key(public_key_pem.encode("utf-8"))
+    try:
+        public_key.verify(base64.b64decode(signature), base64.b64decode(root))
+    except InvalidSignature:
+        return False
+    return True
+
+
+def verify_batch_proof(
+    message: Union[str, bytes, dict, list],
+    proof: Dict[str, Any],
+    public_key_pem: str
+) -> bool:
+    """
+    Verify a message against a batch proof from `BatchSigner`.
+
+    Args:
+        message: The exact message (or payload dict) that was signed
+        proof: Proof fields (`merkle_root`, `merkle_index`,
+            `merkle_size`, `merkle_proof`, `signature`)
+        public_key_pem: Signer's Ed25519 public key
+
+    Returns:
+        True if the message is in the batch and the root signature is valid
+    """
+    if proof.get("algorithm") != ALGORITHM:
+        return False
+
+    try:
+        root = root_from_proof(
+            leaf_hash(message),
+            proof["merkle_index"],
+            proof["merkle_size"],
+            [base64.b64decode(h) for h in proof["merkle_proof"]]
+        )
+    except (KeyError, ValueError, StopIteration):
+        return False
+
+    if _b64(root) != proof["merkle_root"]:
+        return False
+    return _verify_root(proof["merkle_root"], proof["signature"], public_key_pem)
+
+
+class BatchSigner:
+    """
+    Sign messages in Merkle batches.
+
+    A batch is flushed when it reaches `max_batch` messages or
+    `max_delay` seconds after its first message, whichever comes first.
+    Each message gets its root signature plus an inclusion proof of
+    ceil(log2(batch size)) hashes.
+
+    Example:
+        ```python
+        from crewai_amorce.batch_signing import BatchSigner, verify_batch_proof
+
+        signer = BatchSigner(identity, max_batch=256, max_delay=0.02)
+        proof = signer.sign("payload")
+
+        assert verify_batch_proof("payload", proof, identity.public_key_pem)
+        ```
+    """
+
+    def __init__(self, identity: Any, max_batch: int = 256, max_delay: float = 0.02):
+        """
+        Initialize batch signer.
+
+        Args:
+            identity: Amorce identity (signs the roots)
+            max_batch: Messages per batch
+            max_delay: Seconds a message may wait for its batch
+        """
+        self.identity = identity
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+
+        self.signatures = 0
+        self.messages = 0
+
+        self._cond = threading.Condition()
+        self._batch: List[Tuple[bytes, Future]] = []
+        self._deadline = 0.0
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+    def submit(self, message: Union[str, bytes, dict, list]) -> Future:
+        """
+        Queue a message for the next batch.
+
+        Returns:
+            Future resolving to the message's proof dict
+        """
+        future: Future = Future()
+        leaf = leaf_hash(message)
+
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("BatchSigner is closed")
+
+            if not self._batch:
+                self._deadline = time.monotonic() + self.max_delay
+            self._batch.append((leaf, future))
+
+            if len(self._batch) >= self.max_batch:
+                batch, self._batch = self._batch, []
+            else:
+                batch = None
+                if self._thread is None:
+                    self._thread = threading.Thread(
+                        target=self._run, name="amorce-batch-signer", daemon=True
+                    )
+                    self._thread.start()
+                self._cond.notify_all()
+
+        if batch:
+            self._sign_batch(batch)
+        return future
+
+    def sign(self, message: Union[str, bytes, dict, list]) -> Dict[str, Any]:
+        """Queue a message and wait for its batch proof."""
+        return self.submit(message).result()
+
+    def _sign_batch(self, batch: List[Tuple[bytes, Future]]):
+        try:
+            levels = merkle_levels([leaf for leaf, _ in batch])
+            root = levels[-1][0]
+            signature = self.identity.sign_data(root)
+        except BaseException as e:
+            for _, future in batch:
+                future.set_exception(e)
+            return
+
+        with self._cond:
+            self.signatures += 1
+            self.messages += len(batch)
+
+        root_b64 = _b64(root)
+        for index, (_, future) in enumerate(batch):
+            future.set_result({
+                "algorithm": ALGORITHM,
+                "signature": signature,
+                "merkle_root": root_b64,
+                "merkle_index": index,
+                "merkle_size": len(batch),
+                "merkle_proof": [_b64(h) for h in inclusion_proof(levels, index)],
+            })
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._batch and not self._closed:
+                    self._cond.wait()
+                if not self._batch:
+                    return
+
+                remaining = self._deadline - time.monotonic()
+                if remaining > 0 and not self._closed:
+                    self._cond.wait(timeout=remaining)
+                    continue
+
+                batch, self._batch = self._batch, []
+            self._sign_batch(batch)
+
+    def flush(self):
+        """Sign whatever is queued now."""
+        with self._cond:
+            batch, self._batch = self._batch, []
+        if batch:
+            self._sign_batch(batch)
+
+    def close(self):
+        """Sign pending messages and stop the flusher thread."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self.flush()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Report signing counts.
+
+        Returns:
+            Dict with `messages`, `signatures` and `mean_batch`
+        """
+        with self._cond:
+            messages, signatures = self.messages, self.signatures
+        return {
+            "messages": messages,
+            "signatures": signatures,
+            "mean_batch": messages / signatures if signatures else 0.0,
+        }
@@ -0,0 +1,420 @@
+"""
+Result cache for Amorce lookups
+
+Bounded TTL/LRU cache with stale-while-revalidate, used by the
+discovery tools to avoid repeating identical Trust API calls.
+"""
+
+import asyncio
+import json
+import sqlite3
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Any, Awaitable, Callable, Dict, Tuple
+
+
+# (value, expires_at, stale_until)
+Entry = Tuple[Any, float, float]
+
+
+def _estimate_size(value: Any) -> int:
+    """Approximate memory footprint of a cached value in bytes."""
+    try:
+        return len(json.dumps(value, separators=(',', ':')))
+    except (TypeError, ValueError):
+        return sys.getsizeof(value)
+
+
+class CacheBackend:
+    """
+    Storage interface for ResultCache.
+
+    Backends store opaque entries and enforce their own size limits.
+    Implement this to share a cache between worker processes.
+    """
+
+    evictions: int = 0
+
+    def get(self, key: str) -> Optional[Entry]:
+        raise NotImplementedError
+
+    def set(self, key: str, entry: Entry):
+        raise NotImplementedError
+
+    def delete(self, key: str):
+        raise NotImplementedError
+
+    def clear(self):
+        raise NotImplementedError
+
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+
+class MemoryBackend(CacheBackend):
+    """
+    In-process LRU backend.
+
+    Evicts least recently used entries once either `max_entries` or
+    `max_bytes` (estimated) is exceeded.
+    """
+
+    def __init__(self, max_entries: int = 1024, max_bytes: int = 8 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.evictions = 0
+        self.size_bytes = 0
+        self._data: "OrderedDict[str, Tuple[Entry, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Entry]:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            self._data.move_to_end(key)
+            return item[0]
+
+    def set(self, key: str, entry: Entry):
+        size = _estimate_size(entry[0])
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old is not None:
+                self.size_bytes -= old[1]
+            if size > self.max_bytes:
+                return
+
+            self._data[key] = (entry, size)
+            self.size_bytes += size
+
+            while self._data and (
+                len(self._data) > self.max_entries or self.size_bytes > self.max_bytes
+            ):
+                _, (_, evicted_size) = self._data.popitem(last=False)
+                self.size_bytes -= evicted_size
+                self.evictions += 1
+
+    def delete(self, key: str):
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old is not None:
+                self.size_bytes -= old[1]
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.size_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class DiskBackend(CacheBackend):
+    """
+    SQLite-backed cache shared between processes.
+
+    Values must be JSON-serializable. LRU order is tracked with a
+    last-access timestamp, so every process sees the same eviction order.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_entries: int = 10000,
+        max_bytes: int = 64 * 1024 * 1024
+    ):
+        """
+        Initialize disk backend.
+
+        Args:
+            path: SQLite database file (created if missing)
+            max_entries: Max cached entries across all processes
+            max_bytes: Max total size of serialized values
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=5, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            " key TEXT PRIMARY KEY,"
+            " value TEXT NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " expires_at REAL NOT NULL,"
+            " stale_until REAL NOT NULL,"
+            " accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS cache_lru ON cache(accessed_at)")
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[Entry]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at, stale_until FROM cache WHERE key = ?",
+                (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute(
+                "UPDATE cache SET accessed_at = ? WHERE key = ?",
+                (time.time(), key)
+            )
+            self._conn.commit()
+        return json.loads(row[0]), row[1], row[2]
+
+    def set(self, key: str, entry: Entry):
+        value, expires_at, stale_until = entry
+        data = json.dumps(value, separators=(',', ':'))
+        if len(data) > self.max_bytes:
+            return
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache VALUES (?, ?, ?, ?, ?, ?)",
+                (key, data, len(data), expires_at, stale_until, time.time())
+            )
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self):
+        count, total = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache"
+        ).fetchone()
+
+        while count > self.max_entries or total > self.max_bytes:
+            row = self._conn.execute(
+                "SELECT key, size FROM cache ORDER BY accessed_at LIMIT 1"
+            ).fetchone()
+            if row is None:
+                break
+            self._conn.execute("DELETE FROM cache WHERE key = ?", (row[0],))
+            count -= 1
+            total -= row[1]
+            self.evictions += 1
+
+    def delete(self, key: str):
+        with self._lock:
+            self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+            self._conn.commit()
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM cache")
+            self._conn.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+
+    def close(self):
+        self._conn.close()
+
+
+class ResultCache:
+    """
+    TTL cache with stale-while-revalidate.
+
+    A fresh entry is returned directly. A stale entry (past its TTL but
+    within `stale_ttl`) is returned immediately while a background thread
+    reloads it. Anything older is loaded synchronously.
+
+    Example:
+        ```python
+        from crewai_amorce.cache import ResultCache, DiskBackend
+        from crewai_amorce.discovery import get_discovery_tools
+
+        cache = ResultCache(ttl=60, backend=DiskBackend("/tmp/ans.db"))
+        tools = get_discovery_tools(cache=cache)
+        ```
+    """
+
+    def __init__(
+        self,
+        ttl: float = 300.0,
+        stale_ttl: float = 600.0,
+        max_entries: int = 1024,
+        max_bytes: int = 8 * 1024 * 1024,
+        backend: Optional[CacheBackend] = None
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            ttl: Seconds an entry is served as fresh
+            stale_ttl: Extra seconds a stale entry may be served while refreshing
+            max_entries: Entry cap for the default in-memory backend
+            max_bytes: Memory cap for the default in-memory backend
+            backend: Storage backend (MemoryBackend if None)
+        """
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.backend = backend if backend is not None else MemoryBackend(max_entries, max_bytes)
+
+        self.hits = 0
+        self.misses = 0
+        self.stale_hits = 0
+        self.refreshes = 0
+        self.refresh_errors = 0
+
+        self._lock = threading.Lock()
+        self._refreshing = set()
+        self._tasks = set()
+
+    def _lookup(self, key: str) -> Tuple[str, Any]:
+        """Classify `key` as 'fresh', 'stale' or 'miss' and count it."""
+        now = time.time()
+        entry = self.backend.get(key)
+
+        if entry is not None:
+            value, expires_at, stale_until = entry
+            if now < expires_at:
+                with self._lock:
+                    self.hits += 1
+                return 'fresh', value
+            if now < stale_until:
+                with self._lock:
+                    self.stale_hits += 1
+                return 'stale', value
+
+        with self._lock:
+            self.misses += 1
+        return 'miss', None
+
+    def get_or_load(
+        self,
+        key: str,
+        loader: Callable[[], Any],
+        ttl: Optional[float] = None
+    ) -> Any:
+        """
+        Return the cached value for `key`, loading it if needed.
+
+        Args:
+            key: Normalized cache key
+            loader: Zero-argument callable producing the value
+            ttl: Per-entry TTL override
+
+        Returns:
+            Cached or freshly loaded value
+        """
+        state, value = self._lookup(key)
+        if state == 'stale':
+            self._refresh_in_background(key, loader, ttl)
+        if state != 'miss':
+            return value
+
+        value = loader()
+        self.set(key, value, ttl)
+        return value
+
+    async def aget_or_load(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: Optional[float] = None
+    ) -> Any:
+        """
+        Async counterpart of `get_or_load`.
+
+        Stale entries are refreshed in a task on the running event loop.
+
+        Args:
+            key: Normalized cache key
+            loader: Zero-argument coroutine function producing the value
+            ttl: Per-entry TTL override
+        """
+        state, value = self._lookup(key)
+        if state == 'stale':
+            self._refresh_in_task(key, loader, ttl)
+        if state != 'miss':
+            return value
+
+        value = await loader()
+        self.set(key, value, ttl)
+        return value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None):
+        """Store a value under `key`."""
+        ttl = self.ttl if ttl is None else ttl
+        now = time.time()
+        self.backend.set(key, (value, now + ttl, now + ttl + self.stale_ttl))
+
+    def invalidate(self, key: str):
+        """Drop a single entry."""
+        self.backend.delete(key)
+
+    def clear(self):
+        """Drop all entries."""
+        self.backend.clear()
+
+    def _start_refresh(self, key: str) -> bool:
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            return True
+
+    def _finish_refresh(self, key: str, ok: bool):
+        with self._lock:
+            self._refreshing.discard(key)
+            if ok:
+                self.refreshes += 1
+            else:
+                # Keep serving the stale value until it ages out
+                self.refresh_errors += 1
+
+    def _refresh_in_background(self, key: str, loader: Callable[[], Any], ttl: Optional[float]):
+        if not self._start_refresh(key):
+            return
+
+        def refresh():
+            try:
+                self.set(key, loader(), ttl)
+            except Exception:
+                self._finish_refresh(key, False)
+            else:
+                self._finish_refresh(key, True)
+
+        threading.Thread(target=refresh, name=f"cache-refresh-{key}", daemon=True).start()
+
+    def _refresh_in_task(self, key: str, loader: Callable[[], Awaitable[Any]], ttl: Optional[float]):
+        if not self._start_refresh(key):
+            return
+
+        async def refresh():
+            try:
+                self.set(key, await loader(), ttl)
+            except Exception:
+                self._finish_refresh(key, False)
+            else:
+                self._finish_refresh(key, True)
+
+        task = asyncio.ensure_future(refresh())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Report cache counters.
+
+        Returns:
+            Dict with hits, stale_hits, misses, refreshes, refresh_errors,
+            evictions, entries and hit_rate.
+        """
+        with self._lock:
+            lookups = self.hits + self.stale_hits + self.misses
+            return {
+                'hits': self.hits,
+                'stale_hits': self.stale_hits,
+                'misses': self.misses,
+                'refreshes': self.refreshes,
+                'refresh_errors': self.refresh_errors,
+                'evictions': self.backend.evictions,
+                'entries': len(self.backend),
+                'hit_rate': (self.hits + self.stale_hits) / lookups if lookups else 0.0,
+            }
@@ -0,0 +1,215 @@
+"""
+Canonical JSON for signing
+
+RFC 8785 (JCS) style serialization: no whitespace, object keys sorted
+by UTF-16 code units, ECMAScript number formatting and minimal string
+escaping, so the same payload always produces the same bytes.
+
+Payloads made only of strings, integers, booleans, None, lists and
+dicts with BMP keys take a fast path through the C `json` encoder.
+`canonical_digest` hashes large payloads chunk by chunk instead of
+building one string.
+"""
+
+import hashlib
+import json
+import math
+from json.encoder import encode_basestring
+from typing import Any, Iterator, Union
+
+
+_CHUNK = 64 * 1024
+
+_fast_encoder = json.JSONEncoder(
+    sort_keys=True,
+    separators=(',', ':'),
+    ensure_ascii=False,
+    allow_nan=False,
+)
+
+
+def _format_float(value: float) -> str:
+    """Format a float as ECMAScript's Number.prototype.toString does."""
+    if math.isnan(value) or math.isinf(value):
+        raise ValueError(f"Canonical JSON cannot represent {value!r}")
+    if value == 0:
+        return '0'
+
+    text = repr(value)
+    if 'e' not in text:
+        # Inside repr()'s positional range both formats agree, except
+        # that ECMAScript drops a trailing ".0"
+        return text[:-2] if text.endswith('.0') else text
+
+    sign = '-' if value < 0 else ''
+    # repr() is the shortest round-tripping form, as in ECMAScript
+    mantissa, _, exponent = repr(abs(value)).partition('e')
+    whole, _, fraction = mantissa.partition('.')
+    digits = (whole + fraction).lstrip('0')
+    point = len(whole) + int(exponent or 0) - (len(whole + fraction) - len(digits))
+    digits = digits.rstrip('0')
+    k = len(digits)
+
+    if k <= point <= 21:
+        return sign + digits + '0' * (point - k)
+    if 0 < point <= 21:
+        return sign + digits[:point] + '.' + digits[point:]
+    if -6 < point <= 0:
+        return sign + '0.' + '0' * -point + digits
+
+    e = point - 1
+    exp = f"e{'+' if e >= 0 else '-'}{abs(e)}"
+    if k == 1:
+        return sign + digits + exp
+    return sign + digits[0] + '.' + digits[1:] + exp
+
+
+def _sort_key(key: str) -> bytes:
+    return key.encode('utf-16-be', 'surrogatepass')
+
+
+def _is_simple(value: Any) -> bool:
+    """Whether the C encoder's output is already canonical for `value`."""
+    if isinstance(value, str) or value is None or isinstance(value, (bool, int)):
+        return True
+    if isinstance(value, dict):
+        for key, item in value.items():
+            # Code point order equals UTF-16 order below the surrogates
+            if not isinstance(key, str) or (key and max(key) >= '\ud800'):
+                return False
+            if not _is_simple(item):
+                return False
+        return True
+    if isinstance(value, (list, tuple)):
+        return all(_is_simple(item) for item in value)
+    return False
+
+
+def _small_simple(value: Any, budget: int) -> bool:
+    """Whether `value` is simple and encodes to roughly `budget` chars or less."""
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            budget -= len(item) + 2
+        elif item is None or isinstance(item, (bool, int)):
+            budget -= 8
+        elif isinstance(item, dict):
+            for key in item:
+                if not isinstance(key, str) or (key and max(key) >= '\ud800'):
+                    return False
+                budget -= len(key) + 3
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            budget -= len(item) + 2
+            stack.extend(item)
+        else:
+            return False
+        if budget < 0:
+            return False
+    return True
+
+
+def iter_canonical(value: Any) -> Iterator[str]:
+    """
+    Yield the canonical encoding of `value` in pieces.
+
+    Simple subtrees smaller than one hashing chunk are encoded in one
+    go by the C encoder; everything else is walked piece by piece.
+
+    Raises:
+        TypeError: Unsupported type or non-string object key
+        ValueError: NaN or infinity
+    """
+    if isinstance(value, (dict, list, tuple)) and _small_simple(value, _CHUNK):
+        yield _fast_encoder.encode(value)
+    elif isinstance(value, str):
+        yield encode_basestring(value)
+    elif value is None:
+        yield 'null'
+    elif value is True:
+        yield 'true'
+    elif value is False:
+        yield 'false'
+    elif isinstance(value, int):
+        yield int.__repr__(value)
+    elif isinstance(value, float):
+        yield _format_float(value)
+    elif isinstance(value, dict):
+        for key in value:
+            if not isinstance(key, str):
+                raise TypeError(f"Canonical JSON object keys must be strings, not {type(key).__name__}")
+        yield '{'
+        for i, key in enumerate(sorted(value, key=_sort_key)):
+            if i:
+                yield ','
+            yield encode_basestring(key)
+            yield ':'
+            yield from iter_canonical(value[key])
+        yield '}'
+    elif isinstance(value, (list, tuple)):
+        yield '['
+        for i, item in enumerate(value):
+            if i:
+                yield ','
+            yield from iter_canonical(item)
+        yield ']'
+    else:
+        raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def canonical_dumps(value: Any) -> str:
+    """Canonical JSON text for `value`."""
+    if _is_simple(value):
+        return _fast_encoder.encode(value)
+    return ''.join(iter_canonical(value))
+
+
+def canonical_json(value: Any) -> bytes:
+    """Canonical JSON for `value`, UTF-8 encoded."""
+    return canonical_dumps(value).encode('utf-8')
+
+
+def canonical_digest(value: Any, algorithm: str = 'sha256', prefix: bytes = b'') -> bytes:
+    """
+    Hash the canonical encoding of `value` without materializing it.
+
+    Pieces are buffered into ~64 KiB chunks before hashing, so memory
+    stays flat however large the payload is.
+
+    Args:
+        value: JSON-compatible payload
+        algorithm: hashlib algorithm name
+        prefix: Bytes hashed before the payload (e.g. a domain tag)
+
+    Returns:
+        Raw digest bytes
+    """
+    hasher = hashlib.new(algorithm)
+    hasher.update(prefix)
+
+    buffer = []
+    size = 0
+    for piece in iter_canonical(value):
+        if len(piece) >= _CHUNK:
+            # Large strings: hash slice by slice instead of copying whole
+            hasher.update(''.join(buffer).encode('utf-8'))
+            buffer.clear()
+            size = 0
+            for start in range(0, len(piece), _CHUNK):
+                hasher.update(piece[start:start + _CHUNK].encode('utf-8'))
+            continue
+
+        buffer.append(piece)
+        size += len(piece)
+        if size >= _CHUNK:
+            hasher.update(''.join(buffer).encode('utf-8'))
+            buffer.clear()
+            size = 0
+    hasher.update(''.join(buffer).encode('utf-8'))
+    return hasher.digest()
+
+
+def sign_canonical(identity: Any, value: Union[dict, list]) -> str:
+    """Sign the canonical encoding of a payload with an Amorce identity."""
+    return identity.sign(canonical_dumps(value))
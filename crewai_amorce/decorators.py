@@ -14,7 +14,11 @@ def secure_crew(
     identity: Optional[Any] = None,
     hitl_required: Optional[List[str]] = None,
     a2a_compatible: bool = True,
-    verbose: bool = False
+    verbose: bool = False,
+    keystore: Optional[Any] = None,
+    identity_name: str = 'crew',
+    audit_log: Optional[Any] = None,
+    metrics: Optional[Any] = None
 ):
     """
     Decorator to secure an entire CrewAI crew.
@@ -35,6 +39,11 @@ def secure_crew(
         hitl_required: Action names requiring human approval
         a2a_compatible: Use A2A message format
         verbose: Show security logs
+        keystore: Keystore to load a stable crew identity from
+        identity_name: Name of the crew identity in the keystore
+        audit_log: AuditLog recording each signed kickoff
+        metrics: MetricsSink timing kickoff stages (the process default,
+            a no-op unless enabled, if None)
     
     Returns:
         Secured crew with Amorce integration
@@ -42,17 +51,17 @@ def secure_crew(
     
     def decorator(crew):
         """Actual decorator function."""
-        from amorce import IdentityManager, AmorceClient
+        from amorce import IdentityManager
+        from crewai_amorce.registry import get_client
         
         # Generate or load identity
-        crew_identity = identity or IdentityManager.generate()
+        crew_identity = identity
+        if crew_identity is None and keystore is not None:
+            crew_identity = keystore.identity(identity_name)
+        crew_identity = crew_identity or IdentityManager.generate()
         
-        # Initialize Amorce client
-        amorce_client = AmorceClient(
-            crew_identity,
-            directory_url='https://directory.amorce.io',
-            orchestrator_url='https://api.amorce.io'
-        )
+        # Shared Amorce client (one connection pool per process)
+        amorce_client = get_client(crew_identity)
         
         # Add Amorce metadata to crew
         crew.amorce_identity = crew_identity
@@ -75,20 +84,38 @@ def secure_crew(
                 print(f"   Tasks: {len(crew.tasks)}")
                 print(f"   HITL required for: {crew.hitl_required}")
             
+            from crewai_amorce.metrics import KICKOFF_STAGE_SECONDS, KICKOFFS_TOTAL, get_default_metrics
+            
+            sink = metrics if metrics is not None else get_default_metrics()
+            timer = sink.timer(KICKOFF_STAGE_SECONDS, KICKOFFS_TOTAL, crew=crew.crew_id)
+            
             # Sign the kickoff
-            import json
+            from crewai_amorce.canonical import canonical_dumps
             kickoff_data = {
                 'crew_id': crew.crew_id,
                 'agents': [agent.role for agent in crew.agents],
                 'tasks': [task.description[:50] for task in crew.tasks]
             }
-            signature = crew_identity.sign(json.dumps(kickoff_data, sort_keys=True))
+            message = canonical_dumps(kickoff_data)
+            timer.mark('serialize')
+            signature = crew_identity.sign(message)
+            timer.mark('sign')
+            if audit_log is not None:
+                audit_log.append('kickoff', crew.crew_id, kickoff_data, proof={'signature': signature})
+                timer.mark('audit')
             
             if verbose:
                 print(f"   Kickoff signature: {signature[:50]}...")
             
             # Execute original kickoff
-            result = original_kickoff(*args, **kwargs)
+            timer.skip()
+            try:
+                result = original_kickoff(*args, **kwargs)
+            except Exception:
+                timer.finish('error')
+                raise
+            timer.mark('kickoff')
+            timer.finish()
             
             # Return with security metadata
             if a2a_compatible:
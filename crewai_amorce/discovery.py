@@ -4,8 +4,59 @@ Amorce Discovery Tools for CrewAI
 Enables CrewAI crews to discover other AI agents via Amorce ANS.
 """
 
-from typing import Optional, List, Any
-import requests
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, asdict
+from typing import Optional, List, Any, Dict, Iterable, Iterator, AsyncIterator
+
+from crewai_amorce.transport import (
+    HTTPTransport,
+    AsyncHTTPTransport,
+    get_default_transport,
+    get_default_async_transport,
+)
+from crewai_amorce.cache import ResultCache
+from crewai_amorce.singleflight import SingleFlight, get_default_singleflight
+
+
+DEFAULT_TRUST_URL = "https://amorce-trust-api-425870997313.us-central1.run.app"
+
+
+def normalize_query(query: str) -> str:
+    """Normalize a search query for use as a cache key."""
+    return " ".join(query.lower().split())
+
+
+@dataclass
+class AgentRecord:
+    """Structured ANS search result."""
+    
+    agent_id: str
+    name: str = "Unknown"
+    category: Optional[str] = None
+    description: Optional[str] = None
+    endpoint: Optional[str] = None
+    capabilities: List[str] = field(default_factory=list)
+    trust_score: Optional[float] = None
+    score: Optional[float] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a plain dict."""
+        return asdict(self)
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'AgentRecord':
+        """Parse an agent record from the Trust API."""
+        return cls(
+            agent_id=data['agent_id'],
+            name=data.get('name') or "Unknown",
+            category=data.get('category'),
+            description=data.get('description'),
+            endpoint=data.get('endpoint'),
+            capabilities=list(data.get('capabilities') or []),
+            trust_score=data.get('trust_score'),
+            score=data.get('score')
+        )
 
 
 class SearchAgentsTool:
@@ -23,33 +74,167 @@ class SearchAgentsTool:
         "Returns a list of agents with their capabilities and trust scores."
     )
     
-    def __init__(self, trust_url: Optional[str] = None):
-        self.trust_url = trust_url or "https://amorce-trust-api-425870997313.us-central1.run.app"
+    def __init__(
+        self,
+        trust_url: Optional[str] = None,
+        transport: Optional[HTTPTransport] = None,
+        cache: Optional[ResultCache] = None,
+        async_transport: Optional[AsyncHTTPTransport] = None,
+        singleflight: Optional[SingleFlight] = None,
+        local_index: Optional[Any] = None
+    ):
+        """
+        Initialize search tool.
+        
+        Args:
+            trust_url: Trust API URL
+            transport: Pooled HTTP transport
+            cache: Optional result cache
+            async_transport: Pooled async transport for `arun`
+            singleflight: Coalescer for identical in-flight requests
+            local_index: Optional `LocalAgentIndex`; queries it matches
+                are answered locally without a network round trip
+        """
+        self.trust_url = trust_url or DEFAULT_TRUST_URL
+        self.transport = transport or get_default_transport()
+        self.async_transport = async_transport or get_default_async_transport()
+        self.cache = cache
+        self.singleflight = singleflight or get_default_singleflight()
+        self.local_index = local_index
     
-    def run(self, query: str) -> str:
-        """Search for agents matching the query."""
-        try:
-            response = requests.get(
-                f"{self.trust_url}/api/v1/ans/search",
-                params={"q": query, "limit": 5}
+    def _search_local(self, query: str) -> Optional[dict]:
+        """Answer from the local index, or None to fall back to the API."""
+        if self.local_index is None:
+            return None
+        results = self.local_index.search(query, limit=5)
+        return {"results": results} if results else None
+    
+    def _fetch_page(self, query: str, cursor: Optional[str] = None, limit: int = 5) -> dict:
+        """Fetch one raw page of search results, coalesced and cached if configured."""
+        key = self._key(query, cursor, limit)
+        params = {"q": query, "limit": limit}
+        if cursor:
+            params["cursor"] = cursor
+        
+        def fetch():
+            return self.transport.get_json(f"{self.trust_url}/api/v1/ans/search", params=params)
+        
+        def load():
+            return self.singleflight.do(key, fetch)
+        
+        if self.cache is None:
+            return load()
+        return self.cache.get_or_load(key, load)
+    
+    async def _afetch_page(self, query: str, cursor: Optional[str] = None, limit: int = 5) -> dict:
+        """Async counterpart of `_fetch_page`."""
+        key = self._key(query, cursor, limit)
+        params = {"q": query, "limit": limit}
+        if cursor:
+            params["cursor"] = cursor
+        
+        def fetch():
+            return self.async_transport.get_json(
+                f"{self.trust_url}/api/v1/ans/search", params=params
             )
-            response.raise_for_status()
-            data = response.json()
-            
-            if not data.get("results"):
-                return "No agents found for this query."
+        
+        async def load():
+            return await self.singleflight.ado(key, fetch)
+        
+        if self.cache is None:
+            return await load()
+        return await self.cache.aget_or_load(key, load)
+    
+    def _key(self, query: str, cursor: Optional[str], limit: int) -> str:
+        """Cache and coalescing key for a result page."""
+        return f"{self.trust_url}|search|{normalize_query(query)}|{cursor or ''}|{limit}"
+    
+    def iter_search(
+        self,
+        query: str,
+        page_size: int = 20,
+        max_results: Optional[int] = None
+    ) -> Iterator[AgentRecord]:
+        """
+        Stream search results page by page.
+        
+        Pages are requested lazily with the API's `next_cursor`, so only
+        the pages a caller actually consumes are fetched.
+        
+        Args:
+            query: Natural language description of what is needed
+            page_size: Results requested per page
+            max_results: Stop after this many records (all if None)
             
-            # Format results
-            results = []
-            for i, agent in enumerate(data["results"][:5], 1):
-                results.append(
-                    f"{i}. {agent['name']} (Trust: {agent['trust_score']})\n"
-                    f"   Category: {agent.get('category', 'N/A')}\n"
-                    f"   ID: {agent['agent_id']}"
-                )
+        Yields:
+            AgentRecord for each result, best first
+        """
+        cursor = None
+        count = 0
+        
+        while True:
+            page = self._fetch_page(query, cursor, page_size)
+            for agent in page.get("results", []):
+                if max_results is not None and count >= max_results:
+                    return
+                yield AgentRecord.from_dict(agent)
+                count += 1
             
-            return f"Found {len(data['results'])} agents:\n\n" + "\n\n".join(results)
+            cursor = page.get("next_cursor")
+            if not cursor or not page.get("results"):
+                return
+    
+    async def aiter_search(
+        self,
+        query: str,
+        page_size: int = 20,
+        max_results: Optional[int] = None
+    ) -> AsyncIterator[AgentRecord]:
+        """Async counterpart of `iter_search`."""
+        cursor = None
+        count = 0
+        
+        while True:
+            page = await self._afetch_page(query, cursor, page_size)
+            for agent in page.get("results", []):
+                if max_results is not None and count >= max_results:
+                    return
+                yield AgentRecord.from_dict(agent)
+                count += 1
             
+            cursor = page.get("next_cursor")
+            if not cursor or not page.get("results"):
+                return
+    
+    def _format(self, data: dict) -> str:
+        """Format the first page of search results for the LLM."""
+        records = [AgentRecord.from_dict(agent) for agent in data.get("results", [])[:5]]
+        if not records:
+            return "No agents found for this query."
+        
+        # Format results
+        results = []
+        for i, agent in enumerate(records, 1):
+            results.append(
+                f"{i}. {agent.name} (Trust: {agent.trust_score})\n"
+                f"   Category: {agent.category or 'N/A'}\n"
+                f"   ID: {agent.agent_id}"
+            )
+        
+        total = data.get("total", len(data["results"]))
+        return f"Found {total} agents:\n\n" + "\n\n".join(results)
+    
+    def run(self, query: str) -> str:
+        """Search for agents matching the query."""
+        try:
+            return self._format(self._search_local(query) or self._fetch_page(query))
+        except Exception as e:
+            return f"Error searching agents: {str(e)}"
+    
+    async def arun(self, query: str) -> str:
+        """Search for agents without blocking the event loop."""
+        try:
+            return self._format(self._search_local(query) or await self._afetch_page(query))
         except Exception as e:
             return f"Error searching agents: {str(e)}"
     
@@ -68,41 +253,167 @@ class GetAgentTool:
         "Input should be the agent_id from search results."
     )
     
-    def __init__(self, trust_url: Optional[str] = None):
-        self.trust_url = trust_url or "https://amorce-trust-api-425870997313.us-central1.run.app"
+    def __init__(
+        self,
+        trust_url: Optional[str] = None,
+        transport: Optional[HTTPTransport] = None,
+        cache: Optional[ResultCache] = None,
+        async_transport: Optional[AsyncHTTPTransport] = None,
+        singleflight: Optional[SingleFlight] = None
+    ):
+        self.trust_url = trust_url or DEFAULT_TRUST_URL
+        self.transport = transport or get_default_transport()
+        self.async_transport = async_transport or get_default_async_transport()
+        self.cache = cache
+        self.singleflight = singleflight or get_default_singleflight()
+    
+    def _get(self, agent_id: str) -> dict:
+        """Fetch a raw agent record, coalesced and cached if configured."""
+        agent_id = agent_id.strip()
+        key = self._key(agent_id)
+        
+        def fetch():
+            return self.transport.get_json(f"{self.trust_url}/api/v1/agents/{agent_id}")
+        
+        def load():
+            return self.singleflight.do(key, fetch)
+        
+        if self.cache is None:
+            return load()
+        return self.cache.get_or_load(key, load)
+    
+    async def _aget(self, agent_id: str) -> dict:
+        """Async counterpart of `_get`."""
+        agent_id = agent_id.strip()
+        key = self._key(agent_id)
+        
+        def fetch():
+            return self.async_transport.get_json(f"{self.trust_url}/api/v1/agents/{agent_id}")
+        
+        async def load():
+            return await self.singleflight.ado(key, fetch)
+        
+        if self.cache is None:
+            return await load()
+        return await self.cache.aget_or_load(key, load)
+    
+    def _key(self, agent_id: str) -> str:
+        """Cache and coalescing key for an agent_id."""
+        return f"{self.trust_url}|agent|{agent_id}"
+    
+    def _format(self, agent: dict) -> str:
+        """Format an agent record for the LLM."""
+        return (
+            f"Name: {agent.get('name', 'Unknown')}\n"
+            f"ID: {agent.get('agent_id')}\n"
+            f"Category: {agent.get('category', 'N/A')}\n"
+            f"Description: {agent.get('description', 'No description')}\n"
+            f"Endpoint: {agent.get('endpoint', 'N/A')}\n"
+            f"Capabilities: {', '.join(agent.get('capabilities', [])) or 'N/A'}\n"
+            f"Trust Score: {agent.get('trust_score', 'N/A')}"
+        )
     
     def run(self, agent_id: str) -> str:
         """Get agent details."""
         try:
-            response = requests.get(f"{self.trust_url}/api/v1/agents/{agent_id}")
-            response.raise_for_status()
-            agent = response.json()
-            
-            return (
-                f"Name: {agent.get('name', 'Unknown')}\n"
-                f"ID: {agent.get('agent_id')}\n"
-                f"Category: {agent.get('category', 'N/A')}\n"
-                f"Description: {agent.get('description', 'No description')}\n"
-                f"Endpoint: {agent.get('endpoint', 'N/A')}\n"
-                f"Capabilities: {', '.join(agent.get('capabilities', [])) or 'N/A'}\n"
-                f"Trust Score: {agent.get('trust_score', 'N/A')}"
-            )
-            
+            return self._format(self._get(agent_id))
+        except Exception as e:
+            return f"Error getting agent: {str(e)}"
+    
+    async def arun(self, agent_id: str) -> str:
+        """Get agent details without blocking the event loop."""
+        try:
+            return self._format(await self._aget(agent_id))
         except Exception as e:
             return f"Error getting agent: {str(e)}"
     
+    def get_agents_many(
+        self,
+        agent_ids: Iterable[str],
+        max_concurrency: int = 8
+    ) -> List[dict]:
+        """
+        Fetch several agent records concurrently.
+        
+        Requests run on a bounded thread pool over the shared transport.
+        
+        Args:
+            agent_ids: Agent IDs, e.g. from search results
+            max_concurrency: Max requests in flight at once
+            
+        Returns:
+            Records in input order. A failed lookup yields
+            `{'agent_id': ..., 'error': ...}` instead of raising.
+        """
+        agent_ids = list(agent_ids)
+        if not agent_ids:
+            return []
+        
+        def fetch(agent_id):
+            try:
+                return self._get(agent_id)
+            except Exception as e:
+                return {'agent_id': agent_id, 'error': str(e)}
+        
+        workers = max(1, min(max_concurrency, len(agent_ids)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(fetch, agent_ids))
+    
+    async def aget_agents_many(
+        self,
+        agent_ids: Iterable[str],
+        max_concurrency: int = 8
+    ) -> List[dict]:
+        """
+        Async counterpart of `get_agents_many`.
+        
+        Args:
+            agent_ids: Agent IDs, e.g. from search results
+            max_concurrency: Max requests in flight at once
+            
+        Returns:
+            Records in input order, with error dicts for failed lookups.
+        """
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        
+        async def fetch(agent_id):
+            async with semaphore:
+                try:
+                    return await self._aget(agent_id)
+                except Exception as e:
+                    return {'agent_id': agent_id, 'error': str(e)}
+        
+        return list(await asyncio.gather(*(fetch(a) for a in agent_ids)))
+    
     def __call__(self, agent_id: str) -> str:
         return self.run(agent_id)
 
 
-def get_discovery_tools(trust_url: Optional[str] = None) -> List[Any]:
+def get_discovery_tools(
+    trust_url: Optional[str] = None,
+    transport: Optional[HTTPTransport] = None,
+    cache: Optional[ResultCache] = None,
+    async_transport: Optional[AsyncHTTPTransport] = None,
+    singleflight: Optional[SingleFlight] = None
+) -> List[Any]:
     """
     Get all Amorce discovery tools for CrewAI.
     
+    Both tools share one pooled transport (the process-wide default
+    unless one is passed in), one async transport for `arun`, one
+    SingleFlight for coalescing identical in-flight requests, and, if
+    given, one result cache.
+    
     Returns:
         List of tools: [SearchAgentsTool, GetAgentTool]
     """
+    shared = {
+        'transport': transport or get_default_transport(),
+        'cache': cache,
+        'async_transport': async_transport or get_default_async_transport(),
+        'singleflight': singleflight or get_default_singleflight(),
+    }
     return [
-        SearchAgentsTool(trust_url),
-        GetAgentTool(trust_url),
+        SearchAgentsTool(trust_url, **shared),
+        GetAgentTool(trust_url, **shared),
     ]
@@ -0,0 +1,453 @@
+"""
+Streaming offer inbox
+
+Receives signed offer envelopes from a pluggable transport, verifies
+them in pipelined batches and hands them out by priority (highest
+price, highest buyer trust, arrival order or a custom key). Every
+stage is bounded: when the agent falls behind, the inbox stops reading
+from the transport and the backpressure reaches the senders instead
+of growing memory.
+"""
+
+import asyncio
+import heapq
+import itertools
+import json
+import threading
+from typing import Optional, Any, Callable, Dict, List, Union
+
+from crewai_amorce.a2a import A2AEnvelope
+
+
+class OfferTransport:
+    """Source of raw offer envelopes (dicts) for an OfferInbox."""
+
+    async def start(self):
+        """Prepare to receive (called by `OfferInbox.start`)."""
+
+    async def receive(self) -> Optional[Dict[str, Any]]:
+        """Next envelope dict, or None once closed and drained."""
+        raise NotImplementedError
+
+    async def close(self):
+        """Stop accepting envelopes; must not block."""
+
+
+class _QueueTransport(OfferTransport):
+    """Bounded read-ahead queue with a non-blocking close."""
+
+    def __init__(self, maxsize: int):
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize)
+        self._closed = False
+
+    def qsize(self) -> int:
+        return self._queue.qsize()
+
+    async def receive(self) -> Optional[Dict[str, Any]]:
+        if self._closed and self._queue.empty():
+            return None
+        return await self._queue.get()
+
+    async def close(self):
+        self._closed = True
+        try:
+            # Wake a receiver waiting on an empty queue
+            self._queue.put_nowait(None)
+        except asyncio.QueueFull:
+            pass
+
+
+class LocalTransport(_QueueTransport):
+    """
+    In-process transport backed by a bounded asyncio queue.
+
+    `send()` waits while the queue is full, so producers feel the
+    inbox's backpressure directly.
+    """
+
+    def __init__(self, maxsize: int = 64):
+        super().__init__(maxsize)
+
+    async def send(self, envelope: Union[A2AEnvelope, Dict[str, Any]]):
+        """Deliver an envelope, waiting while the transport is full."""
+        if self._closed:
+            raise RuntimeError("Transport is closed")
+        if isinstance(envelope, A2AEnvelope):
+            envelope = envelope.to_dict()
+        await self._queue.put(envelope)
+
+
+class SocketTransport(_QueueTransport):
+    """
+    Newline-delimited JSON envelopes over TCP.
+
+    Each connection is read only as fast as the inbox accepts offers;
+    a slow agent fills the TCP window and blocks the senders' writes.
+
+    Example:
+        ```python
+        inbox = OfferInbox(SocketTransport(port=7400))
+        await inbox.start()
+
+        # elsewhere
+        await send_envelopes("127.0.0.1", 7400, envelopes)
+        ```
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, buffer: int = 16):
+        """
+        Initialize socket transport.
+
+        Args:
+            host: Interface to listen on
+            port: TCP port (0 picks a free one)
+            buffer: Envelopes read ahead across all connections
+        """
+        super().__init__(buffer)
+        self.host = host
+        self.port = port
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self):
+        """Start listening."""
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            async for line in reader:
+                if not line.strip():
+                    continue
+                try:
+                    envelope = json.loads(line)
+                except ValueError:
+                    continue
+                # Blocks while the inbox is full; the socket stops being read
+                await self._queue.put(envelope)
+        finally:
+            writer.close()
+
+    async def close(self):
+        if self._server is not None:
+            self._server.close()
+        await super().close()
+
+
+async def send_envelopes(host: str, port: int, envelopes: List[Union[A2AEnvelope, Dict[str, Any]]]):
+    """Send envelopes to a SocketTransport, honouring its backpressure."""
+    _, writer = await asyncio.open_connection(host, port)
+    try:
+        for envelope in envelopes:
+            if isinstance(envelope, A2AEnvelope):
+                line = envelope.to_bytes(format="json")
+            else:
+                line = json.dumps(envelope, separators=(",", ":")).encode("utf-8")
+            writer.write(line + b"\n")
+            await writer.drain()
+    finally:
+        writer.close()
+        await writer.wait_closed()
+
+
+def price_priority(offer: Dict[str, Any]) -> float:
+    """Highest price first."""
+    return -float(offer.get("price") or 0)
+
+
+def fifo_priority(offer: Dict[str, Any]) -> float:
+    """Arrival order."""
+    return 0.0
+
+
+class OfferInbox:
+    """
+    Bounded, verified, prioritized stream of incoming offers.
+
+    Three stages run as tasks on one event loop:
+
+    1. a reader pulls envelopes from the transport into a small queue;
+    2. a verifier takes them in batches and checks signatures (and
+       replays) on a worker thread while the reader keeps reading;
+    3. verified offers wait in a priority buffer of at most `maxsize`.
+
+    When the buffer is full the verifier waits, the read-ahead queue
+    fills and the reader stops pulling from the transport.
+
+    Example:
+        ```python
+        from crewai_amorce.inbox import OfferInbox, LocalTransport
+
+        transport = LocalTransport()
+        inbox = OfferInbox(transport, policy="price")
+        await inbox.start()
+
+        offer = await inbox.get()
+        print(offer["sender_id"], offer["price"])
+        ```
+    """
+
+    def __init__(
+        self,
+        transport: OfferTransport,
+        verifier: Optional[Any] = None,
+        policy: Union[str, Callable[[Dict[str, Any]], Any]] = "price",
+        maxsize: int = 256,
+        batch_size: int = 32,
+        trust_lookup: Optional[Callable[[str], Optional[float]]] = None
+    ):
+        """
+        Initialize inbox.
+
+        Args:
+            transport: Offer source
+            verifier: EnvelopeVerifier (directory keys and a ReplayGuard if None)
+            policy: "price", "trust", "fifo" or a key function (lower
+                values are served first)
+            maxsize: Verified offers buffered before backpressure
+            batch_size: Envelopes verified per batch
+            trust_lookup: Buyer trust score by agent ID, for the "trust"
+                policy (Trust Directory record if None)
+        """
+        if verifier is None:
+            from crewai_amorce.replay import ReplayGuard
+            from crewai_amorce.verification import EnvelopeVerifier
+            verifier = EnvelopeVerifier(replay_guard=ReplayGuard())
+
+        self.transport = transport
+        self.verifier = verifier
+        self.maxsize = maxsize
+        self.batch_size = batch_size
+        self.trust_lookup = trust_lookup
+        self._priority = self._make_priority(policy)
+
+        self.received = 0
+        self.accepted = 0
+        self.rejected = 0
+        self.backpressure_waits = 0
+        self.high_water = 0
+
+        self._heap: List[Any] = []
+        self._seq = itertools.count()
+        self._raw: Optional[asyncio.Queue] = None
+        self._cond: Optional[asyncio.Condition] = None
+        self._tasks: List[asyncio.Task] = []
+        self._done = False
+        self._error: Optional[BaseException] = None
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _make_priority(self, policy) -> Callable[[Dict[str, Any]], Any]:
+        if callable(policy):
+            return policy
+        if policy == "price":
+            return price_priority
+        if policy == "fifo":
+            return fifo_priority
+        if policy == "trust":
+            return lambda offer: -(self._trust(offer["sender_id"]) or 0.0)
+        raise ValueError(f"Unknown inbox policy: {policy!r}")
+
+    def _trust(self, agent_id: str) -> Optional[float]:
+        if self.trust_lookup is None:
+            from crewai_amorce.cache import ResultCache
+            from crewai_amorce.discovery import GetAgentTool
+
+            agents = GetAgentTool(cache=ResultCache(ttl=600))
+
+            def lookup(agent_id: str) -> Optional[float]:
+                try:
+                    return agents._get(agent_id).get("trust_score")
+                except Exception:
+                    return None
+
+            self.trust_lookup = lookup
+        return self.trust_lookup(agent_id)
+
+    async def start(self):
+        """Start the transport and the pipeline tasks on the running loop."""
+        await self.transport.start()
+        self.loop = asyncio.get_running_loop()
+        self._raw = asyncio.Queue(self.batch_size * 2)
+        self._cond = asyncio.Condition()
+        self._tasks = [
+            asyncio.ensure_future(self._read()),
+            asyncio.ensure_future(self._verify()),
+        ]
+        for task in self._tasks:
+            task.add_done_callback(self._task_done)
+    
+    def _task_done(self, task: asyncio.Task):
+        """Surface a crashed pipeline task to `get()` instead of hanging."""
+        if task.cancelled() or task.exception() is None:
+            return
+        self._error = task.exception()
+        asyncio.ensure_future(self._wake())
+    
+    async def _wake(self):
+        async with self._cond:
+            self._done = True
+            self._cond.notify_all()
+
+    async def _read(self):
+        while True:
+            envelope = await self.transport.receive()
+            await self._raw.put(envelope)
+            if envelope is None:
+                return
+            self.received += 1
+
+    def _check(self, batch: List[Dict[str, Any]]) -> List[Any]:
+        """Verify a batch and compute priorities (runs on a worker thread)."""
+        ready = []
+        for result in self.verifier.verify_batch(batch):
+            if not result.valid:
+                continue
+            envelope = result.envelope
+            offer = dict(envelope.message) if isinstance(envelope.message, dict) else {"message": envelope.message}
+            offer.update({
+                "sender_id": envelope.sender_id,
+                "signature": envelope.signature,
+                "timestamp": envelope.timestamp,
+            })
+            try:
+                priority = self._priority(offer)
+            except Exception:
+                # Validly signed but unrankable (e.g. a non-numeric price): reject it
+                continue
+            ready.append((priority, offer))
+        return ready
+
+    async def _verify(self):
+        loop = asyncio.get_running_loop()
+        finished = False
+        while not finished:
+            batch = [await self._raw.get()]
+            while len(batch) < self.batch_size and not self._raw.empty():
+                batch.append(self._raw.get_nowait())
+            if batch[-1] is None:
+                finished = True
+                batch.pop()
+
+            ready = await loop.run_in_executor(None, self._check, batch) if batch else []
+            self.rejected += len(batch) - len(ready)
+
+            for priority, offer in ready:
+                async with self._cond:
+                    if len(self._heap) >= self.maxsize:
+                        self.backpressure_waits += 1
+                        await self._cond.wait_for(lambda: len(self._heap) < self.maxsize)
+                    heapq.heappush(self._heap, (priority, next(self._seq), offer))
+                    self.accepted += 1
+                    self.high_water = max(self.high_water, len(self._heap))
+                    self._cond.notify_all()
+
+        async with self._cond:
+            self._done = True
+            self._cond.notify_all()
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        Take the highest-priority verified offer.
+
+        Returns:
+            Offer dict with `sender_id`, `signature` and `timestamp`
+            added, or None once the transport is closed and drained
+
+        Raises:
+            TimeoutError: No offer within `timeout`
+            RuntimeError: The inbox pipeline failed
+        """
+        async def take():
+            async with self._cond:
+                await self._cond.wait_for(lambda: self._heap or self._done)
+                if not self._heap:
+                    if self._error is not None:
+                        raise RuntimeError(f"Offer inbox stopped: {self._error!r}") from self._error
+                    return None
+                offer = heapq.heappop(self._heap)[2]
+                self._cond.notify_all()
+                return offer
+
+        try:
+            return await asyncio.wait_for(take(), timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError("No offer received")
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> Dict[str, Any]:
+        offer = await self.get()
+        if offer is None:
+            raise StopAsyncIteration
+        return offer
+
+    def run_in_background(self, timeout: float = 30.0) -> 'OfferInbox':
+        """
+        Run the inbox on a private event loop in a daemon thread.
+
+        For synchronous callers such as `SecureAgent.receive_offer`.
+
+        Args:
+            timeout: Seconds to wait for the inbox to start
+
+        Raises:
+            TimeoutError: The inbox did not start within `timeout`
+            Exception: Whatever `start()` raised (e.g. a socket bind error)
+        """
+        started = threading.Event()
+        failure: List[BaseException] = []
+
+        def run():
+            loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(loop)
+            try:
+                loop.run_until_complete(self.start())
+            except BaseException as e:
+                failure.append(e)
+                loop.close()
+                return
+            finally:
+                started.set()
+            loop.run_forever()
+
+        threading.Thread(target=run, name="amorce-offer-inbox", daemon=True).start()
+        if not started.wait(timeout):
+            raise TimeoutError("Offer inbox did not start")
+        if failure:
+            raise failure[0]
+        return self
+
+    def get_sync(self, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Blocking `get` for an inbox started with `run_in_background`."""
+        if self.loop is None:
+            raise RuntimeError("OfferInbox is not running")
+        return asyncio.run_coroutine_threadsafe(self.get(timeout), self.loop).result()
+
+    async def close(self):
+        """Close the transport and stop the pipeline; unverified envelopes are dropped."""
+        await self.transport.close()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        async with self._cond:
+            self._done = True
+            self._cond.notify_all()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Report pipeline counters.
+
+        Returns:
+            Dict with `received`, `accepted`, `rejected`, `queued`
+            (verified offers waiting), `read_ahead`, `high_water` and
+            `backpressure_waits`
+        """
+        return {
+            "received": self.received,
+            "accepted": self.accepted,
+            "rejected": self.rejected,
+            "queued": len(self._heap),
+            "read_ahead": self._raw.qsize() if self._raw is not None else 0,
+            "high_water": self.high_water,
+            "backpressure_waits": self.backpressure_waits,
+        }
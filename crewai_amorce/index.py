@@ -0,0 +1,387 @@
+"""
+Local ANS search index
+
+Keeps an incrementally synced snapshot of Trust Directory agent records
+and answers capability searches from a BM25 inverted index, without a
+network round trip. The index lives in one compact file that worker
+processes memory-map and share.
+"""
+
+import json
+import math
+import mmap
+import os
+import re
+import struct
+import tempfile
+import threading
+import time
+from collections import Counter
+from typing import Optional, List, Dict, Any, Iterable
+
+from crewai_amorce.transport import HTTPTransport, get_default_transport
+from crewai_amorce.discovery import DEFAULT_TRUST_URL
+
+
+_MAGIC = b"AMIX"
+_VERSION = 1
+
+# magic, version, n_docs, n_terms, avgdl, max_trust, cursor_len
+_HEADER = struct.Struct("<4sHIIddI")
+# string offset, string length, postings offset, document frequency
+_TERM = struct.Struct("<IIII")
+# record offset, record length, document length, trust score
+_DOC = struct.Struct("<IIIf")
+# document number, term frequency
+_POSTING = struct.Struct("<IH")
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+INDEXED_FIELDS = ('name', 'category', 'description', 'capabilities')
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase alphanumeric terms."""
+    return _TOKEN_RE.findall(text.lower())
+
+
+def _document_terms(record: Dict[str, Any]) -> List[str]:
+    terms = []
+    for field in INDEXED_FIELDS:
+        value = record.get(field)
+        if isinstance(value, (list, tuple)):
+            value = " ".join(str(v) for v in value)
+        if value:
+            terms.extend(tokenize(str(value)))
+    return terms
+
+
+def build_index(records: Iterable[Dict[str, Any]], cursor: str = "") -> bytes:
+    """
+    Serialize agent records into the binary index format.
+
+    Layout: header, cursor, term table (sorted by term), document table,
+    postings, term strings, JSON records. All offsets are absolute, so
+    readers can work straight off a memory map.
+
+    Args:
+        records: Agent records from the Trust API
+        cursor: Sync cursor the snapshot corresponds to
+
+    Returns:
+        Index bytes
+    """
+    records = list(records)
+    postings: Dict[str, List] = {}
+    doc_lengths = []
+
+    for doc, record in enumerate(records):
+        terms = _document_terms(record)
+        doc_lengths.append(len(terms))
+        for term, tf in Counter(terms).items():
+            postings.setdefault(term, []).append((doc, min(tf, 0xFFFF)))
+
+    terms = sorted(postings, key=lambda t: t.encode("utf-8"))
+    cursor_bytes = cursor.encode("utf-8")
+    trust = [float(r.get('trust_score') or 0.0) for r in records]
+    avgdl = sum(doc_lengths) / len(records) if records else 0.0
+
+    term_table_off = _HEADER.size + len(cursor_bytes)
+    doc_table_off = term_table_off + _TERM.size * len(terms)
+    postings_off = doc_table_off + _DOC.size * len(records)
+    strings_off = postings_off + _POSTING.size * sum(len(p) for p in postings.values())
+
+    term_table = bytearray()
+    postings_blob = bytearray()
+    strings_blob = bytearray()
+    for term in terms:
+        encoded = term.encode("utf-8")
+        term_table += _TERM.pack(
+            strings_off + len(strings_blob),
+            len(encoded),
+            postings_off + len(postings_blob),
+            len(postings[term])
+        )
+        strings_blob += encoded
+        for doc, tf in postings[term]:
+            postings_blob += _POSTING.pack(doc, tf)
+
+    records_off = strings_off + len(strings_blob)
+    doc_table = bytearray()
+    records_blob = bytearray()
+    for record, length, score in zip(records, doc_lengths, trust):
+        encoded = json.dumps(record, separators=(',', ':')).encode("utf-8")
+        doc_table += _DOC.pack(records_off + len(records_blob), len(encoded), length, score)
+        records_blob += encoded
+
+    header = _HEADER.pack(
+        _MAGIC, _VERSION, len(records), len(terms), avgdl,
+        max(trust, default=0.0), len(cursor_bytes)
+    )
+    return b"".join([
+        header, cursor_bytes, term_table, doc_table,
+        postings_blob, strings_blob, records_blob
+    ])
+
+
+class IndexReader:
+    """
+    Read-only view over serialized index bytes (or a memory map).
+
+    Terms are found by binary search over the term table and records
+    are only decoded for documents that make it into the results.
+    """
+
+    def __init__(self, buffer):
+        self.buffer = buffer
+        magic, version, self.n_docs, self.n_terms, self.avgdl, self.max_trust, cursor_len = (
+            _HEADER.unpack_from(buffer, 0)
+        )
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError("Not an Amorce index file (or unsupported version)")
+
+        self.cursor = bytes(buffer[_HEADER.size:_HEADER.size + cursor_len]).decode("utf-8")
+        self._terms_off = _HEADER.size + cursor_len
+        self._docs_off = self._terms_off + _TERM.size * self.n_terms
+
+    def _term_at(self, i: int) -> bytes:
+        str_off, str_len, _, _ = _TERM.unpack_from(self.buffer, self._terms_off + i * _TERM.size)
+        return bytes(self.buffer[str_off:str_off + str_len])
+
+    def postings(self, term: str) -> List:
+        """Return (document, term frequency) pairs for `term`."""
+        target = term.encode("utf-8")
+
+        lo, hi = 0, self.n_terms
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._term_at(mid) < target:
+                lo = mid + 1
+            else:
+                hi = mid
+        i = lo
+        if i >= self.n_terms or self._term_at(i) != target:
+            return []
+
+        _, _, off, df = _TERM.unpack_from(self.buffer, self._terms_off + i * _TERM.size)
+        return [_POSTING.unpack_from(self.buffer, off + j * _POSTING.size) for j in range(df)]
+
+    def doc(self, doc: int):
+        """Return (document length, trust score) for a document."""
+        _, _, length, trust = _DOC.unpack_from(self.buffer, self._docs_off + doc * _DOC.size)
+        return length, trust
+
+    def record(self, doc: int) -> Dict[str, Any]:
+        """Decode the agent record for a document."""
+        off, length, _, _ = _DOC.unpack_from(self.buffer, self._docs_off + doc * _DOC.size)
+        return json.loads(bytes(self.buffer[off:off + length]))
+
+    def records(self) -> List[Dict[str, Any]]:
+        return [self.record(doc) for doc in range(self.n_docs)]
+
+
+class LocalAgentIndex:
+    """
+    Locally synced, BM25-ranked index of ANS agent records.
+
+    One process (or a cron job) calls `sync()` to pull deltas from the
+    Trust API and rewrite the index file; any number of workers open the
+    same file and call `search()`. Workers pick up a rewritten file
+    automatically.
+
+    Results are ranked by BM25 relevance scaled by trust score:
+    `bm25 * (1 + trust_weight * trust_score / max_trust_score)`.
+
+    Example:
+        ```python
+        from crewai_amorce.index import LocalAgentIndex
+        from crewai_amorce.discovery import SearchAgentsTool
+
+        index = LocalAgentIndex(path="/var/cache/amorce/ans.idx")
+        index.sync()
+
+        search = SearchAgentsTool(local_index=index)
+        search.run("book flights to Paris")
+        ```
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        trust_url: Optional[str] = None,
+        transport: Optional[HTTPTransport] = None,
+        trust_weight: float = 0.5,
+        k1: float = 1.2,
+        b: float = 0.75,
+        reload_interval: float = 1.0
+    ):
+        """
+        Initialize local index.
+
+        Args:
+            path: Index file to share between processes (in-memory if None)
+            trust_url: Trust API URL used by `sync()`
+            transport: Pooled HTTP transport for `sync()`
+            trust_weight: How strongly trust score boosts relevance
+            k1: BM25 term frequency saturation
+            b: BM25 length normalization
+            reload_interval: Min seconds between checks for a newer file
+        """
+        self.path = path
+        self.trust_url = trust_url or DEFAULT_TRUST_URL
+        self.transport = transport or get_default_transport()
+        self.trust_weight = trust_weight
+        self.k1 = k1
+        self.b = b
+        self.reload_interval = reload_interval
+
+        self._lock = threading.Lock()
+        self._reader: Optional[IndexReader] = None
+        self._mmap: Optional[mmap.mmap] = None
+        self._file_id = None
+        self._checked_at = 0.0
+
+        if path and os.path.exists(path):
+            self._open()
+
+    @property
+    def cursor(self) -> str:
+        """Cursor of the snapshot currently loaded."""
+        reader = self._current()
+        return reader.cursor if reader else ""
+
+    def __len__(self) -> int:
+        reader = self._current()
+        return reader.n_docs if reader else 0
+
+    def sync(self, page_size: int = 500) -> int:
+        """
+        Pull changes since the last sync and rebuild the index.
+
+        Expects `GET /api/v1/ans/snapshot?since=<cursor>&limit=<n>` to
+        return `{"agents": [...], "deleted": [...], "cursor": str,
+        "has_more": bool}`. An empty cursor requests a full snapshot.
+
+        Returns:
+            Number of records added, updated or deleted
+        """
+        reader = self._current()
+        records = {r['agent_id']: r for r in reader.records()} if reader else {}
+        cursor = reader.cursor if reader else ""
+        changes = 0
+
+        while True:
+            data = self.transport.get_json(
+                f"{self.trust_url}/api/v1/ans/snapshot",
+                params={"since": cursor, "limit": page_size}
+            )
+            for agent in data.get("agents", []):
+                records[agent['agent_id']] = {
+                    key: agent.get(key)
+                    for key in ('agent_id', 'trust_score') + INDEXED_FIELDS
+                }
+                changes += 1
+            for agent_id in data.get("deleted", []):
+                if records.pop(agent_id, None) is not None:
+                    changes += 1
+
+            cursor = data.get("cursor", cursor)
+            if not data.get("has_more"):
+                break
+
+        if changes or reader is None or cursor != reader.cursor:
+            self.load_records(records.values(), cursor)
+        return changes
+
+    def load_records(self, records: Iterable[Dict[str, Any]], cursor: str = ""):
+        """Replace the index contents with `records`."""
+        data = build_index(records, cursor)
+
+        if self.path is None:
+            with self._lock:
+                self._reader = IndexReader(data)
+            return
+
+        # Write-then-rename so readers never see a half-written file
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        self._open()
+
+    def _open(self):
+        with open(self.path, "rb") as f:
+            stat = os.fstat(f.fileno())
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        with self._lock:
+            # Old maps are left to the GC; searches may still hold readers
+            self._mmap = mapped
+            self._reader = IndexReader(mapped)
+            self._file_id = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+            self._checked_at = time.monotonic()
+
+    def _current(self) -> Optional[IndexReader]:
+        """Return the reader, reopening the file if another process rewrote it."""
+        if self.path is not None and time.monotonic() - self._checked_at >= self.reload_interval:
+            self._checked_at = time.monotonic()
+            try:
+                stat = os.stat(self.path)
+            except FileNotFoundError:
+                return self._reader
+            if (stat.st_ino, stat.st_mtime_ns, stat.st_size) != self._file_id:
+                self._open()
+        return self._reader
+
+    def search(self, query: str, limit: int = 5) -> List[Dict[str, Any]]:
+        """
+        Rank agents for a free-text query.
+
+        Args:
+            query: Natural language description of what is needed
+            limit: Max results
+
+        Returns:
+            Agent records with an added `score`, best first
+        """
+        reader = self._current()
+        if reader is None or reader.n_docs == 0:
+            return []
+
+        n_docs = reader.n_docs
+        avgdl = reader.avgdl or 1.0
+        scores: Dict[int, float] = {}
+
+        for term in set(tokenize(query)):
+            postings = reader.postings(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (n_docs - len(postings) + 0.5) / (len(postings) + 0.5))
+            for doc, tf in postings:
+                length, _ = reader.doc(doc)
+                norm = self.k1 * (1 - self.b + self.b * length / avgdl)
+                scores[doc] = scores.get(doc, 0.0) + idf * tf * (self.k1 + 1) / (tf + norm)
+
+        if not scores:
+            return []
+
+        max_trust = reader.max_trust or 1.0
+        ranked = []
+        for doc, relevance in scores.items():
+            _, trust = reader.doc(doc)
+            ranked.append((relevance * (1 + self.trust_weight * trust / max_trust), doc))
+        ranked.sort(reverse=True)
+
+        results = []
+        for score, doc in ranked[:limit]:
+            record = reader.record(doc)
+            record['score'] = round(score, 4)
+            results.append(record)
+        return results
@@ -0,0 +1,361 @@
+"""
+Persistent keystore and lazy identities
+
+Stable Ed25519 identities for crews: keys are derived from one crew
+master seed (or imported), kept encrypted on disk, and only decrypted
+when an identity first signs something.
+"""
+
+import atexit
+import base64
+import hashlib
+import hmac
+import json
+import os
+import tempfile
+import threading
+import weakref
+from typing import Optional, Any, Callable, Dict, List, Union
+
+
+KEYSTORE_VERSION = 1
+PASSPHRASE_ENV = "AMORCE_KEYSTORE_PASSPHRASE"
+
+_MASTER = "__master__"
+
+
+def derive_seed(master_seed: bytes, name: str) -> bytes:
+    """
+    Derive a child Ed25519 seed from a master seed.
+
+    Args:
+        master_seed: Crew master seed (32+ random bytes)
+        name: Child name, e.g. the agent's role
+
+    Returns:
+        32-byte child seed, stable for a given (master_seed, name)
+    """
+    digest = hmac.new(master_seed, b"amorce/crew/" + name.encode("utf-8"), hashlib.sha512)
+    return digest.digest()[:32]
+
+
+class LazyIdentity:
+    """
+    Ed25519 identity whose key is materialized on first use.
+
+    Compatible with the parts of `amorce.IdentityManager` used by this
+    package and by `AmorceClient`. When `agent_id` is known up front
+    (e.g. cached in the keystore) no key material is touched until the
+    first signature.
+    """
+
+    def __init__(
+        self,
+        seed_loader: Callable[[], bytes],
+        agent_id: Optional[str] = None,
+        on_agent_id: Optional[Callable[[str], None]] = None
+    ):
+        """
+        Initialize lazy identity.
+
+        Args:
+            seed_loader: Returns the 32-byte private key seed
+            agent_id: Known agent ID (computed from the key if None)
+            on_agent_id: Called with the agent ID once it is computed
+        """
+        self._seed_loader = seed_loader
+        self._agent_id = agent_id
+        self._on_agent_id = on_agent_id
+        self._private_key = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_seed(cls, seed: bytes) -> 'LazyIdentity':
+        """Create an identity from a raw 32-byte seed."""
+        return cls(lambda: seed)
+
+    @property
+    def materialized(self) -> bool:
+        """Whether the private key has been loaded."""
+        return self._private_key is not None
+
+    def _key(self):
+        if self._private_key is None:
+            with self._lock:
+                if self._private_key is None:
+                    from cryptography.hazmat.primitives.asymmetric import ed25519
+                    self._private_key = ed25519.Ed25519PrivateKey.from_private_bytes(
+                        self._seed_loader()
+                    )
+        return self._private_key
+
+    @property
+    def public_key_pem(self) -> str:
+        from cryptography.hazmat.primitives import serialization
+
+        return self._key().public_key().public_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PublicFormat.SubjectPublicKeyInfo
+        ).decode("utf-8")
+
+    @property
+    def private_key_pem(self) -> str:
+        from cryptography.hazmat.primitives import serialization
+
+        return self._key().private_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PrivateFormat.PKCS8,
+            encryption_algorithm=serialization.NoEncryption()
+        ).decode("utf-8")
+
+    @property
+    def agent_id(self) -> str:
+        """SHA-256 of the public key PEM, as derived by the Amorce SDK."""
+        if self._agent_id is None:
+            self._agent_id = hashlib.sha256(
+                self.public_key_pem.strip().encode("utf-8")
+            ).hexdigest()
+            if self._on_agent_id is not None:
+                self._on_agent_id(self._agent_id)
+        return self._agent_id
+
+    def sign_data(self, data: bytes) -> str:
+        """Sign raw bytes, returning a Base64 signature."""
+        return base64.b64encode(self._key().sign(data)).decode("utf-8")
+
+    def sign(self, message: Union[str, bytes]) -> str:
+        """Sign a string (UTF-8 encoded) or bytes."""
+        if isinstance(message, str):
+            message = message.encode("utf-8")
+        return self.sign_data(message)
+
+    @staticmethod
+    def get_canonical_json_bytes(payload: dict) -> bytes:
+        return json.dumps(payload, sort_keys=True, separators=(',', ':')).encode("utf-8")
+
+
+def derive_identity(master_seed: bytes, name: str) -> LazyIdentity:
+    """Derive a lazy child identity from a crew master seed."""
+    return LazyIdentity(lambda: derive_seed(master_seed, name))
+
+
+class Keystore:
+    """
+    Encrypted on-disk keystore for crew identities.
+
+    Holds one crew master seed plus any imported keys, each sealed with
+    AES-256-GCM under a passphrase-derived (scrypt) key. Identities are
+    looked up by name (typically the agent's role):
+
+    - imported keys are returned as stored;
+    - any other name gets a child key derived from the master seed, so
+      IDs are stable across restarts without storing one key per agent.
+
+    Agent IDs are cached in the file in clear, so restarting a large crew
+    performs no key derivation or decryption until the first signature.
+    IDs computed for new names are written in one batch by `flush()`
+    (or `identities()`, or at interpreter exit), not one save per agent.
+
+    Example:
+        ```python
+        from crewai_amorce import SecureAgent
+        from crewai_amorce.keystore import Keystore
+
+        keystore = Keystore("crew.keys", passphrase="...")
+        agent = SecureAgent(role="Seller", goal="...", backstory="...", keystore=keystore)
+        ```
+    """
+
+    def __init__(
+        self,
+        path: str,
+        passphrase: Optional[str] = None,
+        scrypt_n: int = 2 ** 15
+    ):
+        """
+        Open or create a keystore.
+
+        Args:
+            path: Keystore file
+            passphrase: Encryption passphrase (defaults to the
+                AMORCE_KEYSTORE_PASSPHRASE environment variable)
+            scrypt_n: scrypt cost for new keystores
+        """
+        passphrase = passphrase if passphrase is not None else os.environ.get(PASSPHRASE_ENV)
+        if not passphrase:
+            raise ValueError(f"Keystore passphrase required (or set {PASSPHRASE_ENV})")
+
+        self.path = path
+        self._passphrase = passphrase.encode("utf-8")
+        self._lock = threading.RLock()
+        self._cipher = None
+        self._master_seed: Optional[bytes] = None
+        self._dirty = False
+
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                self._data = json.load(f)
+            if self._data.get("version") != KEYSTORE_VERSION:
+                raise ValueError(f"Unsupported keystore version: {self._data.get('version')}")
+        else:
+            self._data = {
+                "version": KEYSTORE_VERSION,
+                "kdf": {
+                    "salt": base64.b64encode(os.urandom(16)).decode("ascii"),
+                    "n": scrypt_n, "r": 8, "p": 1,
+                },
+                "keys": {},
+                "agent_ids": {},
+            }
+
+    def _aead(self):
+        """AES-GCM cipher under the passphrase key (derived once)."""
+        with self._lock:
+            if self._cipher is None:
+                from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+                from cryptography.hazmat.primitives.kdf.scrypt import Scrypt
+
+                kdf = self._data["kdf"]
+                key = Scrypt(
+                    salt=base64.b64decode(kdf["salt"]),
+                    length=32,
+                    n=kdf["n"], r=kdf["r"], p=kdf["p"]
+                ).derive(self._passphrase)
+                self._cipher = AESGCM(key)
+            return self._cipher
+
+    def _seal(self, name: str, seed: bytes) -> Dict[str, str]:
+        nonce = os.urandom(12)
+        ciphertext = self._aead().encrypt(nonce, seed, name.encode("utf-8"))
+        return {
+            "nonce": base64.b64encode(nonce).decode("ascii"),
+            "ciphertext": base64.b64encode(ciphertext).decode("ascii"),
+        }
+
+    def _open(self, name: str) -> bytes:
+        from cryptography.exceptions import InvalidTag
+
+        entry = self._data["keys"][name]
+        try:
+            return self._aead().decrypt(
+                base64.b64decode(entry["nonce"]),
+                base64.b64decode(entry["ciphertext"]),
+                name.encode("utf-8")
+            )
+        except InvalidTag:
+            raise PermissionError(f"Cannot decrypt keystore {self.path}: wrong passphrase?")
+
+    def _master(self) -> bytes:
+        with self._lock:
+            if self._master_seed is None:
+                if _MASTER in self._data["keys"]:
+                    self._master_seed = self._open(_MASTER)
+                else:
+                    self._master_seed = os.urandom(32)
+                    self._data["keys"][_MASTER] = self._seal(_MASTER, self._master_seed)
+                    self.save()
+            return self._master_seed
+
+    def names(self) -> List[str]:
+        """Names with a stored key or cached agent ID."""
+        names = set(self._data["keys"]) | set(self._data["agent_ids"])
+        names.discard(_MASTER)
+        return sorted(names)
+
+    def identity(self, name: str) -> LazyIdentity:
+        """
+        Get the identity for `name`.
+
+        Imported keys are returned as stored; other names get a key
+        derived from the crew master seed. Nothing is decrypted or
+        derived until the identity is used; the agent ID of a new name
+        is cached (in memory until `flush()`) once it is first computed.
+        """
+        with self._lock:
+            agent_id = self._data["agent_ids"].get(name)
+
+        on_agent_id = None if agent_id is not None else lambda computed: self._record(name, computed)
+        if name in self._data["keys"]:
+            return LazyIdentity(lambda: self._open(name), agent_id=agent_id, on_agent_id=on_agent_id)
+        return LazyIdentity(
+            lambda: derive_seed(self._master(), name), agent_id=agent_id, on_agent_id=on_agent_id
+        )
+
+    def identities(self, names: List[str]) -> Dict[str, LazyIdentity]:
+        """
+        Get identities for many names, caching new agent IDs in one save.
+
+        Use this when starting a large crew for the first time: IDs of
+        new names are derived up front and written with a single
+        `flush()` instead of one save per agent.
+        """
+        result = {name: self.identity(name) for name in names}
+        for identity in result.values():
+            identity.agent_id
+        self.flush()
+        return result
+
+    def _record(self, name: str, agent_id: str):
+        with self._lock:
+            if self._data["agent_ids"].get(name) == agent_id:
+                return
+            self._data["agent_ids"][name] = agent_id
+            self._dirty = True
+        _unsaved.add(self)
+
+    def flush(self):
+        """Save agent IDs recorded since the last save, if any."""
+        with self._lock:
+            if self._dirty:
+                self.save()
+
+    def add(self, name: str, identity: Any):
+        """
+        Import an existing identity under `name`.
+
+        Args:
+            name: Lookup name
+            identity: Any identity exposing `private_key_pem`
+        """
+        from cryptography.hazmat.primitives import serialization
+
+        private_key = serialization.load_pem_private_key(
+            identity.private_key_pem.encode("utf-8"), password=None
+        )
+        seed = private_key.private_bytes(
+            encoding=serialization.Encoding.Raw,
+            format=serialization.PrivateFormat.Raw,
+            encryption_algorithm=serialization.NoEncryption()
+        )
+        with self._lock:
+            self._data["keys"][name] = self._seal(name, seed)
+            self._data["agent_ids"][name] = identity.agent_id
+            self.save()
+
+    def save(self):
+        """Write the keystore atomically, readable by the owner only."""
+        with self._lock:
+            directory = os.path.dirname(os.path.abspath(self.path))
+            fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            try:
+                os.chmod(tmp, 0o600)
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(self._data, f, indent=2)
+                os.replace(tmp, self.path)
+                self._dirty = False
+            except BaseException:
+                os.unlink(tmp)
+                raise
+
+
+# Keystores with agent IDs not yet written; flushed at interpreter exit
+_unsaved: "weakref.WeakSet[Keystore]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_unsaved():
+    for keystore in list(_unsaved):
+        try:
+            keystore.flush()
+        except OSError:
+            pass
@@ -0,0 +1,356 @@
+"""
+Latency metrics for the secure call path
+
+Per-stage histograms and counters for wrapped tools (serialization,
+signing, HITL wait, the tool itself) and secured crew kickoffs,
+exportable in Prometheus text format or forwarded to any sink.
+
+Metrics are off by default: the default sink is a no-op whose timers
+do nothing, so uninstrumented processes pay one attribute lookup and
+a few empty method calls per tool call.
+
+Example:
+    ```python
+    from crewai_amorce.metrics import Metrics, set_default_metrics
+
+    metrics = set_default_metrics(Metrics())
+    metrics.serve(port=9464)      # or metrics.render_prometheus()
+    ```
+"""
+
+import bisect
+import threading
+import time
+from typing import Optional, Any, Dict, List, Tuple
+
+
+DEFAULT_BUCKETS = (
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0,
+)
+
+# Names used by the wrappers
+TOOL_STAGE_SECONDS = "amorce_tool_stage_seconds"
+TOOL_CALLS_TOTAL = "amorce_tool_calls_total"
+KICKOFF_STAGE_SECONDS = "amorce_kickoff_stage_seconds"
+KICKOFFS_TOTAL = "amorce_kickoffs_total"
+
+_HELP = {
+    TOOL_STAGE_SECONDS: "Seconds per stage of a wrapped tool call",
+    TOOL_CALLS_TOTAL: "Wrapped tool calls by outcome",
+    KICKOFF_STAGE_SECONDS: "Seconds per stage of a secured crew kickoff",
+    KICKOFFS_TOTAL: "Secured crew kickoffs by outcome",
+}
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+class StageTimer:
+    """
+    Times consecutive stages of one operation.
+
+    Each `mark(stage)` observes the time since the previous mark (or
+    the start) under `stage`; `finish(outcome)` observes the total and
+    counts the outcome.
+    """
+
+    __slots__ = ('sink', 'name', 'counter', 'labels', '_start', '_last')
+
+    def __init__(self, sink: 'MetricsSink', name: str, counter: str, labels: Dict[str, str]):
+        self.sink = sink
+        self.name = name
+        self.counter = counter
+        self.labels = labels
+        self._start = self._last = time.perf_counter()
+
+    def mark(self, stage: str):
+        now = time.perf_counter()
+        self.sink.observe(self.name, now - self._last, {**self.labels, 'stage': stage})
+        self._last = now
+
+    def skip(self):
+        """Restart the stage clock without observing (e.g. after waiting on another stage)."""
+        self._last = time.perf_counter()
+
+    def finish(self, outcome: str = "ok"):
+        self.sink.observe(self.name, time.perf_counter() - self._start, {**self.labels, 'stage': 'total'})
+        self.sink.increment(self.counter, 1.0, {**self.labels, 'outcome': outcome})
+
+
+class _NullTimer:
+    __slots__ = ()
+
+    def mark(self, stage: str):
+        pass
+
+    def skip(self):
+        pass
+
+    def finish(self, outcome: str = "ok"):
+        pass
+
+
+NULL_TIMER = _NullTimer()
+
+
+class MetricsSink:
+    """
+    Destination for metric observations.
+
+    Implement `observe` and `increment` to forward metrics elsewhere
+    (StatsD, OpenTelemetry, logs); pass the sink to `Metrics(sinks=...)`
+    or install it directly with `set_default_metrics`.
+    """
+
+    enabled = True
+
+    def observe(self, name: str, value: float, labels: Dict[str, str]):
+        """Record one histogram sample."""
+        raise NotImplementedError
+
+    def increment(self, name: str, amount: float, labels: Dict[str, str]):
+        """Add to a counter."""
+        raise NotImplementedError
+
+    def timer(self, name: str, counter: str, **labels: str) -> Any:
+        """Start a StageTimer for one operation."""
+        return StageTimer(self, name, counter, labels)
+
+
+class NullMetrics(MetricsSink):
+    """Metrics disabled: every call is a no-op."""
+
+    enabled = False
+
+    def observe(self, name: str, value: float, labels: Dict[str, str]):
+        pass
+
+    def increment(self, name: str, amount: float, labels: Dict[str, str]):
+        pass
+
+    def timer(self, name: str, counter: str, **labels: str) -> Any:
+        return NULL_TIMER
+
+
+class _Histogram:
+    """Fixed-bucket histogram (non-cumulative counts, +Inf last)."""
+
+    __slots__ = ('buckets', 'counts', 'sum', 'count')
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-quantile."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return float('inf')
+
+
+def _label_key(labels: Dict[str, str]) -> LabelKey:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _format_labels(key: LabelKey, extra: str = "") -> str:
+    parts = [
+        f'{k}="' + v.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') + '"'
+        for k, v in key
+    ]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float('inf'):
+        return "+Inf"
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+class Metrics(MetricsSink):
+    """
+    In-process histograms and counters with Prometheus export.
+
+    Example:
+        ```python
+        from crewai_amorce.metrics import Metrics
+
+        metrics = Metrics()
+        agent = SecureAgent(..., metrics=metrics)
+        ...
+        print(metrics.render_prometheus())
+        print(metrics.snapshot()["amorce_tool_stage_seconds"])
+        ```
+    """
+
+    def __init__(
+        self,
+        buckets: Tuple[float, ...] = DEFAULT_BUCKETS,
+        sinks: Optional[List[MetricsSink]] = None
+    ):
+        """
+        Initialize metrics.
+
+        Args:
+            buckets: Histogram bucket upper bounds in seconds
+            sinks: Other sinks that receive every observation too
+        """
+        self.buckets = tuple(sorted(buckets))
+        self.sinks = list(sinks or [])
+        self._histograms: Dict[str, Dict[LabelKey, _Histogram]] = {}
+        self._counters: Dict[str, Dict[LabelKey, float]] = {}
+        self._lock = threading.Lock()
+        self._server: Optional[Any] = None
+
+    def observe(self, name: str, value: float, labels: Dict[str, str]):
+        key = _label_key(labels)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = _Histogram(self.buckets)
+            histogram.observe(value)
+        for sink in self.sinks:
+            sink.observe(name, value, labels)
+
+    def increment(self, name: str, amount: float, labels: Dict[str, str]):
+        key = _label_key(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0.0) + amount
+        for sink in self.sinks:
+            sink.increment(name, amount, labels)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Current values.
+
+        Returns:
+            Dict of metric name to a list of series: histograms give
+            `labels`, `count`, `sum`, `mean`, `p50`, `p95` and `p99`
+            (bucket upper bounds); counters give `labels` and `value`
+        """
+        result: Dict[str, Any] = {}
+        with self._lock:
+            for name, series in self._histograms.items():
+                result[name] = [
+                    {
+                        'labels': dict(key),
+                        'count': h.count,
+                        'sum': h.sum,
+                        'mean': h.sum / h.count if h.count else 0.0,
+                        'p50': h.quantile(0.5),
+                        'p95': h.quantile(0.95),
+                        'p99': h.quantile(0.99),
+                    }
+                    for key, h in series.items()
+                ]
+            for name, series in self._counters.items():
+                result[name] = [{'labels': dict(key), 'value': value} for key, value in series.items()]
+        return result
+
+    def render_prometheus(self) -> str:
+        """All metrics in the Prometheus text exposition format."""
+        lines = []
+        with self._lock:
+            for name in sorted(self._histograms):
+                if name in _HELP:
+                    lines.append(f"# HELP {name} {_HELP[name]}")
+                lines.append(f"# TYPE {name} histogram")
+                for key, h in sorted(self._histograms[name].items()):
+                    cumulative = 0
+                    for bound, count in zip(self.buckets + (float('inf'),), h.counts):
+                        cumulative += count
+                        le = 'le="' + _format_value(bound) + '"'
+                        lines.append(f"{name}_bucket{_format_labels(key, le)} {cumulative}")
+                    lines.append(f"{name}_sum{_format_labels(key)} {repr(h.sum)}")
+                    lines.append(f"{name}_count{_format_labels(key)} {h.count}")
+            for name in sorted(self._counters):
+                if name in _HELP:
+                    lines.append(f"# HELP {name} {_HELP[name]}")
+                lines.append(f"# TYPE {name} counter")
+                for key, value in sorted(self._counters[name].items()):
+                    lines.append(f"{name}{_format_labels(key)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+    def serve(self, host: str = "127.0.0.1", port: int = 9464) -> int:
+        """
+        Serve `/metrics` for Prometheus on a daemon thread.
+
+        Calling it again while already serving keeps the running
+        endpoint and ignores `host` and `port`.
+
+        Returns:
+            The bound port (useful with port=0)
+        """
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        metrics = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = metrics.render_prometheus().encode('utf-8')
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        with self._lock:
+            if self._server is None:
+                server = ThreadingHTTPServer((host, port), Handler)
+                server.daemon_threads = True
+                threading.Thread(target=server.serve_forever, name="amorce-metrics", daemon=True).start()
+                self._server = server
+            return self._server.server_address[1]
+
+    def close(self):
+        """Stop the HTTP endpoint, if serving."""
+        with self._lock:
+            server, self._server = self._server, None
+        if server is not None:
+            server.shutdown()
+            server.server_close()
+
+
+_default: MetricsSink = NullMetrics()
+_default_lock = threading.Lock()
+
+
+def get_default_metrics() -> MetricsSink:
+    """Process-wide metrics sink (a no-op until `set_default_metrics`)."""
+    return _default
+
+
+def set_default_metrics(sink: Optional[MetricsSink]) -> MetricsSink:
+    """
+    Install the process-wide metrics sink.
+
+    Args:
+        sink: Metrics (or any MetricsSink); None disables metrics
+
+    Returns:
+        The installed sink
+    """
+    global _default
+
+    with _default_lock:
+        _default = sink if sink is not None else NullMetrics()
+        return _default
@@ -0,0 +1,417 @@
+"""
+Streaming NDJSON for envelope and tool-call logs
+
+Writes and reads newline-delimited JSON records (A2A envelopes, tool
+calls or any JSON object) to files, file objects or sockets, with
+optional gzip or zstd compression. Writes are buffered into large
+blocks; reads are generators that can resume from a byte offset, and
+uncompressed files can be split into newline-aligned chunks and
+processed on several processes.
+"""
+
+import gzip
+import io
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, Any, Callable, Dict, Iterable, Iterator, List, Tuple, Union
+
+from crewai_amorce.a2a import A2AEnvelope
+
+
+DEFAULT_BUFFER_SIZE = 1024 * 1024
+DEFAULT_CHUNK_SIZE = 64 * 1024 * 1024
+
+Record = Union[A2AEnvelope, Dict[str, Any], List[Any], bytes]
+Target = Union[str, os.PathLike, Any]
+
+# Built once: json.dumps() with options makes a new encoder per call
+_encoder = json.JSONEncoder(separators=(',', ':'), ensure_ascii=False)
+
+
+def _zstd():
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError(
+            "zstandard is required for zstd-compressed logs. "
+            "Install with: pip install zstandard"
+        )
+    return zstandard
+
+
+def _compression(target: Target, compression: Optional[str]) -> Optional[str]:
+    """Resolve "auto" from the file extension."""
+    if compression != "auto":
+        if compression not in (None, "gzip", "zstd"):
+            raise ValueError(f"Unknown compression: {compression!r}")
+        return compression
+    if isinstance(target, (str, os.PathLike)):
+        name = os.fspath(target)
+        if name.endswith(".gz"):
+            return "gzip"
+        if name.endswith(".zst"):
+            return "zstd"
+    return None
+
+
+def _open_raw(target: Target, mode: str) -> Tuple[Any, bool]:
+    """Binary file object for a path, file object or socket, and whether we own it."""
+    if isinstance(target, (str, os.PathLike)):
+        return open(target, mode), True
+    if hasattr(target, "makefile"):
+        # Socket: the file object is ours, the socket stays the caller's
+        return target.makefile(mode.replace("a", "w")), True
+    return target, False
+
+
+def encode_record(record: Record) -> bytes:
+    """One NDJSON line (without the newline) for a record."""
+    if isinstance(record, A2AEnvelope):
+        # Forwarded envelopes reuse their original JSON bytes
+        return record.to_bytes(format="json")
+    if isinstance(record, (bytes, bytearray, memoryview)):
+        return bytes(record)
+    return _encoder.encode(record).encode('utf-8')
+
+
+class NDJSONWriter:
+    """
+    Buffered NDJSON writer.
+
+    Lines are collected until `buffer_size` bytes are pending and then
+    written (and compressed) as one block, so each record costs one
+    encode and no system call.
+
+    Example:
+        ```python
+        from crewai_amorce.ndjson import NDJSONWriter
+
+        with NDJSONWriter("traffic-2026-10-17.ndjson.zst") as writer:
+            writer.write_many(envelopes)
+        ```
+    """
+
+    def __init__(
+        self,
+        target: Target,
+        compression: Optional[str] = "auto",
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        level: Optional[int] = None,
+        append: bool = False
+    ):
+        """
+        Initialize writer.
+
+        Args:
+            target: Path, binary file object or connected socket
+            compression: None, "gzip", "zstd" or "auto" (by extension)
+            buffer_size: Bytes buffered before a write
+            level: Compression level (6 for gzip, 3 for zstd if None)
+            append: Append to an existing file instead of truncating
+        """
+        self.compression = _compression(target, compression)
+        self.buffer_size = buffer_size
+        self.records = 0
+        self.bytes_written = 0
+
+        self._raw, self._owns_raw = _open_raw(target, "ab" if append else "wb")
+        if self.compression == "gzip":
+            self._out = gzip.GzipFile(
+                fileobj=self._raw, mode="wb", compresslevel=6 if level is None else level
+            )
+        elif self.compression == "zstd":
+            compressor = _zstd().ZstdCompressor(level=3 if level is None else level)
+            self._out = compressor.stream_writer(self._raw, closefd=False)
+        else:
+            self._out = self._raw
+
+        self._pending: List[bytes] = []
+        self._size = 0
+        self._closed = False
+
+    def write(self, record: Record):
+        """Queue one record."""
+        if self._closed:
+            raise ValueError("Writer is closed")
+        line = encode_record(record)
+        self._pending.append(line)
+        self._pending.append(b"\n")
+        self._size += len(line) + 1
+        self.records += 1
+        if self._size >= self.buffer_size:
+            self._write_pending()
+
+    def write_many(self, records: Iterable[Record]) -> int:
+        """
+        Queue records from any iterable (consumed lazily).
+
+        Returns:
+            Number of records written
+        """
+        count = 0
+        for record in records:
+            self.write(record)
+            count += 1
+        return count
+
+    def _write_pending(self):
+        if self._pending:
+            self._out.write(b"".join(self._pending))
+            self.bytes_written += self._size
+            self._pending.clear()
+            self._size = 0
+
+    def flush(self):
+        """Write buffered records through to the target."""
+        self._write_pending()
+        if self.compression == "zstd":
+            self._out.flush(_zstd().FLUSH_BLOCK)
+        else:
+            self._out.flush()
+        if self._out is not self._raw:
+            self._raw.flush()
+
+    def close(self):
+        """Flush, finish the compressed stream and close what we opened."""
+        if self._closed:
+            return
+        self._write_pending()
+        if self._out is not self._raw:
+            self._out.close()
+        self._raw.flush()
+        if self._owns_raw:
+            self._raw.close()
+        self._closed = True
+
+    def __enter__(self) -> 'NDJSONWriter':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class NDJSONReader:
+    """
+    Streaming NDJSON reader.
+
+    Iterating yields one decoded record per line. `offset` is the byte
+    position (in the decompressed stream) just after the last record
+    yielded; pass it back as `offset=` to resume.
+
+    A final line without a newline is yielded when the source is
+    complete (compressed streams, or `complete=True`). Otherwise it is
+    treated as still being written: it is not yielded, `offset` stays
+    before it and `trailing` reports its size.
+
+    Example:
+        ```python
+        from crewai_amorce.ndjson import NDJSONReader
+
+        reader = NDJSONReader("traffic.ndjson", envelopes=True, offset=saved)
+        for envelope in reader:
+            handle(envelope)
+        saved = reader.offset
+        ```
+    """
+
+    def __init__(
+        self,
+        source: Target,
+        compression: Optional[str] = "auto",
+        offset: int = 0,
+        end: Optional[int] = None,
+        envelopes: bool = False,
+        skip_invalid: bool = False,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        complete: Optional[bool] = None
+    ):
+        """
+        Initialize reader.
+
+        Args:
+            source: Path, binary file object or connected socket
+            compression: None, "gzip", "zstd" or "auto" (by extension)
+            offset: Byte offset of the first record to read
+            end: Stop before the first record starting at or after this offset
+            envelopes: Yield A2AEnvelope objects instead of dicts
+            skip_invalid: Skip malformed lines instead of raising
+            buffer_size: Read buffer size
+            complete: The source is no longer being written, so an
+                unterminated last line is a record (True for compressed
+                sources, False otherwise, if None)
+        """
+        self.source = source
+        self.compression = _compression(source, compression)
+        self.complete = self.compression is not None if complete is None else complete
+        self.offset = offset
+        self.end = end
+        self.envelopes = envelopes
+        self.skip_invalid = skip_invalid
+        self.buffer_size = buffer_size
+        self.records = 0
+        self.skipped = 0
+        self.trailing = 0
+
+    def _open(self) -> Tuple[Any, List[Any]]:
+        """Line-iterable stream, and the objects to close when done."""
+        raw, owns = _open_raw(self.source, "rb")
+        opened = [raw] if owns else []
+        if self.compression == "gzip":
+            stream = gzip.GzipFile(fileobj=raw, mode="rb")
+        elif self.compression == "zstd":
+            reader = _zstd().ZstdDecompressor().stream_reader(raw, closefd=False)
+            stream = io.BufferedReader(reader, self.buffer_size)
+        else:
+            return raw, opened
+        return stream, [stream] + opened
+
+    def _skip_to(self, stream: Any):
+        if not self.offset:
+            return
+        if self.compression is None and stream.seekable():
+            stream.seek(self.offset)
+            return
+        # Compressed or unseekable: decompress forward
+        remaining = self.offset
+        while remaining:
+            data = stream.read(min(remaining, self.buffer_size))
+            if not data:
+                raise ValueError(f"Offset {self.offset} is past the end of the stream")
+            remaining -= len(data)
+
+    def _decode(self, line: bytes) -> Any:
+        if self.envelopes:
+            # Without the newline, so forwarding reuses the exact line
+            return A2AEnvelope.from_bytes(line.rstrip(b"\r\n"))
+        return json.loads(line)
+
+    def __iter__(self) -> Iterator[Any]:
+        stream, opened = self._open()
+        try:
+            self._skip_to(stream)
+            for line in stream:
+                if self.end is not None and self.offset >= self.end:
+                    return
+                if not line.endswith(b"\n") and not self.complete:
+                    # Partial trailing record: leave it for a later resume
+                    self.trailing = len(line)
+                    return
+                start = self.offset
+                self.offset += len(line)
+                if not line.strip():
+                    continue
+                try:
+                    record = self._decode(line)
+                except (ValueError, KeyError, TypeError) as e:
+                    if not self.skip_invalid:
+                        raise ValueError(f"Malformed record at offset {start}: {e}")
+                    self.skipped += 1
+                    continue
+                self.records += 1
+                yield record
+        finally:
+            for f in opened:
+                f.close()
+
+
+def write_records(
+    target: Target,
+    records: Iterable[Record],
+    compression: Optional[str] = "auto",
+    append: bool = False
+) -> int:
+    """
+    Stream records to an NDJSON file or socket.
+
+    Returns:
+        Number of records written
+    """
+    with NDJSONWriter(target, compression=compression, append=append) as writer:
+        return writer.write_many(records)
+
+
+def read_records(
+    source: Target,
+    compression: Optional[str] = "auto",
+    offset: int = 0,
+    envelopes: bool = False,
+    complete: Optional[bool] = None
+) -> Iterator[Any]:
+    """Stream records (dicts, or A2AEnvelope objects) from an NDJSON file or socket."""
+    return iter(NDJSONReader(
+        source, compression=compression, offset=offset, envelopes=envelopes, complete=complete
+    ))
+
+
+def split_chunks(path: Union[str, os.PathLike], chunk_size: int = DEFAULT_CHUNK_SIZE) -> List[Tuple[int, int]]:
+    """
+    Split an uncompressed NDJSON file into `(start, end)` byte ranges.
+
+    Ranges are nominal; readers given `offset=start, end=end` round
+    both to line boundaries, so every record lands in exactly one
+    chunk.
+    """
+    size = os.path.getsize(path)
+    return [(start, min(start + chunk_size, size)) for start in range(0, size, chunk_size)]
+
+
+def _align(path: Union[str, os.PathLike], start: int) -> int:
+    """First line start at or after `start`."""
+    if start == 0:
+        return 0
+    with open(path, "rb") as f:
+        f.seek(start - 1)
+        return start - 1 + len(f.readline())
+
+
+def _run_chunk(path, start: int, end: int, fn: Callable[[Iterator[Any]], Any], envelopes: bool) -> Any:
+    reader = NDJSONReader(
+        path, compression=None, offset=_align(path, start), end=end, envelopes=envelopes, complete=True
+    )
+    return fn(iter(reader))
+
+
+def map_chunks(
+    path: Union[str, os.PathLike],
+    fn: Callable[[Iterator[Any]], Any],
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    envelopes: bool = False
+) -> Iterator[Any]:
+    """
+    Process an uncompressed NDJSON file in parallel chunks.
+
+    Each chunk is parsed in a worker process and handed to `fn` as an
+    iterator of records; `fn` returns one (small) result per chunk,
+    e.g. counts to merge. At most two chunks per worker are in flight.
+    The file is read as complete: a last line without a newline is
+    still a record.
+
+    Args:
+        path: Uncompressed NDJSON file
+        fn: Picklable function from a record iterator to a result
+        workers: Worker processes (CPU count if None)
+        chunk_size: Nominal bytes per chunk
+        envelopes: Give `fn` A2AEnvelope objects instead of dicts
+
+    Yields:
+        One result per chunk, in file order
+
+    Raises:
+        ValueError: The file is compressed (it cannot be split)
+    """
+    if _compression(path, "auto") is not None:
+        raise ValueError("Parallel chunks need an uncompressed file; use NDJSONReader instead")
+
+    workers = workers or os.cpu_count() or 1
+    chunks = split_chunks(path, chunk_size)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        limit = 2 * workers
+        pending = []
+        for start, end in chunks:
+            pending.append(pool.submit(_run_chunk, path, start, end, fn, envelopes))
+            if len(pending) >= limit:
+                yield pending.pop(0).result()
+        for future in pending:
+            yield future.result()
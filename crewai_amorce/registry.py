@@ -0,0 +1,170 @@
+"""
+Process-wide AmorceClient registry
+
+SecureAgents and secured crews that share an identity and endpoints
+share one AmorceClient, and every client shares one pooled HTTP
+transport, so a 50-agent crew holds one connection pool instead of 51.
+"""
+
+import atexit
+import sys
+import threading
+from typing import Optional, Any, Dict, Tuple
+
+from crewai_amorce.transport import HTTPTransport, get_default_transport
+
+
+DEFAULT_DIRECTORY_URL = 'https://directory.amorce.io'
+DEFAULT_ORCHESTRATOR_URL = 'https://api.amorce.io'
+
+
+class ClientRegistry:
+    """
+    Registry of AmorceClients keyed by (agent_id, directory, orchestrator).
+
+    Each client's `requests.Session` is rewired onto the registry
+    transport's connection pool, so all clients reuse the same
+    keep-alive sockets while keeping their own headers (e.g. API keys)
+    and retry policy.
+
+    Example:
+        ```python
+        from crewai_amorce.registry import get_client, get_registry
+
+        client = get_client(identity)
+        assert get_client(identity) is client
+
+        print(get_registry().stats())
+        ```
+    """
+
+    def __init__(self, transport: Optional[HTTPTransport] = None):
+        """
+        Initialize registry.
+
+        Args:
+            transport: Shared transport (process-wide default if None)
+        """
+        self.transport = transport or get_default_transport()
+        self._clients: Dict[Tuple[str, str, str], Any] = {}
+        self._lock = threading.Lock()
+        self.created = 0
+        self.reused = 0
+
+    def get_client(
+        self,
+        identity: Any,
+        directory_url: str = DEFAULT_DIRECTORY_URL,
+        orchestrator_url: str = DEFAULT_ORCHESTRATOR_URL
+    ) -> Any:
+        """
+        Get the shared client for an identity, creating it on first use.
+
+        Args:
+            identity: Amorce identity
+            directory_url: Trust Directory URL
+            orchestrator_url: Orchestrator URL
+
+        Returns:
+            AmorceClient bound to the shared transport
+        """
+        key = (identity.agent_id, directory_url.rstrip('/'), orchestrator_url.rstrip('/'))
+
+        with self._lock:
+            client = self._clients.get(key)
+            if client is not None:
+                self.reused += 1
+                return client
+
+            from amorce import AmorceClient
+
+            client = AmorceClient(
+                identity,
+                directory_url=directory_url,
+                orchestrator_url=orchestrator_url
+            )
+
+            # Keep the client's session (headers, Retry) but share the pool
+            session = getattr(client, 'session', None)
+            if session is not None and session is not self.transport.session:
+                self.transport.share_pool(session)
+
+            self._clients[key] = client
+            self.created += 1
+            return client
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Report client, memory and socket counts.
+
+        Returns:
+            Dict with `clients`, `created`, `reused`, approximate
+            `client_bytes` (shallow size of the client objects) and the
+            shared transport's `connections` and `idle_sockets`.
+        """
+        with self._lock:
+            clients = list(self._clients.values())
+            created, reused = self.created, self.reused
+
+        transport_stats = self.transport.stats()
+        return {
+            'clients': len(clients),
+            'created': created,
+            'reused': reused,
+            'client_bytes': sum(
+                sys.getsizeof(c) + sys.getsizeof(getattr(c, '__dict__', {}))
+                for c in clients
+            ),
+            'connections': transport_stats['connections'],
+            'idle_sockets': transport_stats['idle_sockets'],
+        }
+
+    def close(self):
+        """Drop all clients and close the shared connection pool."""
+        with self._lock:
+            self._clients.clear()
+        self.transport.close()
+
+
+_default_registry: Optional[ClientRegistry] = None
+_default_lock = threading.Lock()
+
+
+def get_registry() -> ClientRegistry:
+    """
+    Get the process-wide registry, creating it on first use.
+
+    The registry is closed automatically at interpreter exit.
+
+    Returns:
+        Shared ClientRegistry instance
+    """
+    global _default_registry
+
+    with _default_lock:
+        if _default_registry is None:
+            _default_registry = ClientRegistry()
+            atexit.register(shutdown_clients)
+        return _default_registry
+
+
+def get_client(
+    identity: Any,
+    directory_url: str = DEFAULT_DIRECTORY_URL,
+    orchestrator_url: str = DEFAULT_ORCHESTRATOR_URL
+) -> Any:
+    """Get the shared AmorceClient for an identity from the default registry."""
+    return get_registry().get_client(identity, directory_url, orchestrator_url)
+
+
+def shutdown_clients():
+    """Close the default registry and its connections."""
+    global _default_registry
+
+    with _default_lock:
+        registry, _default_registry = _default_registry, None
+    if registry is not None:
+        registry.close()
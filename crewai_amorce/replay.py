@@ -0,0 +1,255 @@
+"""
+Replay protection for signed envelopes and offers
+
+Remembers recently seen signatures in bounded memory: an exact set of
+the most recent IDs plus a pair of rotating Bloom filters covering the
+acceptance window, with timestamps outside the window rejected
+outright so nothing older ever needs to be remembered.
+"""
+
+import hashlib
+import math
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Optional, Any, Dict, Union
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over string keys."""
+
+    def __init__(self, num_bits: int, num_hashes: int):
+        self.num_bits = num_bits
+        self.num_hashes = num_hashes
+        self.count = 0
+        self._bits = bytearray((num_bits + 7) // 8)
+
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        # Kirsch-Mitzenmacher double hashing
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+    def add(self, key: str):
+        for pos in self._positions(key):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        bits = self._bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+    def false_positive_rate(self) -> float:
+        """Expected false-positive rate at the current fill."""
+        return (1 - math.exp(-self.num_hashes * self.count / self.num_bits)) ** self.num_hashes
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._bits)
+
+
+def _parse_timestamp(timestamp: Union[str, float, int, None]) -> Optional[float]:
+    """Epoch seconds from an ISO 8601 string (A2A metadata) or a number."""
+    if timestamp is None or isinstance(timestamp, (int, float)):
+        return timestamp
+    text = timestamp[:-1] + '+00:00' if timestamp.endswith('Z') else timestamp
+    parsed = datetime.fromisoformat(text)
+    if parsed.tzinfo is None:
+        # A2A timestamps are UTC
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+class ReplayGuard:
+    """
+    Reject duplicate or replayed signed messages in bounded memory.
+
+    A message is accepted once. Its ID (sender and signature, or the
+    Merkle root and leaf index for batch-signed messages) goes into
+    an exact set of the `recent_size` latest IDs and into the current
+    Bloom filter generation. Generations rotate every `window +
+    max_skew` seconds and two are kept, so an ID is remembered for as
+    long as its timestamp could still pass the age check; messages older
+    than `window` (or more than `max_skew` seconds in the future) are
+    rejected before the lookup.
+
+    Filters are sized from `max_bytes` and `false_positive_rate`. A
+    generation that reaches its capacity rotates early so the false
+    positive rate stays in budget; `early_rotations` counts this, and
+    a non-zero value means the window is effectively shorter than
+    configured for the current traffic.
+
+    Example:
+        ```python
+        from crewai_amorce.replay import ReplayGuard
+
+        guard = ReplayGuard(window=300, max_skew=30)
+        guard.check_envelope(envelope)   # raises PermissionError on replay
+        ```
+    """
+
+    def __init__(
+        self,
+        window: float = 300.0,
+        max_skew: float = 30.0,
+        max_bytes: int = 1024 * 1024,
+        false_positive_rate: float = 1e-6,
+        recent_size: int = 4096,
+        require_timestamp: bool = True
+    ):
+        """
+        Initialize replay guard.
+
+        Args:
+            window: Seconds a message stays acceptable (and remembered)
+            max_skew: Seconds a timestamp may be ahead of local time
+            max_bytes: Memory ceiling for both Bloom filters together
+            false_positive_rate: Budget for rejecting a fresh message
+            recent_size: IDs kept in the exact recent set
+            require_timestamp: Reject messages without a timestamp (an
+                untimestamped ID is forgotten after two rotations, so it
+                could then be replayed)
+        """
+        if not 0 < false_positive_rate < 1:
+            raise ValueError("false_positive_rate must be between 0 and 1")
+
+        self.window = window
+        self.max_skew = max_skew
+        # A message dated max_skew ahead stays acceptable this long
+        self.period = window + max_skew
+        self.recent_size = recent_size
+        self.require_timestamp = require_timestamp
+
+        # Two generations share the memory ceiling
+        self.num_bits = max(64, max_bytes * 8 // 2)
+        self.capacity = max(1, int(self.num_bits * math.log(2) ** 2 / -math.log(false_positive_rate)))
+        self.num_hashes = max(1, round(self.num_bits / self.capacity * math.log(2)))
+
+        self.accepted = 0
+        self.duplicates = 0
+        self.probable_duplicates = 0
+        self.expired = 0
+        self.future = 0
+        self.missing_timestamp = 0
+        self.rotations = 0
+        self.early_rotations = 0
+
+        self._lock = threading.Lock()
+        self._current = BloomFilter(self.num_bits, self.num_hashes)
+        self._previous = BloomFilter(self.num_bits, self.num_hashes)
+        self._rotated_at = time.monotonic()
+        self._recent: "OrderedDict[str, None]" = OrderedDict()
+
+    def _rotate(self, now: float):
+        self._previous = self._current
+        self._current = BloomFilter(self.num_bits, self.num_hashes)
+        self._rotated_at = now
+        self.rotations += 1
+
+    def check(
+        self,
+        message_id: str,
+        timestamp: Union[str, float, int, None] = None,
+        now: Optional[float] = None
+    ):
+        """
+        Accept a message once, or raise.
+
+        Args:
+            message_id: Unique message ID (e.g. sender + signature)
+            timestamp: Signed send time (ISO 8601 or epoch seconds)
+            now: Current epoch time (time.time() if None)
+
+        Raises:
+            PermissionError: Replayed, expired or future-dated message
+        """
+        now = time.time() if now is None else now
+        sent_at = _parse_timestamp(timestamp)
+
+        with self._lock:
+            if sent_at is None:
+                if self.require_timestamp:
+                    self.missing_timestamp += 1
+                    raise PermissionError("Message has no timestamp")
+            elif sent_at > now + self.max_skew:
+                self.future += 1
+                raise PermissionError(f"Message timestamp is {sent_at - now:.0f}s in the future")
+            elif sent_at < now - self.window:
+                self.expired += 1
+                raise PermissionError(f"Message is older than the {self.window:.0f}s replay window")
+
+            if message_id in self._recent:
+                self.duplicates += 1
+                raise PermissionError("Replayed message")
+            if message_id in self._current or message_id in self._previous:
+                self.probable_duplicates += 1
+                raise PermissionError("Replayed message (probable)")
+
+            monotonic = time.monotonic()
+            idle = monotonic - self._rotated_at
+            if idle >= 2 * self.period:
+                # Both generations are past the window
+                self._rotate(monotonic)
+                self._rotate(monotonic)
+            elif idle >= self.period:
+                self._rotate(monotonic)
+            elif self._current.count >= self.capacity:
+                self._rotate(monotonic)
+                self.early_rotations += 1
+
+            self._current.add(message_id)
+            self._recent[message_id] = None
+            if len(self._recent) > self.recent_size:
+                self._recent.popitem(last=False)
+            self.accepted += 1
+
+    def accept(self, message_id: str, timestamp: Union[str, float, int, None] = None) -> bool:
+        """Like `check`, returning False instead of raising."""
+        try:
+            self.check(message_id, timestamp)
+        except PermissionError:
+            return False
+        return True
+
+    def check_envelope(self, envelope: Any):
+        """Check an A2AEnvelope by sender, signature and signed timestamp."""
+        self.check(f"{envelope.sender_id}:{envelope.signature}", envelope.timestamp)
+
+    def check_offer(self, offer: Dict[str, Any]):
+        """Check a signed offer dict (as built by `SecureAgent.counter_offer`)."""
+        if 'merkle_root' in offer:
+            # Every offer in a batch shares the root signature; the leaf is unique
+            message_id = f"{offer.get('agent_id')}:{offer['merkle_root']}:{offer['merkle_index']}"
+        else:
+            message_id = f"{offer.get('agent_id')}:{offer['signature']}"
+        self.check(message_id, offer.get('timestamp'))
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Report counters and memory use.
+
+        Returns:
+            Dict with accept/reject counters, `rotations`,
+            `early_rotations`, `bloom_bytes`, `capacity` per
+            generation and the current estimated `false_positive_rate`
+        """
+        with self._lock:
+            return {
+                'accepted': self.accepted,
+                'duplicates': self.duplicates,
+                'probable_duplicates': self.probable_duplicates,
+                'expired': self.expired,
+                'future': self.future,
+                'missing_timestamp': self.missing_timestamp,
+                'rotations': self.rotations,
+                'early_rotations': self.early_rotations,
+                'recent': len(self._recent),
+                'bloom_bytes': self._current.nbytes + self._previous.nbytes,
+                'capacity': self.capacity,
+                'false_positive_rate': 1 - (
+                    (1 - self._current.false_positive_rate())
+                    * (1 - self._previous.false_positive_rate())
+                ),
+            }
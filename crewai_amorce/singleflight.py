@@ -0,0 +1,148 @@
+"""
+Request coalescing for Amorce lookups
+
+Concurrent identical requests wait on a single in-flight call and share
+its result, so a burst of agents asking the same question costs one
+round trip.
+"""
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+
+class _Call:
+    """An in-flight call that followers wait on."""
+
+    __slots__ = ('done', 'result', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls that share a key.
+
+    The first caller for a key (the leader) runs the function; callers
+    arriving while it is in flight block until it finishes and receive
+    the same result or exception. Threads use `do`, coroutines use `ado`.
+
+    Example:
+        ```python
+        from crewai_amorce.singleflight import SingleFlight
+
+        flight = SingleFlight()
+        data = flight.do("search|flights", lambda: fetch("flights"))
+
+        print(flight.stats()['deduplicated'])
+        ```
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.deduplicated = 0
+
+        self._lock = threading.Lock()
+        self._inflight: Dict[Hashable, _Call] = {}
+        self._tasks: Dict[Any, asyncio.Future] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        Run `fn` unless an identical call is already in flight.
+
+        Args:
+            key: Identity of the request
+            fn: Zero-argument callable performing it
+
+        Returns:
+            Result of the leader's call
+        """
+        with self._lock:
+            self.calls += 1
+            call = self._inflight.get(key)
+            if call is not None:
+                self.deduplicated += 1
+                leader = False
+            else:
+                call = self._inflight[key] = _Call()
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._inflight[key]
+            call.done.set()
+
+        return call.result
+
+    async def ado(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Await `fn()` unless an identical call is already in flight.
+
+        Calls are coalesced per event loop. A waiter being cancelled does
+        not cancel the shared call.
+
+        Args:
+            key: Identity of the request
+            fn: Zero-argument coroutine function performing it
+
+        Returns:
+            Result of the shared call
+        """
+        loop_key = (id(asyncio.get_running_loop()), key)
+
+        with self._lock:
+            self.calls += 1
+            task = self._tasks.get(loop_key)
+            if task is not None:
+                self.deduplicated += 1
+            else:
+                task = self._tasks[loop_key] = asyncio.ensure_future(fn())
+                task.add_done_callback(lambda _: self._forget(loop_key))
+
+        return await asyncio.shield(task)
+
+    def _forget(self, loop_key):
+        with self._lock:
+            self._tasks.pop(loop_key, None)
+
+    def stats(self) -> Dict[str, Any]:
+        """Report total calls, deduplicated calls and calls in flight."""
+        with self._lock:
+            return {
+                'calls': self.calls,
+                'deduplicated': self.deduplicated,
+                'inflight': len(self._inflight) + len(self._tasks),
+            }
+
+
+_default_singleflight: Optional[SingleFlight] = None
+_default_lock = threading.Lock()
+
+
+def get_default_singleflight() -> SingleFlight:
+    """
+    Get the process-wide SingleFlight, creating it on first use.
+
+    Returns:
+        Shared SingleFlight instance
+    """
+    global _default_singleflight
+
+    with _default_lock:
+        if _default_singleflight is None:
+            _default_singleflight = SingleFlight()
+        return _default_singleflight
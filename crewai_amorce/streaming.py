@@ -0,0 +1,206 @@
+"""
+Streaming tool results
+
+Passes tool output through chunk by chunk while hashing it, then
+signs a trailer binding the call to the digest of the complete
+output. Memory stays flat however large the output is, and the agent
+sees the first chunk as soon as the tool produces it.
+"""
+
+import base64
+import hashlib
+from typing import Optional, Any, Dict, Iterable, Iterator
+
+from crewai_amorce.canonical import canonical_dumps, canonical_json
+
+
+HASH = "sha256"
+
+# Digest scheme named in the trailer: each chunk is hashed as a type tag
+# and an 8-byte big-endian length ahead of its bytes, so chunk
+# boundaries and types are part of the digest
+SCHEME = "sha256-framed"
+
+# Trailer fields covered by the signature
+SIGNED_FIELDS = ('call', 'hash', 'digest', 'bytes', 'chunks')
+
+
+def chunk_bytes(chunk: Any) -> bytes:
+    """Bytes a chunk contributes to the digest (str as UTF-8, others as canonical JSON)."""
+    if isinstance(chunk, str):
+        return chunk.encode('utf-8')
+    if isinstance(chunk, (bytes, bytearray, memoryview)):
+        return bytes(chunk)
+    return canonical_json(chunk)
+
+
+def _chunk_tag(chunk: Any) -> bytes:
+    if isinstance(chunk, str):
+        return b's'
+    if isinstance(chunk, (bytes, bytearray, memoryview)):
+        return b'b'
+    return b'j'
+
+
+class StreamHasher:
+    """Running digest and size of a chunk stream."""
+
+    def __init__(self):
+        self._hash = hashlib.new(HASH)
+        self.bytes = 0
+        self.chunks = 0
+
+    def update(self, chunk: Any):
+        data = chunk_bytes(chunk)
+        self._hash.update(_chunk_tag(chunk) + len(data).to_bytes(8, 'big'))
+        self._hash.update(data)
+        self.bytes += len(data)
+        self.chunks += 1
+
+    def hexdigest(self) -> str:
+        return self._hash.hexdigest()
+
+    def payload(self, call_data: Dict[str, Any]) -> Dict[str, Any]:
+        """The trailer payload to sign for `call_data`."""
+        return {
+            'call': call_data,
+            'hash': SCHEME,
+            'digest': self.hexdigest(),
+            'bytes': self.bytes,
+            'chunks': self.chunks,
+        }
+
+
+def verify_stream(chunks: Iterable[Any], trailer: Dict[str, Any], public_key_pem: str) -> bool:
+    """
+    Check received chunks against a signed stream trailer.
+
+    Args:
+        chunks: The chunks, in order (may be a generator)
+        trailer: Trailer from `ToolStream.trailer`
+        public_key_pem: Signer's Ed25519 public key
+
+    Returns:
+        True if the chunks hash to the signed digest and the signature
+        (or batch proof) is valid
+    """
+    hasher = StreamHasher()
+    for chunk in chunks:
+        hasher.update(chunk)
+    try:
+        payload = {field: trailer[field] for field in SIGNED_FIELDS}
+    except KeyError:
+        return False
+    if hasher.payload(payload['call']) != payload:
+        return False
+
+    if 'merkle_root' in trailer:
+        from crewai_amorce.batch_signing import verify_batch_proof
+        return verify_batch_proof(payload, trailer, public_key_pem)
+
+    from cryptography.exceptions import InvalidSignature
+    from cryptography.hazmat.primitives import serialization
+
+    key = serialization.load_pem_public_key(public_key_pem.encode('utf-8'))
+    try:
+        key.verify(base64.b64decode(trailer['signature']), canonical_dumps(payload).encode('utf-8'))
+    except (InvalidSignature, KeyError, ValueError):
+        return False
+    return True
+
+
+class _Stream:
+    """Shared state of sync and async tool streams."""
+
+    def __init__(self, wrapper: Any, call_data: Dict[str, Any]):
+        self.wrapper = wrapper
+        self.call_data = call_data
+        self.hasher = StreamHasher()
+        self._trailer: Optional[Dict[str, Any]] = None
+
+    @property
+    def trailer(self) -> Dict[str, Any]:
+        """
+        Signed trailer: the call, digest, size and chunk count plus
+        the signature (or batch proof) fields.
+
+        Raises:
+            RuntimeError: The stream has not been read to the end
+        """
+        if self._trailer is None:
+            raise RuntimeError("Stream not finished; the trailer is signed after the last chunk")
+        return self._trailer
+
+    def _finish(self, proof: Dict[str, Any], payload: Dict[str, Any]):
+        self._trailer = {**payload, **proof}
+
+
+class ToolStream(_Stream):
+    """
+    Chunks of a streaming tool call, followed by a signed trailer.
+
+    Example:
+        ```python
+        stream = report_tool.stream(quarter="Q3")
+        for chunk in stream:
+            send(chunk)
+        send_trailer(stream.trailer)
+        ```
+    """
+
+    def __init__(self, wrapper: Any, call_data: Dict[str, Any], source: Iterator[Any]):
+        super().__init__(wrapper, call_data)
+        self._source = source
+
+    def __iter__(self) -> 'ToolStream':
+        return self
+
+    def __next__(self) -> Any:
+        if self._trailer is not None:
+            raise StopIteration
+        try:
+            chunk = next(self._source)
+        except StopIteration:
+            payload = self.hasher.payload(self.call_data)
+            signing = self.wrapper._sign(payload)
+            signing.add_done_callback(lambda done: self.wrapper._audit(payload, done, 'tool_stream'))
+            self._finish(signing.result(), payload)
+            raise
+        self.hasher.update(chunk)
+        return chunk
+
+
+class AsyncToolStream(_Stream):
+    """Async counterpart of ToolStream (from `AmorceToolWrapper.astream`)."""
+
+    _DONE = object()
+
+    def __init__(self, wrapper: Any, call_data: Dict[str, Any], source: Any):
+        super().__init__(wrapper, call_data)
+        self._source = source
+
+    def __aiter__(self) -> 'AsyncToolStream':
+        return self
+
+    async def __anext__(self) -> Any:
+        import asyncio
+
+        if self._trailer is not None:
+            raise StopAsyncIteration
+        if hasattr(self._source, '__anext__'):
+            try:
+                chunk = await self._source.__anext__()
+            except StopAsyncIteration:
+                chunk = self._DONE
+        else:
+            # Sync generator: produce each chunk off the event loop
+            chunk = await asyncio.to_thread(next, self._source, self._DONE)
+
+        if chunk is self._DONE:
+            payload = self.hasher.payload(self.call_data)
+            signing = self.wrapper._sign(payload)
+            signing.add_done_callback(lambda done: self.wrapper._audit(payload, done, 'tool_stream'))
+            self._finish(await asyncio.wrap_future(signing), payload)
+            raise StopAsyncIteration
+        self.hasher.update(chunk)
+        return chunk
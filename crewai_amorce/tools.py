@@ -2,7 +2,73 @@
 Amorce-wrapped CrewAI tools with signatures + HITL
 """
 
-from typing import Optional, Any
+import threading
+import time
+import weakref
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Optional, Any, Dict, Iterable, List
+
+from crewai_amorce.metrics import (
+    NULL_TIMER,
+    TOOL_CALLS_TOTAL,
+    TOOL_STAGE_SECONDS,
+    get_default_metrics,
+)
+
+
+# Tool calls are mostly I/O-bound; size the pool for fan-out
+MAX_WORKERS = 32
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Shared worker pool for tools started with `submit()` or `run_many()`."""
+    global _executor
+
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="amorce-tool")
+        return _executor
+
+
+@dataclass
+class ToolCall:
+    """One invocation for `run_many` / `arun_many`."""
+    
+    args: tuple = ()
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+    timeout: Optional[float] = None
+    
+    @classmethod
+    def of(cls, call: Any) -> 'ToolCall':
+        """ToolCall as is; a dict is kwargs, a tuple or list args, anything else one arg."""
+        if isinstance(call, ToolCall):
+            return call
+        if isinstance(call, dict):
+            return cls(kwargs=call)
+        if isinstance(call, (tuple, list)):
+            return cls(args=tuple(call))
+        return cls(args=(call,))
+
+
+class _Slot:
+    """A concurrency slot released exactly once."""
+    
+    def __init__(self, semaphore: threading.Semaphore):
+        self._semaphore = semaphore
+        self._released = False
+        self._lock = threading.Lock()
+    
+    def release(self, *_):
+        with self._lock:
+            if self._released:
+                return
+            self._released = True
+        self._semaphore.release()
 
 
 class AmorceToolWrapper:
@@ -10,9 +76,20 @@ class AmorceToolWrapper:
     Wraps CrewAI tool with Amorce security.
     
     Adds:
-    - Ed25519 signatures to tool calls
+    - Ed25519 signatures to tool calls (optionally Merkle-batched)
     - HITL approvals for sensitive operations
     - Transaction logging
+    - Opt-in memoization of idempotent tools
+    
+    A tool is memoized when it is marked safe to cache, either with
+    `cacheable=True` or a `cacheable = True` attribute on the tool
+    (optionally with `cache_ttl` and `cache_max_entries`). Identical
+    calls within the TTL return the first call's signed result, with
+    its original signature and `cache_hit: True`. HITL tools are never
+    memoized.
+    
+    `run_many` / `arun_many` fan independent calls out concurrently,
+    at most `max_concurrency` of this tool at a time.
     """
     
     def __init__(
@@ -20,7 +97,14 @@ class AmorceToolWrapper:
         tool: Any,
         identity: Any,
         client: Any,
-        requires_hitl: bool = False
+        requires_hitl: bool = False,
+        approval_timeout: float = 300,
+        batch_signer: Optional[Any] = None,
+        audit_log: Optional[Any] = None,
+        cacheable: Optional[bool] = None,
+        cache: Optional[Any] = None,
+        max_concurrency: Optional[int] = None,
+        metrics: Optional[Any] = None
     ):
         """
         Initialize tool wrapper.
@@ -30,6 +114,20 @@ class AmorceToolWrapper:
             identity: Amorce IdentityManager
             client: Amorce client
             requires_hitl: Whether this tool requires human approval
+            approval_timeout: Seconds to wait for a HITL decision
+            batch_signer: BatchSigner to sign calls in Merkle batches
+                (one signature per call if None)
+            audit_log: AuditLog recording every signed call
+            cacheable: Tool is idempotent and may be memoized (the
+                tool's `cacheable` attribute if None)
+            cache: ResultCache for memoized results (per-tool memory
+                cache sized by the tool's `cache_ttl` and
+                `cache_max_entries` if None)
+            max_concurrency: Calls of this tool running at once in
+                `run_many` / `arun_many` (the tool's `max_concurrency`
+                attribute, else 8, if None)
+            metrics: MetricsSink for per-stage latencies (the process
+                default, a no-op unless enabled, if None)
         """
         self.tool = tool
         self.name = getattr(tool, 'name', tool.__class__.__name__)
@@ -37,72 +135,568 @@ class AmorceToolWrapper:
         self.identity = identity
         self.client = client
         self.requires_hitl = requires_hitl
-    
-    def run(self, *args, **kwargs) -> Any:
-        """
-        Run tool with Amorce signature.
+        self.approval_timeout = approval_timeout
+        self.batch_signer = batch_signer
+        self.audit_log = audit_log
+        self.metrics = metrics
         
-        Returns tool result with security metadata.
-        """
-        import json
+        if cacheable is None:
+            cacheable = bool(getattr(tool, 'cacheable', False))
+        self.cache = None
+        if cacheable and not requires_hitl:
+            if cache is None:
+                from crewai_amorce.cache import ResultCache
+                cache = ResultCache(
+                    ttl=getattr(tool, 'cache_ttl', 60.0),
+                    stale_ttl=0,
+                    max_entries=getattr(tool, 'cache_max_entries', 256)
+                )
+            self.cache = cache
         
-        # Prepare tool call data
-        call_data = {
+        self.max_concurrency = max_concurrency or getattr(tool, 'max_concurrency', 8)
+        self._slots = threading.Semaphore(self.max_concurrency)
+        self._async_slots: "weakref.WeakKeyDictionary[Any, Any]" = weakref.WeakKeyDictionary()
+    
+    def _cache_key(self, args: tuple, kwargs: dict) -> str:
+        """Canonical digest of the call (same payload that gets signed)."""
+        from crewai_amorce.canonical import canonical_digest
+        return f"tool|{self.name}|{canonical_digest(self._call_data(args, kwargs)).hex()}"
+    
+    def _mark(self, result: Dict[str, Any], loaded: list) -> Dict[str, Any]:
+        """Tag results that did not come from this call's own execution."""
+        if loaded and loaded[0] is result:
+            return result
+        self._metrics().increment(
+            TOOL_CALLS_TOTAL, 1.0,
+            {'tool': self.name, 'agent': self.identity.agent_id, 'outcome': 'cache_hit'}
+        )
+        return {**result, 'cache_hit': True}
+    
+    def _metrics(self) -> Any:
+        return self.metrics if self.metrics is not None else get_default_metrics()
+    
+    def _timer(self) -> Any:
+        """Stage timer for one call (a no-op when metrics are off)."""
+        return self._metrics().timer(
+            TOOL_STAGE_SECONDS, TOOL_CALLS_TOTAL, tool=self.name, agent=self.identity.agent_id
+        )
+    
+    @staticmethod
+    def _outcome(error: BaseException) -> str:
+        if isinstance(error, PermissionError):
+            return 'denied'
+        if isinstance(error, TimeoutError):
+            return 'timeout'
+        return 'error'
+    
+    def _call_data(self, args: tuple, kwargs: dict) -> dict:
+        """The tool call record that gets signed."""
+        return {
             'tool': self.name,
             'args': list(args),
             'kwargs': kwargs,
             'agent_id': self.identity.agent_id
         }
+    
+    def _prepare(self, args: tuple, kwargs: dict, timer: Any = NULL_TIMER):
+        """Build and sign the tool call record."""
+        call_data = self._call_data(args, kwargs)
         
         # Sign the tool call
-        signature = self.identity.sign(json.dumps(call_data, sort_keys=True))
-        
-        # HITL if required
-        if self.requires_hitl:
-            print(f"\n⏸️  HUMAN APPROVAL REQUIRED for {self.name}")
-            print(f"   Tool: {self.name}")
-            print(f"   Agent: {self.identity.agent_id}")
-            
-            approval_id = self.client.request_approval(
-                summary=f"Approve {self.name} execution",
-                details=call_data,
-                timeout_seconds=300
+        signing = self._sign(call_data, timer)
+        signing.add_done_callback(lambda done: self._audit(call_data, done))
+        return call_data, signing
+    
+    def _audit(self, payload: dict, signing: Future, kind: str = 'tool_call'):
+        """Record a signed call in the audit log, if there is one."""
+        if self.audit_log is not None and signing.exception() is None:
+            self.audit_log.append(
+                kind, self.identity.agent_id, payload,
+                proof=signing.result(), tool=self.name
             )
-            
-            # Wait for approval
-            import time
-            max_wait = 300
-            start_time = time.time()
-            
-            while time.time() - start_time < max_wait:
-                status = self.client.check_approval(approval_id)
-                
-                if status['status'] == 'approved':
-                    print(f"✅ Approval granted for {self.name}")
-                    break
-                elif status['status'] in ['rejected', 'expired']:
-                    raise PermissionError(f"HITL approval denied for {self.name}")
-                
-                time.sleep(1)
-            else:
-                raise TimeoutError(f"HITL approval timeout for {self.name}")
+    
+    def _sign(self, payload: dict, timer: Any = NULL_TIMER) -> Future:
+        """Sign now, or queue on the batch signer; resolves to proof fields."""
+        if self.batch_signer is not None:
+            future = self.batch_signer.submit(payload)
+            # Leaf hashing; the batch signature is timed when awaited
+            timer.mark('serialize')
+            return future
         
-        # Execute original tool
+        from crewai_amorce.canonical import canonical_dumps
+        
+        message = canonical_dumps(payload)
+        timer.mark('serialize')
+        future: Future = Future()
+        future.set_result({'signature': self.identity.sign(message)})
+        timer.mark('sign')
+        return future
+    
+    def _request_approval(self, call_data: dict):
+        """Ask for human approval; returns (tracker, approval_id)."""
+        print(f"\n⏸️  HUMAN APPROVAL REQUIRED for {self.name}")
+        print(f"   Tool: {self.name}")
+        print(f"   Agent: {self.identity.agent_id}")
+        
+        from crewai_amorce.approvals import get_tracker
+        
+        tracker = get_tracker(self.client)
+        approval_id = tracker.request(
+            summary=f"Approve {self.name} execution",
+            details=call_data,
+            timeout_seconds=int(self.approval_timeout),
+            timeout=self.approval_timeout
+        )
+        return tracker, approval_id
+    
+    def _approve(self, call_data: dict):
+        """Request approval and block until it is granted (HITL tools only)."""
+        if not self.requires_hitl:
+            return
+        tracker, approval_id = self._request_approval(call_data)
+        
+        # Wait for approval (shared tracker, pushed decision or backoff polling)
+        try:
+            tracker.wait(approval_id, timeout=self.approval_timeout)
+        except (PermissionError, TimeoutError) as e:
+            raise self._approval_error(e)
+        
+        print(f"✅ Approval granted for {self.name}")
+    
+    async def _aapprove(self, call_data: dict):
+        """Async `_approve`: awaiting the decision leaves the loop free."""
+        if not self.requires_hitl:
+            return
+        import asyncio
+        
+        tracker, approval_id = await asyncio.to_thread(self._request_approval, call_data)
+        try:
+            await tracker.await_decision(approval_id, timeout=self.approval_timeout)
+        except (PermissionError, TimeoutError) as e:
+            raise self._approval_error(e)
+        
+        print(f"✅ Approval granted for {self.name}")
+    
+    def _approval_error(self, error: Exception) -> Exception:
+        """Map a tracker failure to the wrapper's HITL error."""
+        if isinstance(error, PermissionError):
+            return PermissionError(f"HITL approval denied for {self.name}")
+        if isinstance(error, TimeoutError):
+            return TimeoutError(f"HITL approval timeout for {self.name}")
+        return error
+    
+    def _execute(
+        self, args: tuple, kwargs: dict, signing: Future, timer: Any = NULL_TIMER
+    ) -> Dict[str, Any]:
+        """Run the original tool and attach the signature proof."""
         if hasattr(self.tool, 'run'):
             result = self.tool.run(*args, **kwargs)
         elif callable(self.tool):
             result = self.tool(*args, **kwargs)
         else:
             raise TypeError(f"Tool {self.name} is not callable")
+        timer.mark('tool')
         
-        # Return with signature proof
+        proof = signing.result()
+        if self.batch_signer is not None:
+            timer.mark('sign')
+        return self._signed(result, proof)
+    
+    def _signed(self, result: Any, proof: Dict[str, Any]) -> Dict[str, Any]:
         return {
             'result': result,
             'tool': self.name,
             'agent_id': self.identity.agent_id,
-            'signature': signature
+            **proof
         }
     
+    def run(self, *args, **kwargs) -> Any:
+        """
+        Run tool with Amorce signature.
+        
+        Returns tool result with security metadata. HITL tools block
+        until approval; use `submit` or `arun` to keep working meanwhile.
+        """
+        if self.cache is not None:
+            loaded = []
+            
+            def load():
+                loaded.append(self._run(args, kwargs))
+                return loaded[0]
+            
+            result = self.cache.get_or_load(self._cache_key(args, kwargs), load)
+            return self._mark(result, loaded)
+        return self._run(args, kwargs)
+    
+    def _run(self, args: tuple, kwargs: dict) -> Dict[str, Any]:
+        timer = self._timer()
+        try:
+            call_data, signing = self._prepare(args, kwargs, timer)
+            
+            # HITL if required
+            if self.requires_hitl:
+                self._approve(call_data)
+                timer.mark('hitl_wait')
+            
+            output = self._execute(args, kwargs, signing, timer)
+        except Exception as e:
+            timer.finish(self._outcome(e))
+            raise
+        timer.finish()
+        return output
+    
+    def submit(self, *args, **kwargs) -> 'PendingToolCall':
+        """
+        Start a tool call without waiting for approval.
+        
+        The call is signed and (for HITL tools) approval is requested
+        immediately; the tool itself runs on a worker thread once the
+        decision arrives, so the caller can carry on with other work.
+        
+        Returns:
+            PendingToolCall handle
+        """
+        if self.cache is not None:
+            # Memoized tools are never HITL: just run (or hit) on the pool
+            return PendingToolCall(self, None, _get_executor().submit(self.run, *args, **kwargs))
+        
+        timer = self._timer()
+        call_data, signing = self._prepare(args, kwargs, timer)
+        future: Future = Future()
+        
+        def execute():
+            if not future.set_running_or_notify_cancel():
+                return
+            # Time spent queued for a worker is not a stage
+            timer.skip()
+            try:
+                future.set_result(self._execute(args, kwargs, signing, timer))
+            except BaseException as e:
+                timer.finish(self._outcome(e))
+                future.set_exception(e)
+            else:
+                timer.finish()
+        
+        if not self.requires_hitl:
+            _get_executor().submit(execute)
+            return PendingToolCall(self, None, future)
+        
+        tracker, approval_id = self._request_approval(call_data)
+        
+        def on_decision(approval: Future):
+            timer.mark('hitl_wait')
+            error = approval.exception()
+            if error is not None:
+                if future.set_running_or_notify_cancel():
+                    error = self._approval_error(error)
+                    timer.finish(self._outcome(error))
+                    future.set_exception(error)
+                return
+            print(f"✅ Approval granted for {self.name}")
+            _get_executor().submit(execute)
+        
+        tracker.track(approval_id, timeout=self.approval_timeout).add_done_callback(on_decision)
+        return PendingToolCall(self, approval_id, future)
+    
+    async def arun(self, *args, **kwargs) -> Any:
+        """
+        Async version of `run`.
+        
+        Awaiting approval does not block the event loop, so other
+        agents and tools keep running while a human decides.
+        """
+        if self.cache is not None:
+            loaded = []
+            
+            async def load():
+                loaded.append(await self._arun(args, kwargs))
+                return loaded[0]
+            
+            result = await self.cache.aget_or_load(self._cache_key(args, kwargs), load)
+            return self._mark(result, loaded)
+        return await self._arun(args, kwargs)
+    
+    async def _arun(self, args: tuple, kwargs: dict) -> Dict[str, Any]:
+        import asyncio
+        
+        timer = self._timer()
+        try:
+            call_data, signing = self._prepare(args, kwargs, timer)
+            if self.requires_hitl:
+                await self._aapprove(call_data)
+                timer.mark('hitl_wait')
+            
+            if hasattr(self.tool, 'arun'):
+                result = await self.tool.arun(*args, **kwargs)
+            elif asyncio.iscoroutinefunction(self.tool):
+                result = await self.tool(*args, **kwargs)
+            else:
+                output = await asyncio.to_thread(self._execute, args, kwargs, signing, timer)
+                timer.finish()
+                return output
+            timer.mark('tool')
+            
+            proof = await asyncio.wrap_future(signing)
+            if self.batch_signer is not None:
+                timer.mark('sign')
+        except Exception as e:
+            timer.finish(self._outcome(e))
+            raise
+        timer.finish()
+        return self._signed(result, proof)
+    
+    def stream(self, *args, **kwargs) -> Any:
+        """
+        Run the tool in streaming mode.
+        
+        Chunks are passed through as the tool produces them (from its
+        `stream()` method, or a generator returned by `run()`) while
+        their SHA-256 is computed. Once the last chunk has been read,
+        `stream.trailer` holds the call, digest and size under one
+        signature, so memory stays flat and nothing waits for the
+        whole output. HITL tools are approved before the first chunk.
+        
+        Returns:
+            ToolStream (iterate it, then read `.trailer`)
+        
+        Example:
+            ```python
+            from crewai_amorce.streaming import verify_stream
+            
+            stream = report_tool.stream("Q3")
+            chunks = [chunk for chunk in stream]
+            assert verify_stream(chunks, stream.trailer, identity.public_key_pem)
+            ```
+        """
+        from crewai_amorce.streaming import ToolStream
+        
+        call_data = self._call_data(args, kwargs)
+        self._approve(call_data)
+        return ToolStream(self, call_data, self._open_stream(args, kwargs))
+    
+    async def astream(self, *args, **kwargs) -> Any:
+        """
+        Async version of `stream`.
+        
+        Uses the tool's `astream()` async generator if it has one;
+        sync generators are advanced on a worker thread.
+        
+        Returns:
+            AsyncToolStream (iterate with `async for`, then read `.trailer`)
+        """
+        import asyncio
+        from crewai_amorce.streaming import AsyncToolStream
+        
+        call_data = self._call_data(args, kwargs)
+        await self._aapprove(call_data)
+        if hasattr(self.tool, 'astream'):
+            source = self.tool.astream(*args, **kwargs)
+        else:
+            source = await asyncio.to_thread(self._open_stream, args, kwargs)
+        return AsyncToolStream(self, call_data, source)
+    
+    def _open_stream(self, args: tuple, kwargs: dict):
+        """Iterator over the tool's output chunks."""
+        if hasattr(self.tool, 'stream'):
+            output = self.tool.stream(*args, **kwargs)
+        elif hasattr(self.tool, 'run'):
+            output = self.tool.run(*args, **kwargs)
+        elif callable(self.tool):
+            output = self.tool(*args, **kwargs)
+        else:
+            raise TypeError(f"Tool {self.name} is not callable")
+        
+        if isinstance(output, (str, bytes, bytearray, memoryview, dict)) or not hasattr(output, '__iter__'):
+            # Not a stream: a single chunk
+            return iter((output,))
+        return iter(output)
+    
+    def run_many(
+        self,
+        calls: Iterable[Any],
+        timeout: Optional[float] = None,
+        return_exceptions: bool = True
+    ) -> List[Any]:
+        """
+        Sign and run independent calls concurrently.
+        
+        Calls run on the shared tool pool, at most `max_concurrency`
+        at once (across all callers of this wrapper). A call that
+        fails or times out does not affect the others: its slot in
+        the result list holds the exception instead. A timed-out call
+        keeps its concurrency slot until its thread actually returns.
+        
+        Args:
+            calls: ToolCall objects, kwargs dicts, args tuples or single args
+            timeout: Seconds each call may run, from when it starts
+                (overridden by `ToolCall.timeout`)
+            return_exceptions: Put errors in the results; if False,
+                raise the first error (in input order) once all
+                calls have finished
+        
+        Returns:
+            Signed results (or exceptions), in input order
+        
+        Example:
+            ```python
+            results = search_tool.run_many(
+                [{"query": q} for q in queries], timeout=30
+            )
+            ```
+        """
+        calls = [ToolCall.of(call) for call in calls]
+        results: List[Any] = [None] * len(calls)
+        queue = deque(range(len(calls)))
+        # future -> (index, deadline)
+        running: Dict[Future, Any] = {}
+        executor = _get_executor()
+        
+        while queue or running:
+            # With nothing of ours running, block until another caller frees a slot
+            while queue and self._slots.acquire(blocking=not running):
+                index = queue.popleft()
+                call = calls[index]
+                slot = _Slot(self._slots)
+                limit = call.timeout if call.timeout is not None else timeout
+                future = executor.submit(self.run, *call.args, **call.kwargs)
+                future.add_done_callback(slot.release)
+                running[future] = (index, None if limit is None else time.monotonic() + limit)
+            
+            deadlines = [deadline for _, deadline in running.values() if deadline is not None]
+            wait_for = max(0.0, min(deadlines) - time.monotonic()) if deadlines else None
+            done, _ = wait(list(running), timeout=wait_for, return_when=FIRST_COMPLETED)
+            
+            for future in done:
+                index, _ = running.pop(future)
+                error = future.exception()
+                results[index] = error if error is not None else future.result()
+            
+            now = time.monotonic()
+            for future, (index, deadline) in list(running.items()):
+                if deadline is not None and now >= deadline:
+                    # The thread cannot be stopped: stop waiting for it, but its
+                    # slot is only released (by the done-callback) when it returns
+                    del running[future]
+                    future.cancel()
+                    results[index] = TimeoutError(f"Tool call {self.name} timed out")
+        
+        return self._collect(results, return_exceptions)
+    
+    async def arun_many(
+        self,
+        calls: Iterable[Any],
+        timeout: Optional[float] = None,
+        return_exceptions: bool = True
+    ) -> List[Any]:
+        """
+        Async version of `run_many`.
+        
+        Calls run as coroutines (async tools) or on threads (sync
+        tools), at most `max_concurrency` at once on this event loop.
+        A timed-out async call is cancelled; a timed-out sync call keeps
+        its slot until its thread returns.
+        """
+        import asyncio
+        
+        loop = asyncio.get_running_loop()
+        slots = self._async_slots.get(loop)
+        if slots is None:
+            slots = self._async_slots[loop] = asyncio.Semaphore(self.max_concurrency)
+        
+        # Sync tools run on threads, which cannot be cancelled
+        on_thread = not hasattr(self.tool, 'arun') and not asyncio.iscoroutinefunction(self.tool)
+        
+        def finished(task: Any):
+            # The slot is held until the call itself ends, not just our wait
+            slots.release()
+            if not task.cancelled():
+                task.exception()
+        
+        async def one(call: ToolCall) -> Any:
+            limit = call.timeout if call.timeout is not None else timeout
+            await slots.acquire()
+            task = asyncio.ensure_future(self.arun(*call.args, **call.kwargs))
+            task.add_done_callback(finished)
+            try:
+                return await asyncio.wait_for(asyncio.shield(task), limit)
+            except asyncio.TimeoutError:
+                if task.done():
+                    # The tool's own TimeoutError (same class on 3.11+)
+                    raise
+                if not on_thread:
+                    task.cancel()
+                raise TimeoutError(f"Tool call {self.name} timed out")
+        
+        results = await asyncio.gather(
+            *(one(ToolCall.of(call)) for call in calls), return_exceptions=True
+        )
+        return self._collect(results, return_exceptions)
+    
+    @staticmethod
+    def _collect(results: List[Any], return_exceptions: bool) -> List[Any]:
+        if not return_exceptions:
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+        return results
+    
     def __call__(self, *args, **kwargs):
         """Make wrapper callable."""
         return self.run(*args, **kwargs)
+
+
+
+class PendingToolCall:
+    """
+    Handle for a tool call started with `AmorceToolWrapper.submit()`.
+    
+    Example:
+        ```python
+        pending = refund_tool.submit(order_id="A-1")
+        # ... other tools and agents keep running ...
+        print(pending.result(timeout=300)['result'])
+        ```
+    """
+    
+    def __init__(self, wrapper: AmorceToolWrapper, approval_id: Optional[str], future: Future):
+        self.wrapper = wrapper
+        self.approval_id = approval_id
+        self.future = future
+    
+    def done(self) -> bool:
+        """Whether the tool has finished (or failed / was denied)."""
+        return self.future.done()
+    
+    def result(self, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Wait for the signed tool result.
+        
+        Raises:
+            PermissionError: Approval denied
+            TimeoutError: Approval (or `timeout`) timed out
+        """
+        from concurrent.futures import TimeoutError as FutureTimeoutError
+        
+        try:
+            return self.future.result(timeout=timeout)
+        except FutureTimeoutError:
+            if self.future.done():
+                # The call itself failed with a timeout (same class on 3.11+)
+                raise
+            raise TimeoutError(f"Tool call {self.wrapper.name} still pending")
+    
+    def cancel(self) -> bool:
+        """
+        Cancel the call if the tool has not started yet.
+        
+        Also withdraws the local wait on the approval.
+        """
+        cancelled = self.future.cancel()
+        if cancelled and self.approval_id is not None:
+            from crewai_amorce.approvals import get_tracker
+            get_tracker(self.wrapper.client).cancel(self.approval_id)
+        return cancelled
+    
+    def add_done_callback(self, fn):
+        """Call `fn(handle)` once the call finishes."""
+        self.future.add_done_callback(lambda _: fn(self))
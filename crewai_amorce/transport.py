@@ -0,0 +1,392 @@
+"""
+Shared HTTP transport for Amorce APIs
+
+Connection-pooled, keep-alive sessions with per-request timeouts, so
+repeated Trust API lookups reuse sockets instead of paying a new
+TCP+TLS handshake on every call.
+"""
+
+import asyncio
+import threading
+import weakref
+from typing import Optional, Dict, Any, Tuple, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+# (connect, read) timeout in seconds
+DEFAULT_TIMEOUT: Tuple[float, float] = (3.05, 10.0)
+
+Timeout = Union[float, Tuple[float, float]]
+
+
+class HTTPTransport:
+    """
+    Pooled HTTP transport shared by the Amorce tools.
+
+    Wraps a single `requests.Session` mounted with a sized connection
+    pool. Every request gets a timeout (the transport default unless
+    overridden per call).
+
+    Example:
+        ```python
+        from crewai_amorce.transport import HTTPTransport
+        from crewai_amorce.discovery import get_discovery_tools
+
+        transport = HTTPTransport(pool_maxsize=64, timeout=5)
+        tools = get_discovery_tools(transport=transport)
+
+        print(transport.stats())
+        ```
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 32,
+        timeout: Timeout = DEFAULT_TIMEOUT,
+        keep_alive: bool = True,
+        max_retries: int = 0,
+        headers: Optional[Dict[str, str]] = None
+    ):
+        """
+        Initialize transport.
+
+        Args:
+            pool_connections: Number of host pools to keep
+            pool_maxsize: Max connections kept alive per host
+            timeout: Default timeout, seconds or (connect, read)
+            keep_alive: Reuse connections between requests
+            max_retries: Retries on connection errors
+            headers: Extra headers sent with every request
+        """
+        self.timeout = timeout
+        self.keep_alive = keep_alive
+
+        self._adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=max_retries
+        )
+
+        self.session = requests.Session()
+        self.session.mount("https://", self._adapter)
+        self.session.mount("http://", self._adapter)
+        self.session.headers["Connection"] = "keep-alive" if keep_alive else "close"
+        if headers:
+            self.session.headers.update(headers)
+
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._errors = 0
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        timeout: Optional[Timeout] = None,
+        **kwargs
+    ) -> requests.Response:
+        """
+        Send a request through the pooled session.
+
+        Args:
+            method: HTTP method
+            url: Absolute URL
+            timeout: Per-request timeout (transport default if None)
+            **kwargs: Passed through to `requests.Session.request`
+
+        Returns:
+            The `requests.Response`
+        """
+        with self._lock:
+            self._requests += 1
+        try:
+            return self.session.request(
+                method,
+                url,
+                timeout=self.timeout if timeout is None else timeout,
+                **kwargs
+            )
+        except requests.RequestException:
+            with self._lock:
+                self._errors += 1
+            raise
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """Send a GET request."""
+        return self.request("GET", url, **kwargs)
+
+    def get_json(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[Timeout] = None
+    ) -> Any:
+        """
+        GET a URL and decode its JSON body.
+
+        Raises:
+            requests.HTTPError: On a non-2xx response
+        """
+        response = self.get(url, params=params, timeout=timeout)
+        response.raise_for_status()
+        return response.json()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Report connection pool statistics.
+
+        Returns:
+            Dict with `requests` sent, `connections` opened, `pool_hits`
+            (requests served on an already open connection), `hit_rate`,
+            `errors`, `idle_sockets` kept alive in the pool and the number
+            of live host `pools`.
+        """
+        pools = self._adapter.poolmanager.pools
+        num_requests = 0
+        num_connections = 0
+        num_pools = 0
+        idle_sockets = 0
+
+        # RecentlyUsedContainer refuses direct iteration
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            num_pools += 1
+            num_requests += pool.num_requests
+            num_connections += pool.num_connections
+            if pool.pool is not None:
+                idle_sockets += sum(
+                    1 for conn in list(pool.pool.queue)
+                    if conn is not None and getattr(conn, 'sock', None) is not None
+                )
+
+        pool_hits = max(num_requests - num_connections, 0)
+
+        with self._lock:
+            return {
+                'requests': self._requests,
+                'errors': self._errors,
+                'connections': num_connections,
+                'pool_hits': pool_hits,
+                'hit_rate': pool_hits / num_requests if num_requests else 0.0,
+                'idle_sockets': idle_sockets,
+                'pools': num_pools,
+            }
+
+    def share_pool(self, session: requests.Session):
+        """
+        Point another session's HTTP adapters at this transport's pool.
+
+        The session keeps its own headers, auth and hooks, and each
+        adapter keeps its own retry policy; only the connection pool
+        is shared.
+
+        Args:
+            session: Session to rewire (e.g. an AmorceClient's)
+        """
+        for prefix, adapter in list(session.adapters.items()):
+            if not isinstance(adapter, HTTPAdapter) or adapter.poolmanager is self._adapter.poolmanager:
+                continue
+            pooled = HTTPAdapter(max_retries=adapter.max_retries)
+            pooled.poolmanager.clear()
+            pooled.poolmanager = self._adapter.poolmanager
+            session.mount(prefix, pooled)
+            adapter.close()
+
+    def close(self):
+        """Close all pooled connections."""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class AsyncHTTPTransport:
+    """
+    Pooled async HTTP transport built on `httpx.AsyncClient`.
+
+    All coroutines on an event loop share one client and its connection
+    pool. httpx connections cannot cross event loops, so a separate
+    client is kept per loop.
+
+    Example:
+        ```python
+        from crewai_amorce.transport import AsyncHTTPTransport
+        from crewai_amorce.discovery import get_discovery_tools
+
+        tools = get_discovery_tools(async_transport=AsyncHTTPTransport(max_connections=64))
+        result = await tools[0].arun("book flights to Paris")
+        ```
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 32,
+        max_keepalive_connections: int = 16,
+        keepalive_expiry: float = 30.0,
+        timeout: Timeout = DEFAULT_TIMEOUT,
+        headers: Optional[Dict[str, str]] = None
+    ):
+        """
+        Initialize async transport.
+
+        Args:
+            max_connections: Max concurrent connections per loop
+            max_keepalive_connections: Idle connections kept open
+            keepalive_expiry: Seconds an idle connection is kept
+            timeout: Default timeout, seconds or (connect, read)
+            headers: Extra headers sent with every request
+        """
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.timeout = timeout
+        self.headers = headers or {}
+
+        self._clients = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._errors = 0
+
+    def _httpx_timeout(self, timeout: Timeout):
+        import httpx
+
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            return httpx.Timeout(read, connect=connect)
+        return httpx.Timeout(timeout)
+
+    def _client(self):
+        """Get the client for the running event loop."""
+        try:
+            import httpx
+        except ImportError:
+            raise ImportError(
+                "httpx is required for async Amorce tools. "
+                "Install with: pip install httpx"
+            )
+
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            client = self._clients.get(loop)
+            if client is None:
+                client = httpx.AsyncClient(
+                    limits=httpx.Limits(
+                        max_connections=self.max_connections,
+                        max_keepalive_connections=self.max_keepalive_connections,
+                        keepalive_expiry=self.keepalive_expiry
+                    ),
+                    timeout=self._httpx_timeout(self.timeout),
+                    headers=self.headers
+                )
+                self._clients[loop] = client
+            return client
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        timeout: Optional[Timeout] = None,
+        **kwargs
+    ) -> Any:
+        """
+        Send a request through the loop's pooled client.
+
+        Args:
+            method: HTTP method
+            url: Absolute URL
+            timeout: Per-request timeout (transport default if None)
+            **kwargs: Passed through to `httpx.AsyncClient.request`
+
+        Returns:
+            The `httpx.Response`
+        """
+        import httpx
+
+        client = self._client()
+        if timeout is not None:
+            kwargs['timeout'] = self._httpx_timeout(timeout)
+
+        with self._lock:
+            self._requests += 1
+        try:
+            return await client.request(method, url, **kwargs)
+        except httpx.HTTPError:
+            with self._lock:
+                self._errors += 1
+            raise
+
+    async def get_json(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[Timeout] = None
+    ) -> Any:
+        """
+        GET a URL and decode its JSON body.
+
+        Raises:
+            httpx.HTTPStatusError: On a non-2xx response
+        """
+        response = await self.request("GET", url, params=params, timeout=timeout)
+        response.raise_for_status()
+        return response.json()
+
+    def stats(self) -> Dict[str, Any]:
+        """Report request counters and the number of per-loop clients."""
+        with self._lock:
+            return {
+                'requests': self._requests,
+                'errors': self._errors,
+                'clients': len(self._clients),
+            }
+
+    async def aclose(self):
+        """Close the client bound to the running event loop."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            client = self._clients.pop(loop, None)
+        if client is not None:
+            await client.aclose()
+
+
+_default_transport: Optional[HTTPTransport] = None
+_default_async_transport: Optional[AsyncHTTPTransport] = None
+_default_lock = threading.Lock()
+
+
+def get_default_transport() -> HTTPTransport:
+    """
+    Get the process-wide transport, creating it on first use.
+
+    Returns:
+        Shared HTTPTransport instance
+    """
+    global _default_transport
+
+    with _default_lock:
+        if _default_transport is None:
+            _default_transport = HTTPTransport()
+        return _default_transport
+
+
+def get_default_async_transport() -> AsyncHTTPTransport:
+    """
+    Get the process-wide async transport, creating it on first use.
+
+    Returns:
+        Shared AsyncHTTPTransport instance
+    """
+    global _default_async_transport
+
+    with _default_lock:
+        if _default_async_transport is None:
+            _default_async_transport = AsyncHTTPTransport()
+        return _default_async_transport
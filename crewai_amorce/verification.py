@@ -0,0 +1,326 @@
+"""
+Batch verification of incoming A2A envelopes
+
+Resolves sender public keys from the Trust Directory through a cache,
+verifies Ed25519 signatures in batches on a thread pool and yields
+results in arrival order.
+"""
+
+import base64
+import hashlib
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Optional, Any, Dict, Iterable, Iterator, List, Union
+
+from crewai_amorce.a2a import A2AEnvelope
+from crewai_amorce.cache import ResultCache
+from crewai_amorce.registry import DEFAULT_DIRECTORY_URL
+from crewai_amorce.singleflight import SingleFlight, get_default_singleflight
+from crewai_amorce.transport import HTTPTransport, get_default_transport
+
+
+@dataclass
+class VerificationResult:
+    """Outcome of verifying one envelope."""
+
+    envelope: Any
+    valid: bool
+    reason: Optional[str] = None
+
+
+class PublicKeyResolver:
+    """
+    Sender public keys by agent ID, cached.
+
+    Keys come from the Trust Directory (`/api/v1/agents/{agent_id}`) or
+    from `pin()`. Since Amorce agent IDs are the SHA-256 of the public
+    key PEM, a directory key that does not hash to the requested ID is
+    refused.
+    """
+
+    def __init__(
+        self,
+        directory_url: str = DEFAULT_DIRECTORY_URL,
+        transport: Optional[HTTPTransport] = None,
+        cache: Optional[ResultCache] = None,
+        singleflight: Optional[SingleFlight] = None,
+        require_key_binding: bool = True,
+        max_parsed_keys: int = 4096
+    ):
+        """
+        Initialize resolver.
+
+        Args:
+            directory_url: Trust Directory URL
+            transport: Shared HTTP transport (process default if None)
+            cache: Cache for directory keys (1h TTL in memory if None)
+            singleflight: Coalesces concurrent lookups of one agent
+            require_key_binding: Refuse keys that do not hash to the agent ID
+            max_parsed_keys: Parsed key objects kept in memory
+        """
+        self.directory_url = directory_url.rstrip('/')
+        self.transport = transport or get_default_transport()
+        self.cache = cache if cache is not None else ResultCache(ttl=3600, stale_ttl=86400)
+        self.singleflight = singleflight or get_default_singleflight()
+        self.require_key_binding = require_key_binding
+        self.max_parsed_keys = max_parsed_keys
+
+        self._pinned: Dict[str, str] = {}
+        self._parsed: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def pin(self, agent_id: str, public_key_pem: str):
+        """Trust a known key for `agent_id` without asking the directory."""
+        self._pinned[agent_id] = public_key_pem
+
+    def resolve(self, agent_id: str) -> str:
+        """
+        Get the public key PEM for an agent.
+
+        Raises:
+            PermissionError: Directory key does not match the agent ID
+            LookupError: Agent unknown or has no public key
+        """
+        pem = self._pinned.get(agent_id)
+        if pem is not None:
+            return pem
+
+        key = f"{self.directory_url}|public_key|{agent_id}"
+
+        def fetch():
+            import requests
+
+            try:
+                record = self.transport.get_json(f"{self.directory_url}/api/v1/agents/{agent_id}")
+            except requests.HTTPError as e:
+                raise LookupError(f"Agent {agent_id} not found: {e}")
+            if not record.get('public_key'):
+                raise LookupError(f"No public_key for agent {agent_id}")
+            return record['public_key']
+
+        pem = self.cache.get_or_load(key, lambda: self.singleflight.do(key, fetch))
+
+        if self.require_key_binding:
+            derived = hashlib.sha256(pem.strip().encode('utf-8')).hexdigest()
+            if derived != agent_id:
+                raise PermissionError(f"Directory key does not match agent {agent_id}")
+        return pem
+
+    def public_key(self, agent_id: str) -> Any:
+        """Parsed Ed25519 public key for an agent (parsed once per PEM)."""
+        pem = self.resolve(agent_id)
+
+        with self._lock:
+            key = self._parsed.get(pem)
+            if key is not None:
+                self._parsed.move_to_end(pem)
+                return key
+
+        from cryptography.hazmat.primitives import serialization
+        from cryptography.hazmat.primitives.asymmetric import ed25519
+
+        key = serialization.load_pem_public_key(pem.encode('utf-8'))
+        if not isinstance(key, ed25519.Ed25519PublicKey):
+            raise PermissionError(f"Key for agent {agent_id} is not Ed25519")
+
+        with self._lock:
+            self._parsed[pem] = key
+            if len(self._parsed) > self.max_parsed_keys:
+                self._parsed.popitem(last=False)
+        return key
+
+
+class EnvelopeVerifier:
+    """
+    Verify streams of A2A envelopes in batches.
+
+    Envelopes are grouped into batches of `batch_size`; each batch
+    resolves its distinct senders once and is verified on a worker
+    thread. At most `max_inflight` batches are outstanding, so a fast
+    producer cannot queue unbounded work.
+
+    Example:
+        ```python
+        from crewai_amorce.verification import EnvelopeVerifier
+
+        verifier = EnvelopeVerifier()
+        for result in verifier.verify_stream(incoming):
+            if result.valid:
+                handle(result.envelope)
+
+        print(verifier.stats()['envelopes_per_second'])
+        ```
+    """
+
+    def __init__(
+        self,
+        resolver: Optional[PublicKeyResolver] = None,
+        max_workers: int = 4,
+        batch_size: int = 64,
+        max_inflight: Optional[int] = None,
+        replay_guard: Optional[Any] = None
+    ):
+        """
+        Initialize verifier.
+
+        Args:
+            resolver: Public key resolver (directory-backed if None)
+            max_workers: Verification threads
+            batch_size: Envelopes per batch
+            max_inflight: Outstanding batches per stream (2 x workers if None)
+            replay_guard: ReplayGuard applied to validly signed envelopes
+        """
+        self.resolver = resolver or PublicKeyResolver()
+        self.max_workers = max_workers
+        self.batch_size = batch_size
+        self.max_inflight = max_inflight or 2 * max_workers
+        self.replay_guard = replay_guard
+
+        self.verified = 0
+        self.rejected = 0
+        self.batches = 0
+        self.elapsed = 0.0
+
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def _pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="amorce-verify"
+                )
+            return self._executor
+
+    def _verify_batch(self, batch: List[Union[A2AEnvelope, dict]]) -> List[VerificationResult]:
+        from cryptography.exceptions import InvalidSignature
+
+        envelopes = []
+        results: List[Optional[VerificationResult]] = [None] * len(batch)
+        for i, item in enumerate(batch):
+            try:
+                envelopes.append(item if isinstance(item, A2AEnvelope) else A2AEnvelope.from_dict(item))
+            except (KeyError, TypeError) as e:
+                results[i] = VerificationResult(item, False, f"malformed envelope: {e}")
+                envelopes.append(None)
+
+        # One key lookup per distinct sender in the batch
+        keys: Dict[str, Any] = {}
+        errors: Dict[str, str] = {}
+        for envelope in envelopes:
+            if envelope is None or envelope.sender_id in keys or envelope.sender_id in errors:
+                continue
+            try:
+                keys[envelope.sender_id] = self.resolver.public_key(envelope.sender_id)
+            except Exception as e:
+                errors[envelope.sender_id] = f"unknown sender: {e}"
+
+        for i, envelope in enumerate(envelopes):
+            if envelope is None:
+                continue
+            key = keys.get(envelope.sender_id)
+            if key is None:
+                results[i] = VerificationResult(envelope, False, errors[envelope.sender_id])
+                continue
+            try:
+                key.verify(
+                    base64.b64decode(envelope.signature),
+                    envelope.signed_payload().encode('utf-8')
+                )
+            except (InvalidSignature, ValueError, TypeError):
+                results[i] = VerificationResult(envelope, False, "invalid signature")
+                continue
+            
+            if self.replay_guard is not None:
+                try:
+                    self.replay_guard.check_envelope(envelope)
+                except (PermissionError, ValueError) as e:
+                    results[i] = VerificationResult(envelope, False, f"replay check failed: {e}")
+                    continue
+            results[i] = VerificationResult(envelope, True)
+
+        valid = sum(1 for r in results if r.valid)
+        with self._lock:
+            self.batches += 1
+            self.verified += valid
+            self.rejected += len(results) - valid
+        return results
+
+    def verify(self, envelope: Union[A2AEnvelope, dict]) -> VerificationResult:
+        """Verify one envelope on the calling thread."""
+        return self.verify_batch([envelope])[0]
+
+    def verify_batch(self, envelopes: List[Union[A2AEnvelope, dict]]) -> List[VerificationResult]:
+        """Verify a list of envelopes on the calling thread, in order."""
+        start = time.perf_counter()
+        try:
+            return self._verify_batch(list(envelopes))
+        finally:
+            with self._lock:
+                self.elapsed += time.perf_counter() - start
+
+    def verify_stream(
+        self,
+        envelopes: Iterable[Union[A2AEnvelope, dict]]
+    ) -> Iterator[VerificationResult]:
+        """
+        Verify envelopes on the thread pool, yielding results in input order.
+
+        Args:
+            envelopes: A2AEnvelope objects or raw envelope dicts
+
+        Yields:
+            VerificationResult per envelope
+        """
+        pool = self._pool()
+        pending: deque = deque()
+        start = time.perf_counter()
+
+        def drain(limit: int):
+            while len(pending) > limit:
+                yield from pending.popleft().result()
+
+        try:
+            batch = []
+            for envelope in envelopes:
+                batch.append(envelope)
+                if len(batch) >= self.batch_size:
+                    pending.append(pool.submit(self._verify_batch, batch))
+                    batch = []
+                    yield from drain(self.max_inflight - 1)
+            if batch:
+                pending.append(pool.submit(self._verify_batch, batch))
+            yield from drain(0)
+        finally:
+            for future in pending:
+                future.cancel()
+            with self._lock:
+                self.elapsed += time.perf_counter() - start
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Report verification counts and throughput.
+
+        Returns:
+            Dict with `verified`, `rejected`, `batches`, `elapsed`
+            seconds spent verifying and `envelopes_per_second`
+        """
+        with self._lock:
+            total = self.verified + self.rejected
+            return {
+                'verified': self.verified,
+                'rejected': self.rejected,
+                'batches': self.batches,
+                'elapsed': self.elapsed,
+                'envelopes_per_second': total / self.elapsed if self.elapsed else 0.0,
+            }
+
+    def close(self):
+        """Shut down the worker threads."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
@@ -21,7 +21,13 @@ setup(
     install_requires=[
         "amorce-sdk>=0.2.1",
         "crewai>=0.1.0",
+        "requests>=2.31.0",
     ],
+    extras_require={
+        "async": ["httpx>=0.24"],
+        "binary": ["msgpack>=1.0"],
+        "zstd": ["zstandard>=0.21"],
+    },
     python_requires=">=3.10",
     classifiers=[
         "Development Status :: 4 - Beta",
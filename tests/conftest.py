@@ -0,0 +1,116 @@
+"""
+Shared fixtures for crewai-amorce tests
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+import pytest
+
+
+AGENTS = {
+    f"agent_{i}": {
+        "agent_id": f"agent_{i}",
+        "name": f"Agent {i}",
+        "category": "travel" if i % 2 else "weather",
+        "description": "Books flights" if i % 2 else "Checks weather forecast",
+        "capabilities": ["book_flight"] if i % 2 else ["forecast"],
+        "endpoint": f"https://agent{i}.example.com",
+        "trust_score": round(0.5 + i / 100, 2),
+    }
+    for i in range(12)
+}
+
+
+class FakeTrustAPI(ThreadingHTTPServer):
+    """In-process stand-in for the Amorce Trust API."""
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.hits = []
+        self.delay = 0.0
+        self.deleted = []
+        # Extra /api/v1/agents/{id} records (e.g. with public keys)
+        self.agents = {}
+
+    def handle_error(self, request, client_address):
+        # Clients that time out hang up mid-response
+        pass
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        query = {k: v[0] for k, v in parse_qs(parsed.query).items()}
+        self.server.hits.append(parsed.path)
+
+        if self.server.delay:
+            import time
+            time.sleep(self.server.delay)
+
+        if parsed.path == "/api/v1/ans/search":
+            words = query.get("q", "").lower().split()
+            results = [
+                agent for agent in AGENTS.values()
+                if any(w in agent["description"].lower() for w in words)
+            ]
+            limit = int(query.get("limit", 5))
+            start = int(query.get("cursor") or 0)
+            end = start + limit
+            self._send(200, {
+                "results": results[start:end],
+                "total": len(results),
+                "next_cursor": str(end) if end < len(results) else None,
+            })
+        elif parsed.path == "/api/v1/ans/snapshot":
+            # Cursor is the number of agents already delivered
+            since = int(query.get("since") or 0)
+            limit = int(query.get("limit", 500))
+            agents = list(AGENTS.values())[since:since + limit]
+            self._send(200, {
+                "agents": agents,
+                "deleted": self.server.deleted,
+                "cursor": str(since + len(agents)),
+                "has_more": since + len(agents) < len(AGENTS),
+            })
+        elif parsed.path.startswith("/api/v1/agents/"):
+            agent_id = parsed.path.rsplit("/", 1)[-1]
+            agent = self.server.agents.get(agent_id) or AGENTS.get(agent_id)
+            if agent is None:
+                self._send(404, {"error": "not found"})
+            else:
+                self._send(200, agent)
+        else:
+            self._send(404, {"error": "not found"})
+
+    def _send(self, status, body):
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+@pytest.fixture
+def trust_api():
+    """Run a fake Trust API on localhost for the duration of a test."""
+    server = FakeTrustAPI()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
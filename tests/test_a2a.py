@@ -0,0 +1,93 @@
+"""
+Tests for A2A envelope wire formats
+"""
+
+import pytest
+
+from crewai_amorce.a2a import A2AEnvelope, WIRE_MAGIC
+from crewai_amorce.keystore import LazyIdentity
+
+
+@pytest.fixture
+def envelope():
+    identity = LazyIdentity.from_seed(b"\x03" * 32)
+    return A2AEnvelope.create(identity, {"price": 480.5, "items": ["macbook"], "note": "é"})
+
+
+def test_compact_json_roundtrip(envelope):
+    """Compact JSON has no whitespace and decodes back to the same envelope."""
+    data = envelope.to_bytes(format="json")
+
+    assert b"\n" not in data and b", " not in data
+    assert len(data) < len(envelope.to_json().encode("utf-8"))
+    assert A2AEnvelope.from_bytes(data) == envelope
+
+
+def test_pretty_json_is_reencoded_compact(envelope):
+    """Indented input is not forwarded verbatim, so NDJSON lines stay single-line."""
+    decoded = A2AEnvelope.from_bytes(envelope.to_json().encode("utf-8"))
+
+    assert decoded.to_bytes(format="json") == envelope.to_bytes(format="json")
+
+
+def test_json_missing_fields_raise_value_error():
+    with pytest.raises(ValueError, match="Malformed"):
+        A2AEnvelope.from_bytes(b'{"payload": {"message": 1}}')
+
+
+def test_binary_roundtrip_from_memoryview(envelope):
+    """Binary envelopes keep raw signatures and decode from a memoryview slice."""
+    pytest.importorskip("msgpack")
+    data = envelope.to_bytes()
+
+    assert data.startswith(WIRE_MAGIC)
+    assert envelope.signature.encode("ascii") not in data
+    assert len(data) < len(envelope.to_bytes(format="json")) * 0.6
+
+    framed = bytearray(b"xx" + data + b"yy")
+    decoded = A2AEnvelope.from_bytes(memoryview(framed)[2:-2])
+    assert decoded == envelope
+
+
+def test_binary_rejects_bad_input(envelope):
+    pytest.importorskip("msgpack")
+    data = envelope.to_bytes()
+
+    with pytest.raises(ValueError, match="version"):
+        A2AEnvelope.from_bytes(data[:4] + b"\x09" + data[5:])
+    with pytest.raises(ValueError, match="Truncated"):
+        A2AEnvelope.from_bytes(data[:12])
+
+
+def test_metadata_timestamp_is_stable():
+    """to_dict no longer formats a fresh time on every call."""
+    envelope = A2AEnvelope(sender_id="a", message="m", signature="")
+    assert envelope.to_dict()["metadata"]["timestamp"] == envelope.to_dict()["metadata"]["timestamp"]
+
+
+def test_lazy_decode_and_zero_copy_forward(envelope):
+    """Binary envelopes decode the message on demand and forward their original bytes."""
+    pytest.importorskip("msgpack")
+    data = envelope.to_bytes()
+    decoded = A2AEnvelope.from_bytes(data)
+
+    assert "not decoded" in repr(decoded)
+    assert decoded.to_bytes() is data
+    assert decoded.sender_id == envelope.sender_id
+    assert decoded.message == envelope.message
+    assert decoded.to_bytes() is data
+
+
+def test_mutation_drops_cached_encoding(envelope):
+    pytest.importorskip("msgpack")
+    decoded = A2AEnvelope.from_bytes(envelope.to_bytes())
+
+    decoded.timestamp = "2026-01-01T00:00:00Z"
+    assert A2AEnvelope.from_bytes(decoded.to_bytes()).timestamp == "2026-01-01T00:00:00Z"
+
+    decoded.message = {"price": 1}
+    assert A2AEnvelope.from_bytes(decoded.to_bytes()).message == {"price": 1}
+
+
+def test_envelope_is_slotted(envelope):
+    assert not hasattr(envelope, "__dict__")
@@ -0,0 +1,313 @@
+"""
+Tests for HITL approval waiting
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from crewai_amorce.approvals import ApprovalTracker, get_tracker
+from crewai_amorce.tools import AmorceToolWrapper
+
+
+class FakeOrchestrator:
+    """Approves (or rejects) after a fixed number of status checks."""
+
+    def __init__(self, decide_after=3, decision='approved'):
+        self.decide_after = decide_after
+        self.decision = decision
+        self.checks = 0
+        self.requests = 0
+
+    def request_approval(self, summary, details=None, timeout_seconds=300):
+        self.requests += 1
+        return f"appr_{self.requests}"
+
+    def check_approval(self, approval_id):
+        self.checks += 1
+        if self.checks >= self.decide_after:
+            return {'status': self.decision}
+        return {'status': 'pending'}
+
+
+class FakeIdentity:
+    agent_id = "agent_test"
+
+    def sign(self, message):
+        return "sig"
+
+
+def fast_tracker(client):
+    return ApprovalTracker(client, tick=0.01, initial_interval=0.01, max_interval=0.05)
+
+
+class ManyApprovals:
+    """Approves each id after a per-id number of checks."""
+
+    def __init__(self, decide_after=3):
+        self.decide_after = decide_after
+        self.counts = {}
+        self.calls = 0
+
+    def check_approval(self, approval_id):
+        self.calls += 1
+        self.counts[approval_id] = self.counts.get(approval_id, 0) + 1
+        if self.counts[approval_id] >= self.decide_after:
+            return {'status': 'approved'}
+        return {'status': 'pending'}
+
+
+def test_tracker_polls_until_decision():
+    """Polling backs off until the decision, and latency is recorded."""
+    client = FakeOrchestrator(decide_after=4)
+    tracker = fast_tracker(client)
+
+    approval_id = tracker.request("Approve")
+    assert tracker.wait(approval_id, timeout=5)['status'] == 'approved'
+
+    stats = tracker.stats()
+    assert client.checks == 4
+    assert stats['decisions'] == 1
+    assert stats['pending'] == 0
+    assert stats['max'] > 0
+    tracker.close()
+
+
+def test_shared_tracker_does_not_keep_client_alive():
+    """The per-client registry frees the tracker with its client."""
+    import gc
+    import weakref
+
+    client = FakeOrchestrator(decide_after=10 ** 6)
+    tracker = get_tracker(client)
+    assert get_tracker(client) is tracker
+    tracker.track("appr_1")
+
+    client_ref = weakref.ref(client)
+    del client
+    gc.collect()
+
+    assert client_ref() is None
+    assert tracker._closed
+    tracker._thread.join(timeout=5)
+    assert not tracker._thread.is_alive()
+
+
+def test_tool_wrapper_waits_for_approval(monkeypatch):
+    """Wrapped HITL tools run only after approval."""
+    import crewai_amorce.approvals as approvals
+
+    client = FakeOrchestrator(decide_after=2, decision='rejected')
+    monkeypatch.setattr(approvals, "get_tracker", fast_tracker)
+    wrapper = AmorceToolWrapper(
+        tool=lambda x: x * 2, identity=FakeIdentity(), client=client, requires_hitl=True
+    )
+
+    with pytest.raises(PermissionError, match="denied for"):
+        wrapper.run(21)
+
+    client.decision = 'approved'
+    client.checks = 0
+    assert wrapper.run(21)['result'] == 42
+
+
+def test_tracker_bounds_request_rate():
+    """Many pending approvals share one poller with a fixed per-tick budget."""
+    client = ManyApprovals(decide_after=2)
+    tracker = ApprovalTracker(
+        client, tick=0.02, max_checks_per_tick=5, initial_interval=0.01, max_interval=0.02
+    )
+    futures = [tracker.track(f"appr_{i}") for i in range(50)]
+
+    start = time.monotonic()
+    for future in futures:
+        assert future.result(timeout=10)['status'] == 'approved'
+    elapsed = time.monotonic() - start
+
+    # 100 checks at <= 5 per 20ms tick need at least ~19 ticks
+    assert client.calls == 100
+    assert elapsed >= 19 * 0.02 * 0.9
+
+    stats = tracker.stats()
+    assert stats['pending'] == 0
+    assert stats['decisions'] == 50
+    assert sum(stats['wait_histogram'].values()) == 50
+    tracker.close()
+
+
+def test_tracker_uses_batch_endpoint():
+    """Clients with check_approvals() are polled in batches."""
+    client = ManyApprovals(decide_after=1)
+    batches = []
+
+    def check_approvals(ids):
+        batches.append(list(ids))
+        return {i: client.check_approval(i) for i in ids}
+
+    client.check_approvals = check_approvals
+    tracker = ApprovalTracker(client, tick=0.01, initial_interval=0.01, batch_size=10)
+    futures = [tracker.track(f"appr_{i}") for i in range(30)]
+    for future in futures:
+        future.result(timeout=10)
+
+    assert len(batches) == 3
+    assert tracker.stats()['checks'] == 3
+    tracker.close()
+
+
+def test_tracker_notify_cancel_and_timeout():
+    """Pushed decisions, cancellation and timeouts end tracked waits."""
+    tracker = ApprovalTracker(FakeOrchestrator(decide_after=10 ** 6), initial_interval=30)
+
+    threading.Timer(0.05, tracker.notify, ("appr_1", {'status': 'rejected'})).start()
+    with pytest.raises(PermissionError):
+        tracker.wait("appr_1", timeout=10)
+
+    threading.Timer(0.05, tracker.cancel, ("appr_2",)).start()
+    with pytest.raises(InterruptedError):
+        tracker.wait("appr_2", timeout=10)
+
+    with pytest.raises(TimeoutError):
+        tracker.wait("appr_3", timeout=0.05)
+    assert tracker.stats()['pending'] == 0
+
+    async def scenario():
+        task = asyncio.ensure_future(tracker.await_decision("appr_4", timeout=10))
+        await asyncio.sleep(0.05)
+        tracker.notify("appr_4", {'status': 'approved'})
+        return await task
+
+    assert asyncio.run(scenario())['status'] == 'approved'
+    tracker.close()
+
+
+def test_one_waiter_timing_out_leaves_others_waiting():
+    """A short sync or async wait cannot end or cancel a longer one."""
+    tracker = ApprovalTracker(FakeOrchestrator(decide_after=10 ** 6), initial_interval=30)
+    results = []
+    waiter = threading.Thread(target=lambda: results.append(tracker.wait("appr_1", timeout=10)))
+    waiter.start()
+    time.sleep(0.02)
+
+    with pytest.raises(TimeoutError):
+        tracker.wait("appr_1", timeout=0.05)
+
+    async def short_async_wait():
+        with pytest.raises(TimeoutError):
+            await tracker.await_decision("appr_1", timeout=0.05)
+
+    asyncio.run(short_async_wait())
+    assert tracker.stats()['pending'] == 1
+
+    tracker.notify("appr_1", {'status': 'approved'})
+    waiter.join(timeout=5)
+    assert results == [{'status': 'approved'}]
+    tracker.close()
+
+
+def test_pushed_and_latency_memory_is_bounded():
+    tracker = ApprovalTracker(FakeOrchestrator(decide_after=10 ** 6), initial_interval=30)
+    tracker.MAX_PUSHED = 8
+    tracker.latencies = type(tracker.latencies)(maxlen=8)
+
+    for i in range(100):
+        tracker.cancel(f"unknown_{i}")
+    assert len(tracker._pushed) == 8
+
+    for i in range(20):
+        tracker.request("Approve")
+        tracker.notify(f"appr_{i + 1}", {'status': 'approved'})
+    tracker.notify("appr_1", {'status': 'approved'})
+    assert len(tracker.latencies) == 8
+    assert "appr_1" not in tracker._pushed
+    tracker.close()
+
+
+def test_submit_returns_before_approval(monkeypatch):
+    """submit() hands back a pending call; the tool runs after approval."""
+    import crewai_amorce.approvals as approvals
+
+    tracker = ApprovalTracker(FakeOrchestrator(decide_after=10 ** 6), initial_interval=30)
+    monkeypatch.setattr(approvals, "get_tracker", lambda client: tracker)
+    calls = []
+    wrapper = AmorceToolWrapper(
+        tool=lambda x: calls.append(x) or x * 2,
+        identity=FakeIdentity(), client=None, requires_hitl=True
+    )
+
+    pending = wrapper.submit(21)
+    assert not pending.done()
+    assert calls == []
+
+    tracker.notify(pending.approval_id, {'status': 'approved'})
+    assert pending.result(timeout=5)['result'] == 42
+
+    denied = wrapper.submit(1)
+    tracker.notify(denied.approval_id, {'status': 'rejected'})
+    with pytest.raises(PermissionError, match="denied for"):
+        denied.result(timeout=5)
+    assert calls == [21]
+    tracker.close()
+
+
+def test_submit_honours_approval_timeout(monkeypatch):
+    """A submitted HITL call fails once approval_timeout passes."""
+    import crewai_amorce.approvals as approvals
+
+    tracker = ApprovalTracker(
+        FakeOrchestrator(decide_after=10 ** 6), tick=0.01, initial_interval=30
+    )
+    monkeypatch.setattr(approvals, "get_tracker", lambda client: tracker)
+    wrapper = AmorceToolWrapper(
+        tool=lambda x: x * 2, identity=FakeIdentity(), client=None,
+        requires_hitl=True, approval_timeout=0.1
+    )
+
+    pending = wrapper.submit(21)
+    with pytest.raises(TimeoutError, match="timeout for"):
+        pending.result(timeout=5)
+    tracker.close()
+
+
+def test_track_tightens_existing_deadline():
+    tracker = ApprovalTracker(
+        FakeOrchestrator(decide_after=10 ** 6), tick=0.01, initial_interval=30
+    )
+    tracker.track("appr_1")
+    with pytest.raises(TimeoutError):
+        tracker.track("appr_1", timeout=0.05).result(timeout=5)
+    tracker.close()
+
+
+def test_arun_leaves_loop_free(monkeypatch):
+    """Other coroutines run while an arun() call awaits approval."""
+    import crewai_amorce.approvals as approvals
+
+    tracker = ApprovalTracker(FakeOrchestrator(decide_after=10 ** 6), initial_interval=30)
+    monkeypatch.setattr(approvals, "get_tracker", lambda client: tracker)
+    sensitive = AmorceToolWrapper(
+        tool=lambda x: x * 2, identity=FakeIdentity(), client=None, requires_hitl=True
+    )
+    plain = AmorceToolWrapper(tool=lambda x: x + 1, identity=FakeIdentity(), client=None)
+
+    async def scenario():
+        task = asyncio.ensure_future(sensitive.arun(21))
+        assert (await plain.arun(1))['result'] == 2
+        assert not task.done()
+        tracker.notify("appr_1", {'status': 'approved'})
+        return await asyncio.wait_for(task, timeout=5)
+
+    assert asyncio.run(scenario())['result'] == 42
+    tracker.close()
+
+
+def test_tracker_deadline():
+    """track(timeout=...) fails the future with TimeoutError."""
+    tracker = ApprovalTracker(
+        FakeOrchestrator(decide_after=10 ** 6), tick=0.01, initial_interval=30
+    )
+    with pytest.raises(TimeoutError):
+        tracker.track("appr_1", timeout=0.05).result(timeout=5)
+    tracker.close()
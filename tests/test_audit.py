@@ -0,0 +1,148 @@
+"""
+Tests for the append-only audit log
+"""
+
+import os
+import threading
+
+import pytest
+
+from crewai_amorce.audit import AuditLog
+from crewai_amorce.keystore import LazyIdentity
+from crewai_amorce.tools import AmorceToolWrapper
+
+
+def fill(log, n):
+    for i in range(n):
+        log.append(
+            "tool_call", f"agent_{i % 7}", {"i": i},
+            proof={"signature": "sig"}, tool=f"tool_{i % 3}"
+        )
+    log.commit()
+
+
+def test_query_by_agent_tool_and_kind_across_segments(tmp_path):
+    log = AuditLog(str(tmp_path), segment_bytes=8 * 1024, max_batch=64, fsync=False)
+    fill(log, 2000)
+    log.append("receipt", "agent_1", {"final": True}, durable=True)
+
+    assert log.stats()["segments"] > 5
+    hits = list(log.query(agent_id="agent_3", tool="tool_1"))
+    assert [r["payload"]["i"] for r in hits] == [i for i in range(2000) if i % 7 == 3 and i % 3 == 1]
+    assert [r["seq"] for r in hits] == sorted(r["seq"] for r in hits)
+    assert [r["payload"] for r in log.query(kind="receipt")] == [{"final": True}]
+    assert len(list(log.query(agent_id="agent_0", limit=5))) == 5
+    assert list(log.query(agent_id="nobody")) == []
+    log.close()
+
+
+def test_time_range(tmp_path):
+    log = AuditLog(str(tmp_path), segment_bytes=4 * 1024, fsync=False)
+    fill(log, 300)
+    middle = list(log.query())[150]["ts"]
+    fill(log, 300)
+
+    found = list(log.query(start=middle))
+    assert found[0]["payload"]["i"] == 150
+    assert len(found) >= 450
+    assert all(r["ts"] >= middle for r in found)
+    assert all(r["ts"] <= middle for r in log.query(end=middle))
+    log.close()
+
+
+def test_group_commit_batches_concurrent_appends(tmp_path):
+    log = AuditLog(str(tmp_path), commit_delay=0.02)
+    threads = [threading.Thread(target=fill, args=(log, 50)) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    stats = log.stats()
+    assert stats["committed"] == 400
+    assert stats["commits"] < 400 / 4
+    assert sorted(r["seq"] for r in log.query()) == list(range(1, 401))
+    log.close()
+
+
+def test_reopen_recovers_torn_write_and_continues_seq(tmp_path):
+    log = AuditLog(str(tmp_path), segment_bytes=4 * 1024, fsync=False)
+    fill(log, 100)
+    log.close()
+
+    active = sorted(n for n in os.listdir(tmp_path) if n.endswith(".log"))[-1]
+    with open(tmp_path / active, "ab") as f:
+        f.write(b'{"seq":101,"ts":1,"kind":"tool_')
+    # Lost while sealing: rebuilt on open
+    os.remove(tmp_path / "00000001.agent.idx")
+
+    log = AuditLog(str(tmp_path), segment_bytes=4 * 1024, fsync=False)
+    assert log.append("kickoff", "crew", {}, durable=True) == 101
+    assert [r["seq"] for r in log.query()] == list(range(1, 102))
+    assert len(list(log.query(agent_id="agent_2"))) == len(range(2, 100, 7))
+    log.close()
+
+
+class TornWrites:
+    """Writes half of the next group, then fails once."""
+
+    def __init__(self, file):
+        self.file = file
+        self.failed = False
+
+    def write(self, data):
+        if not self.failed:
+            self.failed = True
+            self.file.write(data[:len(data) // 2])
+            raise OSError("disk full")
+        return self.file.write(data)
+
+    def __getattr__(self, name):
+        return getattr(self.file, name)
+
+
+def test_failed_write_is_truncated(tmp_path):
+    log = AuditLog(str(tmp_path), fsync=False)
+    log.append("kickoff", "crew", {"n": 1}, durable=True)
+    log._file = TornWrites(log._file)
+
+    with pytest.raises(OSError):
+        log.append("kickoff", "crew", {"n": 2}, durable=True)
+    log.append("kickoff", "crew", {"n": 3}, durable=True)
+    assert [r["payload"]["n"] for r in log.query(agent_id="crew")] == [1, 3]
+    log.close()
+
+    reopened = AuditLog(str(tmp_path), fsync=False)
+    assert [r["payload"]["n"] for r in reopened.query()] == [1, 3]
+    reopened.close()
+
+
+def test_rotation_failure_rejects_later_appends(tmp_path, monkeypatch):
+    import crewai_amorce.audit as audit
+
+    def broken_seal(path, entries):
+        raise OSError("read-only file system")
+
+    monkeypatch.setattr(audit, "_seal", broken_seal)
+    log = AuditLog(str(tmp_path), segment_bytes=64, fsync=False)
+    log.append("kickoff", "crew", {"pad": "x" * 100}, durable=True)
+
+    with pytest.raises(RuntimeError, match="writer failed"):
+        log.append("kickoff", "crew", {}, durable=True)
+    assert log.stats()["errors"] == 1
+    log.close()
+
+
+def test_tool_wrapper_records_signed_calls(tmp_path):
+    identity = LazyIdentity.from_seed(b"\x08" * 32)
+    log = AuditLog(str(tmp_path))
+    wrapper = AmorceToolWrapper(tool=lambda x: x + 1, identity=identity, client=None, audit_log=log)
+
+    output = wrapper.run(1)
+    log.commit()
+
+    (record,) = log.query(agent_id=identity.agent_id, tool=wrapper.name)
+    assert record["kind"] == "tool_call"
+    assert record["payload"]["args"] == [1]
+    assert record["proof"]["signature"] == output["signature"]
+    log.close()
@@ -0,0 +1,89 @@
+"""
+Tests for Merkle-batched signing
+"""
+
+import json
+import threading
+
+import pytest
+
+from crewai_amorce.batch_signing import (
+    BatchSigner,
+    leaf_hash,
+    merkle_levels,
+    inclusion_proof,
+    root_from_proof,
+    verify_batch_proof,
+)
+from crewai_amorce.canonical import canonical_dumps
+from crewai_amorce.keystore import LazyIdentity
+from crewai_amorce.tools import AmorceToolWrapper
+
+
+@pytest.fixture
+def identity():
+    return LazyIdentity.from_seed(b"\x07" * 32)
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 5, 8, 13])
+def test_every_leaf_proves_the_root(size):
+    """Proofs fold back to the root for balanced and unbalanced trees."""
+    leaves = [leaf_hash(f"m{i}") for i in range(size)]
+    levels = merkle_levels(leaves)
+
+    for i, leaf in enumerate(leaves):
+        assert root_from_proof(leaf, i, size, inclusion_proof(levels, i)) == levels[-1][0]
+
+
+def test_batch_signs_once_and_verifies(identity):
+    """A full batch costs one signature; each proof verifies alone."""
+    signer = BatchSigner(identity, max_batch=16, max_delay=10)
+    messages = [json.dumps({'call': i}) for i in range(16)]
+
+    futures = [signer.submit(m) for m in messages]
+    proofs = [f.result(timeout=5) for f in futures]
+
+    assert signer.stats()['signatures'] == 1
+    assert len({p['signature'] for p in proofs}) == 1
+    assert all(len(p['merkle_proof']) == 4 for p in proofs)
+    for message, proof in zip(messages, proofs):
+        assert verify_batch_proof(message, proof, identity.public_key_pem)
+
+    assert not verify_batch_proof(messages[0], proofs[1], identity.public_key_pem)
+    other = LazyIdentity.from_seed(b"\x08" * 32)
+    assert not verify_batch_proof(messages[0], proofs[0], other.public_key_pem)
+    signer.close()
+
+
+def test_partial_batch_flushes_after_delay(identity):
+    """Messages never wait longer than max_delay for a full batch."""
+    signer = BatchSigner(identity, max_batch=1000, max_delay=0.02)
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda i=i: results.append(signer.sign(f"m{i}")))
+        for i in range(5)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(timeout=5)
+
+    assert len(results) == 5
+    assert signer.stats()['messages'] == 5
+    signer.close()
+
+
+def test_tool_wrapper_batch_mode(identity):
+    """Wrapped tools return batch proof fields instead of a bare signature."""
+    signer = BatchSigner(identity, max_batch=1)
+    wrapper = AmorceToolWrapper(
+        tool=lambda x: x * 2, identity=identity, client=None, batch_signer=signer
+    )
+
+    output = wrapper.run(21)
+    call_data = {'tool': wrapper.name, 'args': [21], 'kwargs': {}, 'agent_id': identity.agent_id}
+
+    assert output['result'] == 42
+    assert verify_batch_proof(call_data, output, identity.public_key_pem)
+    assert verify_batch_proof(canonical_dumps(call_data), output, identity.public_key_pem)
@@ -0,0 +1,83 @@
+"""
+Tests for the discovery result cache
+"""
+
+import time
+
+from crewai_amorce.cache import ResultCache, MemoryBackend, DiskBackend
+from crewai_amorce.transport import HTTPTransport
+from crewai_amorce.discovery import get_discovery_tools
+
+
+def test_lru_eviction_and_memory_cap():
+    """Entries are evicted by count and by estimated size."""
+    backend = MemoryBackend(max_entries=2, max_bytes=1024)
+    cache = ResultCache(backend=backend)
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get_or_load("a", lambda: None)
+    cache.set("c", 3)
+
+    assert backend.get("b") is None
+    assert backend.get("a") is not None
+    assert cache.stats()['evictions'] == 1
+
+    cache.set("big", "x" * 2000)
+    assert backend.get("big") is None
+
+
+def test_stale_while_revalidate():
+    """Stale entries are served at once and refreshed in the background."""
+    cache = ResultCache(ttl=0.05, stale_ttl=10)
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return len(calls)
+
+    assert cache.get_or_load("k", loader) == 1
+    assert cache.get_or_load("k", loader) == 1
+    time.sleep(0.1)
+    assert cache.get_or_load("k", loader) == 1
+
+    deadline = time.time() + 2
+    while cache.stats()['refreshes'] == 0 and time.time() < deadline:
+        time.sleep(0.01)
+    assert cache.get_or_load("k", loader) == 2
+
+    stats = cache.stats()
+    assert stats['misses'] == 1
+    assert stats['stale_hits'] == 1
+    assert stats['hits'] == 2
+
+
+def test_disk_backend_shared_between_instances(tmp_path):
+    """Two caches over the same file see each other's entries."""
+    path = str(tmp_path / "cache.db")
+    first = ResultCache(backend=DiskBackend(path))
+    second = ResultCache(backend=DiskBackend(path, max_entries=1))
+
+    first.set("search|flights", {"results": [1, 2]})
+    assert second.get_or_load("search|flights", lambda: None) == {"results": [1, 2]}
+
+    second.set("other", [])
+    assert len(second.backend) == 1
+
+
+def test_discovery_tools_use_cache(trust_api):
+    """Repeated normalized queries hit the Trust API once."""
+    cache = ResultCache(ttl=60)
+    search, get_agent = get_discovery_tools(
+        trust_api.url,
+        transport=HTTPTransport(timeout=5),
+        cache=cache
+    )
+
+    first = search.run("Flights")
+    assert search.run("  flights ") == first
+    get_agent.run("agent_1")
+    get_agent.run("agent_1")
+
+    assert len(trust_api.hits) == 2
+    assert cache.stats()['hits'] == 2
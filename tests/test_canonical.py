@@ -0,0 +1,66 @@
+"""
+Tests for canonical JSON encoding
+"""
+
+import hashlib
+import json
+
+import pytest
+
+from crewai_amorce.canonical import (
+    canonical_digest,
+    canonical_dumps,
+    canonical_json,
+    iter_canonical,
+)
+
+
+@pytest.mark.parametrize("value, expected", [
+    (0.0, "0"),
+    (-0.0, "0"),
+    (1.0, "1"),
+    (-1.5, "-1.5"),
+    (0.1, "0.1"),
+    (123.456, "123.456"),
+    (0.000001, "0.000001"),
+    (1e-7, "1e-7"),
+    (1e20, "100000000000000000000"),
+    (1e21, "1e+21"),
+    (1.5e300, "1.5e+300"),
+    (5e-324, "5e-324"),
+    (333333333.33333329, "333333333.3333333"),
+])
+def test_numbers_follow_ecmascript(value, expected):
+    """Floats use ECMAScript Number formatting (RFC 8785 section 3.2.2.3)."""
+    assert canonical_dumps(value) == expected
+
+
+def test_rfc8785_key_order_and_strings():
+    """Keys sort by UTF-16 code units; strings use minimal escapes."""
+    value = {"\U0001f600": 1, "\ufb33": 2, "b": "é\n\"\x1f", "a": [True, None]}
+    assert canonical_dumps(value) == (
+        '{"a":[true,null],"b":"é\\n\\"\\u001f","\U0001f600":1,"\ufb33":2}'
+    )
+
+
+def test_fast_and_slow_paths_agree():
+    """The C-encoder fast path matches the reference encoder."""
+    value = {"tool": "search", "args": ["x" * 100, 42], "kwargs": {"z": None, "a": [1, {"b": False}]}}
+    assert canonical_dumps(value) == "".join(iter_canonical(value))
+    assert canonical_dumps(value) == json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+
+def test_streaming_digest_matches_bytes():
+    """canonical_digest hashes exactly the canonical bytes."""
+    value = {"kwargs": {"blob": "é" * 200_000, "ratio": 0.5}, "args": list(range(1000))}
+    expected = hashlib.sha256(b"tag" + canonical_json(value)).digest()
+    assert canonical_digest(value, prefix=b"tag") == expected
+
+
+def test_rejects_non_json_values():
+    with pytest.raises(ValueError):
+        canonical_dumps({"x": float("nan")})
+    with pytest.raises(TypeError):
+        canonical_dumps({1: "x", "y": 1.5})
+    with pytest.raises(TypeError):
+        canonical_dumps({"x": object()})
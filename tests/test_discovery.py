@@ -0,0 +1,102 @@
+"""
+Tests for Amorce discovery tools
+"""
+
+from crewai_amorce.transport import HTTPTransport
+from crewai_amorce.discovery import (
+    SearchAgentsTool,
+    GetAgentTool,
+    get_discovery_tools,
+)
+
+
+def test_tools_share_pooled_transport(trust_api):
+    """Both discovery tools reuse one keep-alive connection."""
+    transport = HTTPTransport(pool_maxsize=4, timeout=5)
+    search, get_agent = get_discovery_tools(trust_api.url, transport=transport)
+
+    assert search.transport is get_agent.transport is transport
+
+    assert "Found" in search.run("flights")
+    assert "Agent 1" in get_agent.run("agent_1")
+    assert "Agent 3" in get_agent.run("agent_3")
+
+    stats = transport.stats()
+    assert stats['requests'] == 3
+    assert stats['connections'] == 1
+    assert stats['pool_hits'] == 2
+    transport.close()
+
+
+def test_get_agent_error_is_reported(trust_api):
+    """HTTP errors come back as text for the LLM."""
+    tool = GetAgentTool(trust_api.url, transport=HTTPTransport(timeout=5))
+    assert tool.run("missing").startswith("Error getting agent")
+
+
+def test_search_timeout_is_reported(trust_api):
+    """Slow responses hit the per-request timeout."""
+    trust_api.delay = 0.5
+    tool = SearchAgentsTool(trust_api.url, transport=HTTPTransport(timeout=0.1))
+    assert tool.run("flights").startswith("Error searching agents")
+
+
+def test_async_tools_share_connection_pool(trust_api):
+    """arun and aget_agents_many go through one async client."""
+    import asyncio
+    from crewai_amorce.transport import AsyncHTTPTransport
+
+    async_transport = AsyncHTTPTransport(max_connections=4, timeout=5)
+    search, get_agent = get_discovery_tools(
+        trust_api.url, async_transport=async_transport
+    )
+
+    async def scenario():
+        text = await search.arun("weather")
+        records = await get_agent.aget_agents_many(
+            ["agent_2", "missing", "agent_4"], max_concurrency=2
+        )
+        await async_transport.aclose()
+        return text, records
+
+    text, records = asyncio.run(scenario())
+
+    assert "Found" in text
+    assert [r.get('name') for r in records] == ["Agent 2", None, "Agent 4"]
+    assert "error" in records[1]
+    assert async_transport.stats()['requests'] == 4
+
+
+def test_get_agents_many_keeps_input_order(trust_api):
+    """Threaded fan-out returns records in input order."""
+    tool = GetAgentTool(trust_api.url, transport=HTTPTransport(timeout=5))
+    ids = [f"agent_{i}" for i in range(10)]
+
+    records = tool.get_agents_many(ids, max_concurrency=4)
+
+    assert [r['agent_id'] for r in records] == ids
+
+
+def test_iter_search_fetches_pages_lazily(trust_api):
+    """Later pages are only requested when consumed."""
+    from itertools import islice
+    from crewai_amorce.discovery import AgentRecord
+
+    tool = SearchAgentsTool(trust_api.url, transport=HTTPTransport(timeout=5))
+
+    stream = tool.iter_search("flights", page_size=2)
+    first = list(islice(stream, 2))
+    assert len(trust_api.hits) == 1
+    assert all(isinstance(r, AgentRecord) for r in first)
+
+    rest = list(stream)
+    assert len(first) + len(rest) == 6
+    assert len(trust_api.hits) == 3
+
+    assert len(list(tool.iter_search("flights", page_size=4, max_results=5))) == 5
+
+
+def test_run_reports_total_matches(trust_api):
+    """The text summary counts every match, not just the shown page."""
+    tool = SearchAgentsTool(trust_api.url, transport=HTTPTransport(timeout=5))
+    assert tool.run("flights").startswith("Found 6 agents")
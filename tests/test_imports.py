@@ -0,0 +1,40 @@
+"""
+Import-cost regression guards
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+
+def _loaded_after(stmt: str, modules):
+    code = (
+        f"import sys\n{stmt}\n"
+        f"print(','.join(m for m in {tuple(modules)!r} if m in sys.modules))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return [m for m in out.stdout.strip().split(",") if m]
+
+
+def test_package_import_is_lazy():
+    """Importing the package pulls in no heavy dependencies."""
+    heavy = ("crewai", "amorce", "requests", "httpx", "crewai_amorce.agent")
+    assert _loaded_after("import crewai_amorce", heavy) == []
+
+
+def test_lazy_attributes_resolve():
+    """Public names still resolve and are listed."""
+    pytest.importorskip("requests")
+    import crewai_amorce
+
+    assert "SecureAgent" in dir(crewai_amorce)
+    assert crewai_amorce.GetAgentTool.name == "get_agent"
+    assert _loaded_after(
+        "from crewai_amorce import get_discovery_tools", ("crewai",)
+    ) == []
+
+    with pytest.raises(AttributeError):
+        crewai_amorce.does_not_exist
@@ -0,0 +1,166 @@
+"""
+Tests for the streaming offer inbox
+"""
+
+import asyncio
+
+import pytest
+
+from crewai_amorce.a2a import A2AEnvelope
+from crewai_amorce.inbox import LocalTransport, OfferInbox, SocketTransport, send_envelopes
+from crewai_amorce.keystore import LazyIdentity
+from crewai_amorce.replay import ReplayGuard
+from crewai_amorce.verification import EnvelopeVerifier, PublicKeyResolver
+
+
+@pytest.fixture
+def buyers():
+    return [LazyIdentity.from_seed(bytes([i]) * 32) for i in range(10, 13)]
+
+
+def make_verifier(buyers):
+    resolver = PublicKeyResolver()
+    for identity in buyers:
+        resolver.pin(identity.agent_id, identity.public_key_pem)
+    return EnvelopeVerifier(resolver, replay_guard=ReplayGuard())
+
+
+def test_backpressure_bounds_memory(buyers):
+    """A slow consumer stalls the producer instead of growing queues."""
+    async def scenario():
+        transport = LocalTransport(maxsize=4)
+        inbox = OfferInbox(transport, verifier=make_verifier(buyers), maxsize=8, batch_size=4)
+        await inbox.start()
+
+        envelopes = [A2AEnvelope.create(buyers[i % 3], {"price": i}) for i in range(100)]
+
+        async def produce():
+            for envelope in envelopes:
+                await transport.send(envelope)
+
+        producer = asyncio.ensure_future(produce())
+        await asyncio.sleep(0.3)
+
+        # Producer is blocked; nothing holds more than its bound
+        assert not producer.done()
+        stats = inbox.stats()
+        assert stats["queued"] <= 8
+        assert stats["read_ahead"] <= 8
+        assert transport.qsize() <= 4
+        assert stats["backpressure_waits"] >= 1
+
+        received = []
+        while len(received) < 100:
+            received.append(await inbox.get(timeout=5))
+        await producer
+        await inbox.close()
+        return received, inbox.stats()
+
+    received, stats = asyncio.run(scenario())
+    assert sorted(o["price"] for o in received) == list(range(100))
+    assert stats["high_water"] <= 8
+    assert stats["accepted"] == 100
+
+
+def test_price_priority_and_rejections(buyers):
+    """Buffered offers come out highest price first; bad ones are dropped."""
+    async def scenario():
+        transport = LocalTransport()
+        inbox = OfferInbox(transport, verifier=make_verifier(buyers), batch_size=16)
+        await inbox.start()
+
+        good = [A2AEnvelope.create(buyers[0], {"price": p}) for p in (450, 520, 480)]
+        forged = A2AEnvelope.create(buyers[1], {"price": 999})
+        forged.message = {"price": 1}
+        for envelope in good + [forged, good[0]]:
+            await transport.send(envelope)
+        await transport.close()
+
+        await asyncio.sleep(0.2)
+        return [offer async for offer in inbox], inbox.stats()
+
+    offers, stats = asyncio.run(scenario())
+    assert [o["price"] for o in offers] == [520, 480, 450]
+    assert offers[0]["sender_id"] == buyers[0].agent_id
+    assert stats["rejected"] == 2
+
+
+def test_malformed_price_is_rejected_not_fatal(buyers):
+    """A signed offer that cannot be ranked does not stall later offers."""
+    async def scenario():
+        transport = LocalTransport()
+        inbox = OfferInbox(transport, verifier=make_verifier(buyers))
+        await inbox.start()
+
+        await transport.send(A2AEnvelope.create(buyers[0], {"price": "abc"}))
+        await transport.send(A2AEnvelope.create(buyers[1], {"price": 500}))
+        offer = await inbox.get(timeout=5)
+        await inbox.close()
+        return offer, inbox.stats()
+
+    offer, stats = asyncio.run(scenario())
+    assert offer["price"] == 500
+    assert stats["rejected"] == 1
+
+
+def test_pipeline_failure_reaches_get(buyers):
+    """A crashed pipeline task raises from get() instead of hanging."""
+    class BrokenTransport(LocalTransport):
+        async def receive(self):
+            raise OSError("connection reset")
+
+    async def scenario():
+        inbox = OfferInbox(BrokenTransport(), verifier=make_verifier(buyers))
+        await inbox.start()
+        with pytest.raises(RuntimeError, match="connection reset"):
+            await inbox.get(timeout=5)
+        await inbox.close()
+
+    asyncio.run(scenario())
+
+
+def test_trust_policy_over_socket(buyers):
+    """Offers arrive over TCP and are served by buyer trust score."""
+    trust = {buyers[0].agent_id: 0.2, buyers[1].agent_id: 0.9, buyers[2].agent_id: 0.5}
+
+    async def scenario():
+        inbox = OfferInbox(
+            SocketTransport(), verifier=make_verifier(buyers),
+            policy="trust", trust_lookup=trust.get
+        )
+        await inbox.start()
+
+        envelopes = [A2AEnvelope.create(b, {"price": 500}) for b in buyers]
+        await send_envelopes("127.0.0.1", inbox.transport.port, envelopes)
+        await asyncio.sleep(0.3)
+
+        offers = [await inbox.get(timeout=5) for _ in range(3)]
+        await inbox.close()
+        return offers
+
+    offers = asyncio.run(scenario())
+    assert [trust[o["sender_id"]] for o in offers] == [0.9, 0.5, 0.2]
+
+
+def test_background_inbox_for_sync_callers(buyers):
+    """run_in_background + get_sync serve threads without an event loop."""
+    transport = LocalTransport()
+    inbox = OfferInbox(transport, verifier=make_verifier(buyers)).run_in_background()
+
+    envelope = A2AEnvelope.create(buyers[0], {"price": 42})
+    asyncio.run_coroutine_threadsafe(transport.send(envelope), inbox.loop).result(timeout=5)
+
+    assert inbox.get_sync(timeout=5)["price"] == 42
+    with pytest.raises(TimeoutError):
+        inbox.get_sync(timeout=0.05)
+
+
+def test_background_start_failure_is_raised(buyers):
+    """A transport that cannot start fails run_in_background instead of hanging."""
+    class Unbindable(LocalTransport):
+        async def start(self):
+            raise OSError("address already in use")
+
+    inbox = OfferInbox(Unbindable(), verifier=make_verifier(buyers))
+    with pytest.raises(OSError, match="in use"):
+        inbox.run_in_background(timeout=5)
@@ -0,0 +1,76 @@
+"""
+Tests for the local ANS search index
+"""
+
+from crewai_amorce.index import LocalAgentIndex, build_index, IndexReader
+from crewai_amorce.transport import HTTPTransport
+from crewai_amorce.discovery import SearchAgentsTool
+
+
+RECORDS = [
+    {"agent_id": "a", "name": "Flight Booker", "category": "travel",
+     "description": "Book flights to Paris", "capabilities": ["book_flight"],
+     "trust_score": 0.9},
+    {"agent_id": "b", "name": "Cheap Flights", "category": "travel",
+     "description": "Book flights cheaply", "capabilities": ["book_flight"],
+     "trust_score": 0.2},
+    {"agent_id": "c", "name": "Weather Now", "category": "weather",
+     "description": "Check weather forecast", "capabilities": ["forecast"],
+     "trust_score": 0.8},
+]
+
+
+def test_bm25_ranking_with_trust():
+    """Relevant agents rank first, trusted agents above equally relevant ones."""
+    index = LocalAgentIndex()
+    index.load_records(RECORDS, cursor="3")
+
+    results = index.search("book flights", limit=5)
+
+    assert [r['agent_id'] for r in results] == ["a", "b"]
+    assert results[0]['score'] > results[1]['score']
+    assert index.search("weather")[0]['agent_id'] == "c"
+    assert index.search("submarine") == []
+
+
+def test_reader_roundtrip():
+    """Serialized index exposes cursor, postings and records."""
+    reader = IndexReader(build_index(RECORDS, cursor="abc"))
+
+    assert reader.cursor == "abc"
+    assert reader.n_docs == 3
+    assert [doc for doc, _ in reader.postings("travel")] == [0, 1]
+    assert reader.record(2)['name'] == "Weather Now"
+
+
+def test_sync_and_share_between_processes(trust_api, tmp_path):
+    """Deltas are applied and other readers of the file see them."""
+    path = str(tmp_path / "ans.idx")
+    writer = LocalAgentIndex(
+        path=path, trust_url=trust_api.url, transport=HTTPTransport(timeout=5)
+    )
+
+    assert writer.sync(page_size=5) == 12
+    assert writer.cursor == "12"
+
+    reader = LocalAgentIndex(path=path, reload_interval=0)
+    assert len(reader) == 12
+
+    trust_api.deleted = ["agent_1"]
+    assert writer.sync() == 1
+    assert len(reader) == 11
+
+
+def test_search_tool_answers_locally(trust_api):
+    """Matched queries never reach the Trust API."""
+    index = LocalAgentIndex()
+    index.load_records(RECORDS)
+    tool = SearchAgentsTool(
+        trust_api.url, transport=HTTPTransport(timeout=5), local_index=index
+    )
+
+    assert "Flight Booker" in tool.run("flights to Paris")
+    assert trust_api.hits == []
+
+    tool.run("forecast weekly")
+    assert trust_api.hits == []
@@ -0,0 +1,84 @@
+"""
+Tests for the keystore and lazy identities
+"""
+
+import pytest
+
+pytest.importorskip("cryptography")
+
+from crewai_amorce.keystore import Keystore, LazyIdentity, derive_identity
+
+
+def test_derived_identities_are_stable(tmp_path):
+    """Same keystore and name give the same agent ID across restarts."""
+    path = str(tmp_path / "crew.keys")
+    first = Keystore(path, passphrase="secret", scrypt_n=2 ** 10)
+    seller_id = first.identity("Seller").agent_id
+    buyer_id = first.identity("Buyer").agent_id
+    assert seller_id != buyer_id
+    first.flush()
+
+    reopened = Keystore(path, passphrase="secret")
+    seller = reopened.identity("Seller")
+    assert seller.agent_id == seller_id
+    assert not seller.materialized
+
+    signature = seller.sign("hello")
+    assert seller.materialized
+    assert signature == derive_identity(reopened._master(), "Seller").sign("hello")
+    assert reopened.names() == ["Buyer", "Seller"]
+
+
+def test_new_names_are_saved_in_one_batch(tmp_path, monkeypatch):
+    """Starting many agents writes the keystore once, not once per agent."""
+    path = str(tmp_path / "crew.keys")
+    keystore = Keystore(path, passphrase="secret", scrypt_n=2 ** 10)
+    lazy = keystore.identity("Lazy")
+    assert not lazy.materialized
+
+    saves = []
+    original = Keystore.save
+    monkeypatch.setattr(Keystore, "save", lambda self: saves.append(1) or original(self))
+
+    identities = keystore.identities([f"agent-{i}" for i in range(50)])
+    # One save for the new master seed, one for the 50 agent IDs
+    assert len(saves) == 2
+
+    reopened = Keystore(path, passphrase="secret")
+    assert reopened.identity("agent-7").agent_id == identities["agent-7"].agent_id
+    assert "Lazy" not in reopened.names()
+
+
+def test_imported_identity_and_wrong_passphrase(tmp_path):
+    """Imported keys round-trip; a wrong passphrase cannot sign."""
+    path = str(tmp_path / "crew.keys")
+    original = LazyIdentity.from_seed(b"\x01" * 32)
+
+    Keystore(path, passphrase="secret", scrypt_n=2 ** 10).add("legacy", original)
+
+    loaded = Keystore(path, passphrase="secret").identity("legacy")
+    assert loaded.agent_id == original.agent_id
+    assert loaded.sign("msg") == original.sign("msg")
+
+    with pytest.raises(PermissionError):
+        Keystore(path, passphrase="wrong").identity("legacy").sign("msg")
+
+
+def test_matches_amorce_agent_id_derivation():
+    """Lazy identities derive agent IDs like amorce.IdentityManager."""
+    amorce = pytest.importorskip("amorce")
+    sdk_identity = amorce.IdentityManager.generate_ephemeral()
+
+    lazy = LazyIdentity(lambda: _raw_seed(sdk_identity))
+    assert lazy.agent_id == sdk_identity.agent_id
+
+
+def _raw_seed(identity):
+    from cryptography.hazmat.primitives import serialization
+
+    key = serialization.load_pem_private_key(identity.private_key_pem.encode(), password=None)
+    return key.private_bytes(
+        serialization.Encoding.Raw,
+        serialization.PrivateFormat.Raw,
+        serialization.NoEncryption()
+    )
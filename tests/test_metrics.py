@@ -0,0 +1,135 @@
+"""
+Tests for per-stage latency metrics
+"""
+
+import asyncio
+import urllib.request
+
+import pytest
+
+from crewai_amorce.keystore import LazyIdentity
+from crewai_amorce.metrics import (
+    TOOL_CALLS_TOTAL,
+    TOOL_STAGE_SECONDS,
+    Metrics,
+    MetricsSink,
+    NullMetrics,
+    get_default_metrics,
+    set_default_metrics,
+)
+from crewai_amorce.tools import AmorceToolWrapper
+
+
+class EchoTool:
+    name = "echo"
+
+    def run(self, text):
+        if text == "fail":
+            raise RuntimeError("tool failed")
+        return text
+
+
+@pytest.fixture
+def identity():
+    return LazyIdentity.from_seed(b"\x0b" * 32)
+
+
+def _series(metrics, name):
+    return {
+        tuple(sorted(s["labels"].items())): s
+        for s in metrics.snapshot().get(name, [])
+    }
+
+
+def test_tool_stages_and_outcomes(identity):
+    metrics = Metrics()
+    wrapper = AmorceToolWrapper(tool=EchoTool(), identity=identity, client=None, metrics=metrics)
+
+    wrapper.run("hello")
+    asyncio.run(wrapper.arun("hello"))
+    with pytest.raises(RuntimeError):
+        wrapper.run("fail")
+
+    stages = {dict(k)["stage"]: s for k, s in _series(metrics, TOOL_STAGE_SECONDS).items()}
+    assert set(stages) == {"serialize", "sign", "tool", "total"}
+    assert stages["total"]["count"] == 3
+    assert stages["tool"]["count"] == 2
+    for series in stages.values():
+        assert series["labels"]["tool"] == "echo"
+        assert series["labels"]["agent"] == identity.agent_id
+
+    outcomes = {dict(k)["outcome"]: s["value"] for k, s in _series(metrics, TOOL_CALLS_TOTAL).items()}
+    assert outcomes == {"ok": 2.0, "error": 1.0}
+
+
+def test_prometheus_text(identity):
+    metrics = Metrics(buckets=(0.5, 1.0))
+    metrics.observe(TOOL_STAGE_SECONDS, 0.25, {"tool": "echo", "stage": "tool"})
+    metrics.observe(TOOL_STAGE_SECONDS, 2.0, {"tool": "echo", "stage": "tool"})
+    metrics.increment(TOOL_CALLS_TOTAL, 1.0, {"tool": 'say "hi"', "outcome": "ok"})
+
+    text = metrics.render_prometheus()
+    assert "# TYPE amorce_tool_stage_seconds histogram" in text
+    assert 'amorce_tool_stage_seconds_bucket{stage="tool",tool="echo",le="0.5"} 1' in text
+    assert 'amorce_tool_stage_seconds_bucket{stage="tool",tool="echo",le="+Inf"} 2' in text
+    assert 'amorce_tool_stage_seconds_sum{stage="tool",tool="echo"} 2.25' in text
+    assert 'amorce_tool_stage_seconds_count{stage="tool",tool="echo"} 2' in text
+    assert 'amorce_tool_calls_total{outcome="ok",tool="say \\"hi\\""} 1' in text
+
+
+def test_custom_sink_receives_observations(identity):
+    class Recorder(MetricsSink):
+        def __init__(self):
+            self.observed = []
+            self.counted = []
+
+        def observe(self, name, value, labels):
+            self.observed.append((name, labels["stage"]))
+
+        def increment(self, name, amount, labels):
+            self.counted.append((name, labels["outcome"]))
+
+    recorder = Recorder()
+    metrics = Metrics(sinks=[recorder])
+    AmorceToolWrapper(tool=EchoTool(), identity=identity, client=None, metrics=metrics).run("hi")
+
+    assert (TOOL_STAGE_SECONDS, "total") in recorder.observed
+    assert recorder.counted == [(TOOL_CALLS_TOTAL, "ok")]
+
+
+def test_default_is_noop_until_enabled(identity):
+    assert isinstance(get_default_metrics(), NullMetrics)
+    wrapper = AmorceToolWrapper(tool=EchoTool(), identity=identity, client=None)
+    wrapper.run("hi")
+
+    metrics = set_default_metrics(Metrics())
+    try:
+        wrapper.run("hi")
+        assert _series(metrics, TOOL_CALLS_TOTAL)
+    finally:
+        set_default_metrics(None)
+    assert isinstance(get_default_metrics(), NullMetrics)
+
+
+def test_serve_exposes_metrics():
+    metrics = Metrics()
+    metrics.increment(TOOL_CALLS_TOTAL, 1.0, {"outcome": "ok"})
+    port = metrics.serve(port=0)
+    try:
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics", timeout=5) as response:
+            body = response.read().decode("utf-8")
+    finally:
+        metrics.close()
+    assert 'amorce_tool_calls_total{outcome="ok"} 1' in body
+
+
+def test_serve_twice_keeps_one_server():
+    metrics = Metrics()
+    port = metrics.serve(port=0)
+    try:
+        server = metrics._server
+        assert metrics.serve(port=0) == port
+        assert metrics._server is server
+    finally:
+        metrics.close()
+    assert metrics._server is None
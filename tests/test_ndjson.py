@@ -0,0 +1,131 @@
+"""
+Tests for streaming NDJSON logs
+"""
+
+import socket
+import threading
+
+import pytest
+
+from crewai_amorce.a2a import A2AEnvelope
+from crewai_amorce.keystore import LazyIdentity
+from crewai_amorce.ndjson import NDJSONReader, NDJSONWriter, map_chunks, read_records, write_records
+
+
+def records(n):
+    return ({"tool": "search", "i": i, "note": "é" * (i % 5)} for i in range(n))
+
+
+def count_and_sum(chunk):
+    items = [record["i"] for record in chunk]
+    return len(items), sum(items)
+
+
+@pytest.mark.parametrize("suffix", [".ndjson", ".ndjson.gz"])
+def test_roundtrip(tmp_path, suffix):
+    path = tmp_path / f"calls{suffix}"
+    assert write_records(path, records(1000)) == 1000
+    assert list(read_records(path)) == list(records(1000))
+
+
+def test_zstd_roundtrip(tmp_path):
+    pytest.importorskip("zstandard")
+    path = tmp_path / "calls.ndjson.zst"
+    write_records(path, records(500))
+    assert list(read_records(path)) == list(records(500))
+
+
+def test_resume_from_offset_ignores_partial_line(tmp_path):
+    path = tmp_path / "calls.ndjson"
+    write_records(path, records(10))
+    with open(path, "ab") as f:
+        f.write(b'{"tool": "half')
+
+    reader = NDJSONReader(path)
+    assert len([r for _, r in zip(range(4), reader)]) == 4
+    resumed = NDJSONReader(path, offset=reader.offset)
+    assert [r["i"] for r in resumed] == list(range(4, 10))
+    assert resumed.trailing == len(b'{"tool": "half')
+
+    # The partial line is picked up once it is completed
+    with open(path, "ab") as f:
+        f.write(b'"}\n')
+    assert list(NDJSONReader(path, offset=resumed.offset)) == [{"tool": "half"}]
+
+
+def test_complete_file_yields_unterminated_last_record(tmp_path):
+    path = tmp_path / "calls.ndjson"
+    write_records(path, records(3))
+    with open(path, "ab") as f:
+        f.write(b'{"i": 3}')
+
+    assert [r["i"] for r in NDJSONReader(path, complete=True)] == [0, 1, 2, 3]
+    assert sum(n for n, _ in map_chunks(path, count_and_sum, workers=1, chunk_size=16)) == 4
+
+
+def test_gzip_resume(tmp_path):
+    path = tmp_path / "calls.ndjson.gz"
+    write_records(path, records(100))
+    reader = NDJSONReader(path)
+    next(iter(reader))
+    assert next(iter(NDJSONReader(path, offset=reader.offset)))["i"] == 1
+
+
+def test_malformed_line(tmp_path):
+    path = tmp_path / "calls.ndjson"
+    path.write_bytes(b'{"i": 0}\nnot json\n{"i": 1}\n')
+
+    with pytest.raises(ValueError, match="offset 9"):
+        list(NDJSONReader(path))
+    reader = NDJSONReader(path, skip_invalid=True)
+    assert [r["i"] for r in reader] == [0, 1]
+    assert reader.skipped == 1
+
+
+def test_envelopes_forwarded_unchanged(tmp_path):
+    identity = LazyIdentity.from_seed(b"\x04" * 32)
+    envelopes = [A2AEnvelope.create(identity, {"price": i}) for i in range(20)]
+    src, dst = tmp_path / "a.ndjson", tmp_path / "b.ndjson"
+
+    write_records(src, envelopes)
+    write_records(dst, read_records(src, envelopes=True))
+
+    assert src.read_bytes() == dst.read_bytes()
+    assert list(read_records(dst, envelopes=True)) == envelopes
+
+
+def test_pretty_printed_envelope_written_as_one_line(tmp_path):
+    envelope = A2AEnvelope.create(LazyIdentity.from_seed(b"\x04" * 32), {"price": 1})
+    path = tmp_path / "pretty.ndjson"
+    write_records(path, [A2AEnvelope.from_bytes(envelope.to_json().encode("utf-8"))])
+
+    assert list(read_records(path, envelopes=True)) == [envelope]
+
+
+def test_socket_stream():
+    left, right = socket.socketpair()
+    thread = threading.Thread(target=lambda: (write_records(left, records(300)), left.close()))
+    thread.start()
+    try:
+        assert [r["i"] for r in read_records(right)] == list(range(300))
+    finally:
+        thread.join()
+        right.close()
+
+
+def test_map_chunks_covers_every_record_once(tmp_path):
+    path = tmp_path / "calls.ndjson"
+    with NDJSONWriter(path, buffer_size=4096) as writer:
+        writer.write_many(records(5000))
+
+    results = list(map_chunks(path, count_and_sum, workers=2, chunk_size=7777))
+    assert len(results) > 10
+    assert sum(n for n, _ in results) == 5000
+    assert sum(s for _, s in results) == sum(range(5000))
+
+
+def test_map_chunks_rejects_compressed(tmp_path):
+    path = tmp_path / "calls.ndjson.gz"
+    write_records(path, records(10))
+    with pytest.raises(ValueError, match="uncompressed"):
+        list(map_chunks(path, count_and_sum))
@@ -0,0 +1,41 @@
+"""
+Tests for the shared AmorceClient registry
+"""
+
+import pytest
+
+from crewai_amorce.registry import ClientRegistry
+from crewai_amorce.transport import HTTPTransport
+
+
+@pytest.fixture
+def identities():
+    amorce = pytest.importorskip("amorce")
+    return [amorce.IdentityManager.generate_ephemeral() for _ in range(2)]
+
+
+def test_clients_are_shared_per_identity(identities):
+    """Same identity and endpoints give the same client and one pool."""
+    registry = ClientRegistry(transport=HTTPTransport())
+    first, second = identities
+
+    client = registry.get_client(first)
+    assert registry.get_client(first) is client
+    assert registry.get_client(second) is not client
+    assert registry.get_client(first, orchestrator_url="https://other.example") is not client
+
+    shared = registry.transport._adapter.poolmanager
+    for session in (client.session, registry.get_client(second).session):
+        adapter = session.get_adapter("https://api.amorce.io")
+        assert adapter.poolmanager is shared
+        # The SDK's retry policy on 429/5xx (and POST) survives
+        assert adapter.max_retries.total == 3
+        assert 429 in adapter.max_retries.status_forcelist
+
+    stats = registry.stats()
+    assert stats['clients'] == 3
+    assert stats['reused'] == 2
+    assert stats['client_bytes'] > 0
+
+    registry.close()
+    assert len(registry) == 0
@@ -0,0 +1,100 @@
+"""
+Tests for replay protection
+"""
+
+import time
+
+import pytest
+
+from crewai_amorce.a2a import A2AEnvelope
+from crewai_amorce.keystore import LazyIdentity
+from crewai_amorce.replay import ReplayGuard
+from crewai_amorce.verification import EnvelopeVerifier, PublicKeyResolver
+
+
+def test_duplicates_rejected_within_window():
+    """Each message ID is accepted once; the exact set and Bloom both catch replays."""
+    guard = ReplayGuard(recent_size=2)
+    now = time.time()
+
+    for i in range(5):
+        guard.check(f"msg_{i}", now)
+    with pytest.raises(PermissionError, match="Replayed message$"):
+        guard.check("msg_4", now)
+    with pytest.raises(PermissionError, match="probable"):
+        guard.check("msg_0", now)
+
+    stats = guard.stats()
+    assert stats["accepted"] == 5
+    assert stats["duplicates"] == 1
+    assert stats["probable_duplicates"] == 1
+    assert stats["recent"] == 2
+
+
+def test_clock_skew_and_age():
+    """Future-dated and expired timestamps are rejected before lookup."""
+    guard = ReplayGuard(window=60, max_skew=5)
+    now = time.time()
+
+    assert guard.accept("a", now + 4)
+    assert not guard.accept("b", now + 30)
+    assert not guard.accept("c", now - 120)
+    assert not guard.accept("d")
+    assert guard.accept("e", "2099-01-01T00:00:00Z") is False
+
+    stats = guard.stats()
+    assert (stats["future"], stats["expired"], stats["missing_timestamp"]) == (2, 1, 1)
+
+
+def test_memory_ceiling_and_early_rotation():
+    """Filters stay within max_bytes and rotate early when full."""
+    guard = ReplayGuard(max_bytes=1024, false_positive_rate=0.01, recent_size=16)
+    total = guard.capacity * 3
+    now = time.time()
+    for i in range(total):
+        guard.accept(f"msg_{i}", now)
+
+    stats = guard.stats()
+    assert stats["bloom_bytes"] <= 1024
+    assert stats["early_rotations"] >= 2
+    # Fresh IDs rejected as probable replays stay near the 2 x 1% budget
+    assert stats["probable_duplicates"] < total * 0.05
+
+
+def test_verifier_drops_replayed_envelopes():
+    """EnvelopeVerifier applies the guard after checking signatures."""
+    identity = LazyIdentity.from_seed(b"\x05" * 32)
+    resolver = PublicKeyResolver()
+    resolver.pin(identity.agent_id, identity.public_key_pem)
+    verifier = EnvelopeVerifier(resolver, replay_guard=ReplayGuard())
+
+    envelope = A2AEnvelope.create(identity, {"offer": 1, "price": 480})
+    results = list(verifier.verify_stream([envelope, envelope.to_dict(), envelope]))
+    verifier.close()
+
+    assert [r.valid for r in results] == [True, False, False]
+    assert results[1].reason.startswith("replay check failed")
+
+    # The signed timestamp cannot be refreshed without the sender's key
+    tampered = A2AEnvelope.from_dict(envelope.to_dict())
+    tampered.timestamp = "2099-01-01T00:00:00Z"
+    assert verifier.verify(tampered).reason == "invalid signature"
+
+
+def test_batch_signed_offers_are_distinct():
+    """Offers sharing one Merkle root signature are told apart by leaf index."""
+    guard = ReplayGuard()
+    now = time.time()
+    base = {"agent_id": "agent_1", "signature": "root-sig", "merkle_root": "root", "timestamp": now}
+
+    guard.check_offer({**base, "price": 450, "merkle_index": 0})
+    guard.check_offer({**base, "price": 480, "merkle_index": 1})
+    with pytest.raises(PermissionError):
+        guard.check_offer({**base, "price": 480, "merkle_index": 1})
+
+
+def test_untimestamped_messages_rejected_by_default():
+    guard = ReplayGuard()
+    with pytest.raises(PermissionError, match="no timestamp"):
+        guard.check("msg")
+    assert ReplayGuard(require_timestamp=False).accept("msg")
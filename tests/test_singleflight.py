@@ -0,0 +1,71 @@
+"""
+Tests for request coalescing
+"""
+
+import asyncio
+import threading
+import time
+
+from crewai_amorce.singleflight import SingleFlight
+from crewai_amorce.transport import HTTPTransport
+from crewai_amorce.discovery import GetAgentTool
+
+
+def test_threads_share_one_call():
+    """Concurrent threads with the same key run the function once."""
+    flight = SingleFlight()
+    calls = []
+
+    def slow():
+        calls.append(1)
+        time.sleep(0.1)
+        return "result"
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(flight.do("k", slow)))
+        for _ in range(8)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert results == ["result"] * 8
+    assert len(calls) == 1
+    assert flight.stats()['deduplicated'] == 7
+    assert flight.stats()['inflight'] == 0
+
+
+def test_errors_propagate_to_followers():
+    """Followers receive the leader's exception."""
+    flight = SingleFlight()
+
+    async def failing():
+        await asyncio.sleep(0.05)
+        raise ValueError("boom")
+
+    async def scenario():
+        return await asyncio.gather(
+            *(flight.ado("k", failing) for _ in range(3)),
+            return_exceptions=True
+        )
+
+    results = asyncio.run(scenario())
+    assert all(isinstance(r, ValueError) for r in results)
+    assert flight.deduplicated == 2
+
+
+def test_discovery_coalesces_identical_lookups(trust_api):
+    """A burst of identical get_agent calls makes one HTTP request."""
+    trust_api.delay = 0.1
+    flight = SingleFlight()
+    tool = GetAgentTool(
+        trust_api.url, transport=HTTPTransport(timeout=5), singleflight=flight
+    )
+
+    records = tool.get_agents_many(["agent_1"] * 6, max_concurrency=6)
+
+    assert all(r['name'] == "Agent 1" for r in records)
+    assert trust_api.hits.count("/api/v1/agents/agent_1") == 1
+    assert flight.deduplicated == 5
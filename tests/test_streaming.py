@@ -0,0 +1,95 @@
+"""
+Tests for streaming tool results
+"""
+
+import asyncio
+
+import pytest
+
+from crewai_amorce.batch_signing import BatchSigner
+from crewai_amorce.keystore import LazyIdentity
+from crewai_amorce.streaming import verify_stream
+from crewai_amorce.tools import AmorceToolWrapper
+
+
+class ReportTool:
+    name = "report"
+
+    def __init__(self):
+        self.produced = 0
+
+    def stream(self, pages):
+        for i in range(pages):
+            self.produced += 1
+            yield f"page {i}\n"
+
+    async def astream(self, pages):
+        for i in range(pages):
+            await asyncio.sleep(0)
+            yield {"page": i}
+
+
+@pytest.fixture
+def identity():
+    return LazyIdentity.from_seed(b"\x0b" * 32)
+
+
+def test_chunks_pass_through_lazily_then_trailer_verifies(identity):
+    tool = ReportTool()
+    wrapper = AmorceToolWrapper(tool=tool, identity=identity, client=None)
+
+    stream = wrapper.stream(1000)
+    assert next(stream) == "page 0\n"
+    assert tool.produced == 1
+    with pytest.raises(RuntimeError):
+        stream.trailer
+
+    chunks = ["page 0\n"] + list(stream)
+    trailer = stream.trailer
+    assert len(chunks) == trailer["chunks"] == 1000
+    assert trailer["call"]["args"] == [1000]
+    assert verify_stream(chunks, trailer, identity.public_key_pem)
+    assert not verify_stream(chunks[:-1], trailer, identity.public_key_pem)
+    assert not verify_stream(chunks, {**trailer, "digest": "0" * 64}, identity.public_key_pem)
+
+
+def test_plain_result_is_one_chunk_and_batch_proofs_verify(identity):
+    wrapper = AmorceToolWrapper(
+        tool=lambda name: f"hello {name}", identity=identity, client=None,
+        batch_signer=BatchSigner(identity, max_batch=1)
+    )
+    stream = wrapper.stream("henri")
+    assert list(stream) == ["hello henri"]
+    assert "merkle_root" in stream.trailer
+    assert verify_stream(["hello henri"], stream.trailer, identity.public_key_pem)
+
+
+def test_astream_async_and_sync_sources(identity):
+    async def collect(wrapper, *args):
+        stream = await wrapper.astream(*args)
+        return [chunk async for chunk in stream], stream.trailer
+
+    wrapper = AmorceToolWrapper(tool=ReportTool(), identity=identity, client=None)
+    chunks, trailer = asyncio.run(collect(wrapper, 5))
+    assert chunks == [{"page": i} for i in range(5)]
+    assert verify_stream(chunks, trailer, identity.public_key_pem)
+
+    sync_only = AmorceToolWrapper(tool=lambda n: (str(i) for i in range(n)), identity=identity, client=None)
+    chunks, trailer = asyncio.run(collect(sync_only, 3))
+    assert chunks == ["0", "1", "2"]
+    assert verify_stream(chunks, trailer, identity.public_key_pem)
+
+
+def test_chunk_boundaries_and_types_are_signed(identity):
+    wrapper = AmorceToolWrapper(tool=lambda: iter(["ab", "c"]), identity=identity, client=None)
+    stream = wrapper.stream()
+    chunks = list(stream)
+    assert verify_stream(chunks, stream.trailer, identity.public_key_pem)
+    assert not verify_stream(["a", "bc"], stream.trailer, identity.public_key_pem)
+    assert not verify_stream(["abc"], stream.trailer, identity.public_key_pem)
+
+    wrapper = AmorceToolWrapper(tool=lambda: iter(["1"]), identity=identity, client=None)
+    stream = wrapper.stream()
+    list(stream)
+    assert not verify_stream([1], stream.trailer, identity.public_key_pem)
+    assert not verify_stream([b"1"], stream.trailer, identity.public_key_pem)
@@ -0,0 +1,212 @@
+"""
+Tests for AmorceToolWrapper memoization and batch execution
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from crewai_amorce.keystore import LazyIdentity
+from crewai_amorce.tools import AmorceToolWrapper, ToolCall
+
+
+class PriceTool:
+    name = "get_price"
+    cacheable = True
+    cache_ttl = 0.2
+
+    def __init__(self):
+        self.calls = 0
+
+    def run(self, sku, currency="USD"):
+        self.calls += 1
+        if sku == "broken":
+            raise RuntimeError("inventory down")
+        return {"sku": sku, "price": 480.0, "currency": currency}
+
+
+@pytest.fixture
+def identity():
+    return LazyIdentity.from_seed(b"\x09" * 32)
+
+
+def test_repeat_call_returns_original_signature(identity):
+    tool = PriceTool()
+    wrapper = AmorceToolWrapper(tool=tool, identity=identity, client=None)
+
+    first = wrapper.run("macbook", currency="EUR")
+    second = wrapper.run("macbook", currency="EUR")
+
+    assert tool.calls == 1
+    assert "cache_hit" not in first
+    assert second["cache_hit"] is True
+    assert second["signature"] == first["signature"]
+    assert second["result"] == first["result"]
+
+    wrapper.run("macbook", currency="USD")
+    assert tool.calls == 2
+
+
+def test_ttl_and_errors_are_not_cached(identity):
+    tool = PriceTool()
+    wrapper = AmorceToolWrapper(tool=tool, identity=identity, client=None)
+
+    wrapper.run("macbook")
+    time.sleep(0.25)
+    assert "cache_hit" not in wrapper.run("macbook")
+    assert tool.calls == 2
+
+    for _ in range(2):
+        with pytest.raises(RuntimeError):
+            wrapper.run("broken")
+    assert tool.calls == 4
+
+
+def test_memoization_is_opt_in(identity):
+    tool = PriceTool()
+    plain = AmorceToolWrapper(tool=tool, identity=identity, client=None, cacheable=False)
+    plain.run("macbook")
+    plain.run("macbook")
+    assert tool.calls == 2 and plain.cache is None
+
+    hitl = AmorceToolWrapper(tool=tool, identity=identity, client=None, requires_hitl=True)
+    assert hitl.cache is None
+
+
+def test_async_and_submit_share_the_cache(identity):
+    tool = PriceTool()
+    wrapper = AmorceToolWrapper(tool=tool, identity=identity, client=None)
+
+    first = asyncio.run(wrapper.arun("macbook"))
+    assert asyncio.run(wrapper.arun("macbook"))["cache_hit"] is True
+    assert wrapper.submit("macbook").result(timeout=5)["signature"] == first["signature"]
+    assert tool.calls == 1
+
+
+class SlowTool:
+    name = "research"
+
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def _enter(self):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+
+    def _exit(self):
+        with self.lock:
+            self.active -= 1
+
+    def run(self, topic, delay=0.2):
+        self._enter()
+        try:
+            time.sleep(delay)
+            if topic == "fail":
+                raise ValueError("no sources")
+            return f"notes on {topic}"
+        finally:
+            self._exit()
+
+    async def arun(self, topic, delay=0.2):
+        self._enter()
+        try:
+            await asyncio.sleep(delay)
+            if topic == "fail":
+                raise ValueError("no sources")
+            return f"notes on {topic}"
+        finally:
+            self._exit()
+
+
+def test_run_many_in_parallel_and_in_order(identity):
+    wrapper = AmorceToolWrapper(tool=SlowTool(), identity=identity, client=None)
+    topics = [f"t{i}" for i in range(8)]
+
+    start = time.monotonic()
+    results = wrapper.run_many(topics)
+
+    assert time.monotonic() - start < 0.8
+    assert [r["result"] for r in results] == [f"notes on {t}" for t in topics]
+    assert len({r["signature"] for r in results}) == 8
+
+
+def test_run_many_isolates_errors_and_timeouts(identity):
+    tool = SlowTool()
+    wrapper = AmorceToolWrapper(tool=tool, identity=identity, client=None, max_concurrency=2)
+
+    results = wrapper.run_many([
+        "a",
+        {"topic": "fail"},
+        ToolCall(args=("slow",), kwargs={"delay": 2}, timeout=0.1),
+        ("b", 0.05),
+    ])
+
+    assert results[0]["result"] == "notes on a"
+    assert isinstance(results[1], ValueError)
+    assert isinstance(results[2], TimeoutError)
+    assert results[3]["result"] == "notes on b"
+    assert tool.peak <= 2
+
+    with pytest.raises(ValueError):
+        wrapper.run_many(["fail"], return_exceptions=False)
+
+
+def test_run_many_respects_concurrency_cap(identity):
+    tool = SlowTool()
+    wrapper = AmorceToolWrapper(tool=tool, identity=identity, client=None, max_concurrency=3)
+    wrapper.run_many([("x", 0.05)] * 10)
+    assert tool.peak == 3
+
+
+def test_timed_out_call_keeps_its_slot(identity):
+    """A runaway call still counts against max_concurrency until it returns."""
+    tool = SlowTool()
+    wrapper = AmorceToolWrapper(tool=tool, identity=identity, client=None, max_concurrency=1)
+
+    start = time.monotonic()
+    results = wrapper.run_many([ToolCall(args=("slow", 0.4), timeout=0.05), ("next", 0.01)])
+
+    assert isinstance(results[0], TimeoutError)
+    assert results[1]["result"] == "notes on next"
+    assert tool.peak == 1
+    assert time.monotonic() - start >= 0.35
+
+
+def test_arun_many_timed_out_thread_keeps_its_slot(identity):
+    tool = SlowTool()
+    # A plain callable: no arun, so calls go through to_thread
+    wrapper = AmorceToolWrapper(tool=tool.run, identity=identity, client=None, max_concurrency=1)
+
+    async def main():
+        return await wrapper.arun_many([ToolCall(args=("slow", 0.4), timeout=0.05), ("next", 0.01)])
+
+    start = time.monotonic()
+    results = asyncio.run(main())
+    assert isinstance(results[0], TimeoutError)
+    assert results[1]["result"] == "notes on next"
+    assert tool.peak == 1
+    assert time.monotonic() - start >= 0.35
+
+
+def test_arun_many(identity):
+    tool = SlowTool()
+    wrapper = AmorceToolWrapper(tool=tool, identity=identity, client=None, max_concurrency=4)
+
+    async def main():
+        start = time.monotonic()
+        results = await wrapper.arun_many(
+            [f"t{i}" for i in range(8)] + [ToolCall(args=("slow", 5), timeout=0.1), "fail"]
+        )
+        return time.monotonic() - start, results
+
+    elapsed, results = asyncio.run(main())
+    assert elapsed < 0.8
+    assert tool.peak == 4
+    assert [r["result"] for r in results[:8]] == [f"notes on t{i}" for i in range(8)]
+    assert isinstance(results[8], TimeoutError)
+    assert isinstance(results[9], ValueError)
@@ -0,0 +1,77 @@
+"""
+Tests for batch envelope verification
+"""
+
+import pytest
+
+from crewai_amorce.a2a import A2AEnvelope
+from crewai_amorce.keystore import LazyIdentity
+from crewai_amorce.transport import HTTPTransport
+from crewai_amorce.verification import EnvelopeVerifier, PublicKeyResolver
+
+
+@pytest.fixture
+def senders():
+    return [LazyIdentity.from_seed(bytes([i]) * 32) for i in range(1, 4)]
+
+
+def test_stream_results_in_order(senders, trust_api):
+    """Valid, tampered and unknown-sender envelopes keep their positions."""
+    for identity in senders:
+        trust_api.agents[identity.agent_id] = {
+            "agent_id": identity.agent_id, "public_key": identity.public_key_pem
+        }
+
+    with HTTPTransport() as transport:
+        resolver = PublicKeyResolver(directory_url=trust_api.url, transport=transport)
+        verifier = EnvelopeVerifier(resolver, max_workers=2, batch_size=8)
+
+        envelopes = [
+            A2AEnvelope.create(senders[i % 3], {"offer": i, "price": i * 1.5})
+            for i in range(50)
+        ]
+        envelopes[7].message = {"offer": 7, "price": 0}
+        envelopes[20] = envelopes[20].to_dict()
+        envelopes[30].sender_id = "agent_0"
+
+        results = list(verifier.verify_stream(envelopes))
+        verifier.close()
+
+    assert [r.valid for r in results] == [i not in (7, 30) for i in range(50)]
+    assert results[7].reason == "invalid signature"
+    assert results[30].reason.startswith("unknown sender")
+    assert results[20].envelope.message == {"offer": 20, "price": 30.0}
+
+    # One directory lookup per sender, however many envelopes
+    assert len([h for h in trust_api.hits if h.startswith("/api/v1/agents/")]) == 4
+
+    stats = verifier.stats()
+    assert stats["verified"] == 48
+    assert stats["rejected"] == 2
+    assert stats["envelopes_per_second"] > 0
+
+
+def test_directory_key_must_match_agent_id(senders, trust_api):
+    """A directory key that does not hash to the agent ID is refused."""
+    impostor = senders[0]
+    trust_api.agents["agent_x"] = {"agent_id": "agent_x", "public_key": impostor.public_key_pem}
+
+    with HTTPTransport() as transport:
+        resolver = PublicKeyResolver(directory_url=trust_api.url, transport=transport)
+        with pytest.raises(PermissionError):
+            resolver.resolve("agent_x")
+
+
+def test_pinned_keys_and_malformed_input(senders):
+    """Pinned keys skip the directory; malformed dicts are rejected."""
+    resolver = PublicKeyResolver(directory_url="http://127.0.0.1:9")
+    resolver.pin(senders[0].agent_id, senders[0].public_key_pem)
+    verifier = EnvelopeVerifier(resolver)
+
+    envelope = A2AEnvelope.create(senders[0], "hello")
+    assert verifier.verify(envelope).valid
+    assert verifier.verify(A2AEnvelope.from_dict(envelope.to_dict())).valid
+
+    result = verifier.verify({"payload": {}})
+    assert not result.valid
+    assert result.reason.startswith("malformed")